@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from rest_framework import serializers
+
+
+class UtilizationInputDTO(serializers.Serializer):
+    """
+    DTO for the utilization analytics query parameters
+    """
+
+    GROUPINGS = ("location", "room", "hour_of_week")
+
+    # Longest range accepted, in days
+    MAX_DAYS = 366
+
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    group_by = serializers.ChoiceField(choices=GROUPINGS, default="location")
+    location_id = serializers.CharField(required=False)
+    room_id = serializers.CharField(required=False)
+    hour_from = serializers.IntegerField(min_value=0, max_value=23, default=0)
+    hour_to = serializers.IntegerField(min_value=1, max_value=24, default=24)
+
+    def validate(self, data):
+        """Cross-field validation"""
+        if data["start_date"] > data["end_date"]:
+            raise serializers.ValidationError("Start date must not be after end date")
+        if data["end_date"] - data["start_date"] >= timedelta(days=self.MAX_DAYS):
+            raise serializers.ValidationError(
+                f"The range cannot exceed {self.MAX_DAYS} days"
+            )
+        if data["hour_from"] >= data["hour_to"]:
+            raise serializers.ValidationError("hour_from must be before hour_to")
+        return data
@@ -1,12 +1,45 @@
 from rest_framework import serializers
 from ...domain.entities.booking import Booking
+from ...domain.entities.recurrence import RecurrenceRule
 from ...domain.entities.room import Room
 from ...domain.entities.manager import Manager
+from .datetimes import output_datetime
+
+
+class RecurrenceInputDTO(serializers.Serializer):
+    """
+    DTO for the optional recurrence of a booking
+    """
+
+    frequency = serializers.ChoiceField(choices=RecurrenceRule.FREQUENCIES)
+    interval = serializers.IntegerField(min_value=1, default=1)
+    weekdays = serializers.ListField(
+        child=serializers.IntegerField(min_value=0, max_value=6), required=False
+    )
+    until = serializers.DateTimeField(required=False)
+    count = serializers.IntegerField(
+        min_value=1, max_value=RecurrenceRule.MAX_OCCURRENCES, required=False
+    )
+
+    def validate(self, data):
+        """Validate the rule is well formed"""
+        try:
+            RecurrenceRule(**data).validate()
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+        return data
 
 
 class BookingInputDTO(serializers.Serializer):
     """
     DTO for Booking input data validation
+
+    When ``room_repository`` / ``manager_repository`` are passed in the
+    serializer context, the referenced entities are loaded through them and
+    exposed in ``resolved`` instead of only being checked for existence.
+    With ``check_references=False`` in the context the IDs are not looked up
+    at all, leaving it to the caller (e.g. bulk creation resolves them in
+    batch).
     """
 
     room = serializers.CharField()  # Room ID
@@ -18,9 +51,29 @@ class BookingInputDTO(serializers.Serializer):
     coffee_option = serializers.BooleanField(default=False)
     coffee_quantity = serializers.IntegerField(required=False, allow_null=True)
     coffee_description = serializers.CharField(required=False, allow_blank=True)
+    recurrence = RecurrenceInputDTO(required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Entities loaded while validating, keyed by field name, so the use
+        # case does not have to fetch them again
+        self.resolved = {}
 
     def validate_room(self, value):
         """Validate room exists"""
+        if not self.context.get("check_references", True):
+            return value
+
+        room_repository = self.context.get("room_repository")
+        if room_repository is not None:
+            room = room_repository.get_by_id(value)
+            if not room:
+                raise serializers.ValidationError(
+                    "Selected room does not exist or is deleted"
+                )
+            self.resolved["room"] = room
+            return value
+
         # Import Django model here to avoid circular imports
         from ...models.room import Room as RoomModel
 
@@ -32,6 +85,19 @@ class BookingInputDTO(serializers.Serializer):
 
     def validate_manager(self, value):
         """Validate manager exists"""
+        if not self.context.get("check_references", True):
+            return value
+
+        manager_repository = self.context.get("manager_repository")
+        if manager_repository is not None:
+            manager = manager_repository.get_by_id(value)
+            if not manager:
+                raise serializers.ValidationError(
+                    "Selected manager does not exist or is deleted"
+                )
+            self.resolved["manager"] = manager
+            return value
+
         # Import Django model here to avoid circular imports
         from ...models.manager import Manager as ManagerModel
 
@@ -62,6 +128,29 @@ class BookingInputDTO(serializers.Serializer):
         return data
 
 
+class BulkBookingInputDTO(serializers.Serializer):
+    """
+    DTO for bulk booking creation: the items are validated one by one with
+    BookingInputDTO by the caller, so per-item errors can be reported
+    """
+
+    MODES = ("all_or_nothing", "partial")
+
+    items = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+    mode = serializers.ChoiceField(choices=MODES, default="all_or_nothing")
+
+    def validate_items(self, value):
+        """Validate batch size"""
+        from django.conf import settings
+
+        max_items = getattr(settings, "BOOKING_BULK_MAX_ITEMS", 500)
+        if len(value) > max_items:
+            raise serializers.ValidationError(
+                f"A bulk request cannot contain more than {max_items} items"
+            )
+        return value
+
+
 class BookingOutputDTO:
     """
     DTO for Booking output data representation
@@ -79,21 +168,14 @@ class BookingOutputDTO:
             "manager_id": self.booking.manager_id,
             "name": self.booking.name,
             "description": self.booking.description,
-            "start_date": (
-                self.booking.start_date.isoformat() if self.booking.start_date else None
-            ),
-            "end_date": (
-                self.booking.end_date.isoformat() if self.booking.end_date else None
-            ),
+            "start_date": output_datetime(self.booking.start_date),
+            "end_date": output_datetime(self.booking.end_date),
             "coffee_option": self.booking.coffee_option,
             "coffee_quantity": self.booking.coffee_quantity,
             "coffee_description": self.booking.coffee_description,
-            "created_at": (
-                self.booking.created_at.isoformat() if self.booking.created_at else None
-            ),
-            "updated_at": (
-                self.booking.updated_at.isoformat() if self.booking.updated_at else None
-            ),
+            "series_id": self.booking.series_id,
+            "created_at": output_datetime(self.booking.created_at),
+            "updated_at": output_datetime(self.booking.updated_at),
         }
 
         # Add room object if available
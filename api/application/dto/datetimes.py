@@ -0,0 +1,26 @@
+"""
+Datetime values in output dictionaries
+
+With ``settings.API_NATIVE_DATETIMES`` the output DTOs and the repositories'
+read models place datetime objects in their dictionaries and leave the ISO
+8601 conversion to the renderer (see api/infrastructure/renderers.py),
+instead of calling ``isoformat()`` on every field in Python. The rendered
+JSON is the same either way.
+"""
+
+from datetime import datetime
+from typing import Optional, Union
+
+from django.conf import settings
+
+
+def native_datetimes() -> bool:
+    """Whether output dictionaries carry datetime objects"""
+    return getattr(settings, "API_NATIVE_DATETIMES", False)
+
+
+def output_datetime(value: Optional[datetime]) -> Union[datetime, str, None]:
+    """A datetime as placed in an output dictionary"""
+    if value is None or native_datetimes():
+        return value
+    return value.isoformat()
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from ...domain.entities.location import Location
+from .datetimes import output_datetime
 
 
 class LocationInputDTO(serializers.Serializer):
@@ -34,14 +35,6 @@ class LocationOutputDTO:
             "name": self.location.name,
             "address": self.location.address,
             "description": self.location.description,
-            "created_at": (
-                self.location.created_at.isoformat()
-                if self.location.created_at
-                else None
-            ),
-            "updated_at": (
-                self.location.updated_at.isoformat()
-                if self.location.updated_at
-                else None
-            ),
+            "created_at": output_datetime(self.location.created_at),
+            "updated_at": output_datetime(self.location.updated_at),
         }
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from ...domain.entities.manager import Manager
+from .datetimes import output_datetime
 
 
 class ManagerInputDTO(serializers.Serializer):
@@ -40,12 +41,8 @@ class ManagerOutputDTO:
             "name": self.manager.name,
             "email": self.manager.email,
             "phone": self.manager.phone,
-            "created_at": (
-                self.manager.created_at.isoformat() if self.manager.created_at else None
-            ),
-            "updated_at": (
-                self.manager.updated_at.isoformat() if self.manager.updated_at else None
-            ),
+            "created_at": output_datetime(self.manager.created_at),
+            "updated_at": output_datetime(self.manager.updated_at),
         }
 
     def to_representation(self, instance):
@@ -1,6 +1,10 @@
+import re
+from datetime import timedelta
+
 from rest_framework import serializers
 from ...domain.entities.room import Room
 from ...domain.entities.location import Location
+from .datetimes import output_datetime
 
 
 class RoomInputDTO(serializers.Serializer):
@@ -37,6 +41,133 @@ class RoomInputDTO(serializers.Serializer):
         return value
 
 
+DURATION_PATTERN = re.compile(r"^(\d+)(m|h)?$")
+
+
+def parse_duration(value: str) -> timedelta:
+    """Parse "30m", "1h" or a number of minutes into a timedelta"""
+    match = DURATION_PATTERN.match(value.strip())
+    if not match:
+        raise serializers.ValidationError(
+            "Use a number of minutes or hours, e.g. 30m or 1h"
+        )
+    amount = int(match.group(1))
+    if match.group(2) == "h":
+        return timedelta(hours=amount)
+    return timedelta(minutes=amount)
+
+
+class AvailabilityGridInputDTO(serializers.Serializer):
+    """
+    DTO for the availability grid query parameters
+    """
+
+    ENCODINGS = ("rle", "bitmap")
+
+    location_id = serializers.CharField(required=False)
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+    slot = serializers.CharField(default="30m")
+    encoding = serializers.ChoiceField(choices=ENCODINGS, default="rle")
+
+    def validate_slot(self, value):
+        """Parse the slot length (e.g. "15m", "1h" or minutes)"""
+        slot = parse_duration(value)
+        if not timedelta(minutes=5) <= slot <= timedelta(hours=24):
+            raise serializers.ValidationError(
+                "Slot must be between 5 minutes and 24 hours"
+            )
+        return slot
+
+    def validate(self, data):
+        """Cross-field validation"""
+        from django.conf import settings
+
+        if data["start"] >= data["end"]:
+            raise serializers.ValidationError("Start must be before end")
+
+        max_slots = getattr(settings, "AVAILABILITY_GRID_MAX_SLOTS", 2016)
+        if (data["end"] - data["start"]) / data["slot"] > max_slots:
+            raise serializers.ValidationError(
+                f"The grid cannot have more than {max_slots} slots per room"
+            )
+        return data
+
+
+class FindFreeSlotInputDTO(serializers.Serializer):
+    """
+    DTO for the free slot search query parameters
+    """
+
+    location_id = serializers.CharField(required=False)
+    capacity = serializers.IntegerField(min_value=1, required=False)
+    duration = serializers.CharField()
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=5)
+
+    # Longest search window, bounding the bookings loaded per search
+    MAX_WINDOW = timedelta(days=31)
+
+    def validate_duration(self, value):
+        """Parse the duration (e.g. "90m", "2h" or minutes)"""
+        return parse_duration(value)
+
+    def validate(self, data):
+        """Cross-field validation"""
+        if data["start"] >= data["end"]:
+            raise serializers.ValidationError("Start must be before end")
+        if data["end"] - data["start"] > self.MAX_WINDOW:
+            raise serializers.ValidationError(
+                f"The search window cannot exceed {self.MAX_WINDOW.days} days"
+            )
+        return data
+
+
+class AvailabilityGridOutputDTO:
+    """
+    DTO for the availability grid representation
+
+    ``rle`` keeps each room's busy runs as ``[first, last)`` slot indexes;
+    ``bitmap`` renders them as a string with one character per slot
+    ("1" busy, "0" free).
+    """
+
+    def __init__(self, grid: dict, encoding: str = "rle"):
+        self.grid = grid
+        self.encoding = encoding
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON response"""
+        slots = self.grid["slots"]
+        rooms = []
+        for room in self.grid["rooms"]:
+            room = dict(room)
+            if self.encoding == "bitmap":
+                room["busy"] = self._bitmap(room["busy"], slots)
+            rooms.append(room)
+
+        return {
+            "start": self.grid["start_date"].isoformat(),
+            "end": self.grid["end_date"].isoformat(),
+            "slot_minutes": self.grid["slot_minutes"],
+            "slots": slots,
+            "encoding": self.encoding,
+            "rooms": rooms,
+        }
+
+    @staticmethod
+    def _bitmap(runs, slots: int) -> str:
+        parts = []
+        position = 0
+        for first, last in runs:
+            parts.append("0" * (first - position))
+            parts.append("1" * (last - first))
+            position = last
+        parts.append("0" * (slots - position))
+        return "".join(parts)
+
+
 class RoomOutputDTO:
     """
     DTO for Room output data representation
@@ -54,10 +185,6 @@ class RoomOutputDTO:
             "capacity": self.room.capacity,
             "description": self.room.description,
             "location_id": self.room.location_id,
-            "created_at": (
-                self.room.created_at.isoformat() if self.room.created_at else None
-            ),
-            "updated_at": (
-                self.room.updated_at.isoformat() if self.room.updated_at else None
-            ),
+            "created_at": output_datetime(self.room.created_at),
+            "updated_at": output_datetime(self.room.updated_at),
         }
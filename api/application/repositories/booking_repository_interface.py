@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
 from datetime import datetime
 
 from ...domain.entities.booking import Booking
+from ...domain.entities.manager import Manager
+from ...domain.entities.room import Room
 
 
 class BookingRepositoryInterface(ABC):
@@ -22,8 +24,91 @@ class BookingRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def create(self, booking_data: Dict[str, Any]) -> Booking:
-        """Create a new booking"""
+    def get_all_rows(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all bookings as ready-to-render output dictionaries (read model),
+        with the same shape as the output DTO
+        """
+        pass
+
+    @abstractmethod
+    def get_list_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Change marker of a list: number of bookings matching the filters and
+        the latest ``updated_at`` among them and their rooms and managers
+        (embedded in the output), in one aggregate query
+        """
+        pass
+
+    @abstractmethod
+    def get_stamp(self, booking_id: str) -> Optional[datetime]:
+        """
+        Latest ``updated_at`` of a booking, its room and its manager, None if
+        the booking does not exist
+        """
+        pass
+
+    @abstractmethod
+    def page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Booking], Optional[str]]:
+        """
+        Get one page of bookings ordered by (start_date, id).
+        Returns the page and the opaque cursor of the next one (None at the end).
+        """
+        pass
+
+    @abstractmethod
+    def iter_rows(
+        self, filters: Optional[Dict[str, Any]] = None, chunk_size: int = 2000
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream bookings as output dictionaries, reading in chunks"""
+        pass
+
+    @abstractmethod
+    def create(
+        self,
+        booking_data: Dict[str, Any],
+        room: Optional[Room] = None,
+        manager: Optional[Manager] = None,
+    ) -> Booking:
+        """
+        Create a new booking. Already loaded room and manager entities may be
+        passed to be attached to the result instead of being fetched again.
+        """
+        pass
+
+    @abstractmethod
+    def create_if_available(
+        self,
+        booking_data: Dict[str, Any],
+        room: Optional[Room] = None,
+        manager: Optional[Manager] = None,
+    ) -> Booking:
+        """
+        Atomically create a booking if its room is free for the period.
+        Raises BookingConflictError when it overlaps active bookings.
+        """
+        pass
+
+    @abstractmethod
+    def bulk_create_if_available(
+        self,
+        bookings_data: List[Dict[str, Any]],
+        rooms: Optional[Dict[str, Room]] = None,
+        managers: Optional[Dict[str, Manager]] = None,
+    ) -> List[Booking]:
+        """
+        Atomically create several bookings, all or none. Raises
+        BookingConflictError if any of them overlaps an active booking.
+        """
         pass
 
     @abstractmethod
@@ -49,6 +134,16 @@ class BookingRepositoryInterface(ABC):
         """Find conflicting bookings for a time period"""
         pass
 
+    @abstractmethod
+    def get_room_intervals(
+        self, room_ids: Iterable[str], start_date: datetime, end_date: datetime
+    ) -> Dict[str, List[Tuple[datetime, datetime, str]]]:
+        """
+        Get the (start, end, booking_id) periods of active bookings
+        overlapping the range, per room and sorted by start
+        """
+        pass
+
     @abstractmethod
     def get_by_room(self, room_id: str) -> List[Booking]:
         """Get all bookings for a specific room"""
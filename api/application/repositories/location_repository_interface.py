@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from django import db
@@ -22,6 +22,44 @@ class LocationRepositoryInterface(ABC):
         """Get all locations with optional filters"""
         pass
 
+    @abstractmethod
+    def get_all_rows(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all locations as ready-to-render output dictionaries (read model),
+        with the same shape as the output DTO
+        """
+        pass
+
+    @abstractmethod
+    def get_list_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Change marker of a list: number of locations matching the filters and
+        the latest ``updated_at`` among them, in one aggregate query
+        """
+        pass
+
+    @abstractmethod
+    def get_stamp(self, location_id: str) -> Optional[datetime]:
+        """Latest ``updated_at`` behind one location, None if it does not exist"""
+        pass
+
+    @abstractmethod
+    def page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Location], Optional[str]]:
+        """
+        Get one page of locations ordered by (created_at, id).
+        Returns the page and the opaque cursor of the next one (None at the end).
+        """
+        pass
+
     @abstractmethod
     def create(self, location_data: Dict[str, Any]) -> Location:
         """Create a new location"""
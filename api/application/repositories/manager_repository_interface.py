@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from datetime import datetime
 
 from ...domain.entities.manager import Manager
@@ -15,11 +15,54 @@ class ManagerRepositoryInterface(ABC):
         """Get a manager by its ID"""
         pass
 
+    @abstractmethod
+    def get_by_ids(self, manager_ids: Iterable[str]) -> Dict[str, Manager]:
+        """Get active managers by ID in one lookup, keyed by ID"""
+        pass
+
     @abstractmethod
     def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Manager]:
         """Get all managers with optional filters"""
         pass
 
+    @abstractmethod
+    def get_all_rows(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all managers as ready-to-render output dictionaries (read model),
+        with the same shape as the output DTO
+        """
+        pass
+
+    @abstractmethod
+    def get_list_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Change marker of a list: number of managers matching the filters and
+        the latest ``updated_at`` among them, in one aggregate query
+        """
+        pass
+
+    @abstractmethod
+    def get_stamp(self, manager_id: str) -> Optional[datetime]:
+        """Latest ``updated_at`` behind one manager, None if it does not exist"""
+        pass
+
+    @abstractmethod
+    def page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Manager], Optional[str]]:
+        """
+        Get one page of managers ordered by (created_at, id).
+        Returns the page and the opaque cursor of the next one (None at the end).
+        """
+        pass
+
     @abstractmethod
     def create(self, manager_data: Dict[str, Any]) -> Manager:
         """Create a new manager"""
@@ -56,3 +99,10 @@ class ManagerRepositoryInterface(ABC):
     def get_manager_bookings_count(self, manager_id: str) -> Dict[str, int]:
         """Get booking statistics for a manager"""
         pass
+
+    @abstractmethod
+    def get_managers_bookings_stats(
+        self, manager_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get booking statistics for many managers at once, keyed by manager ID"""
+        pass
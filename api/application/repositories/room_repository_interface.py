@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from datetime import datetime
 
 from ...domain.entities.room import Room
@@ -15,11 +15,54 @@ class RoomRepositoryInterface(ABC):
         """Get a room by its ID"""
         pass
 
+    @abstractmethod
+    def get_by_ids(self, room_ids: Iterable[str]) -> Dict[str, Room]:
+        """Get active rooms by ID in one lookup, keyed by ID"""
+        pass
+
     @abstractmethod
     def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Room]:
         """Get all rooms with optional filters"""
         pass
 
+    @abstractmethod
+    def get_all_rows(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all rooms as ready-to-render output dictionaries (read model),
+        with the same shape as the output DTO
+        """
+        pass
+
+    @abstractmethod
+    def get_list_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Change marker of a list: number of rooms matching the filters and
+        the latest ``updated_at`` among them, in one aggregate query
+        """
+        pass
+
+    @abstractmethod
+    def get_stamp(self, room_id: str) -> Optional[datetime]:
+        """Latest ``updated_at`` behind one room, None if it does not exist"""
+        pass
+
+    @abstractmethod
+    def page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Room], Optional[str]]:
+        """
+        Get one page of rooms ordered by (created_at, id).
+        Returns the page and the opaque cursor of the next one (None at the end).
+        """
+        pass
+
     @abstractmethod
     def create(self, room_data: Dict[str, Any]) -> Room:
         """Create a new room"""
@@ -42,9 +85,13 @@ class RoomRepositoryInterface(ABC):
 
     @abstractmethod
     def get_available_rooms(
-        self, start_date: Any, end_date: Any, location_id: Optional[str] = None
+        self,
+        start_date: Any,
+        end_date: Any,
+        location_id: Optional[str] = None,
+        capacity_min: Optional[int] = None,
     ) -> List[Room]:
-        """Get available rooms for a time period"""
+        """Get available rooms (with at least capacity_min seats) for a time period"""
         pass
 
     @abstractmethod
@@ -63,3 +110,10 @@ class RoomRepositoryInterface(ABC):
     def get_room_bookings_count(self, room_id: str) -> Dict[str, int]:
         """Get booking statistics for a room"""
         pass
+
+    @abstractmethod
+    def get_rooms_bookings_stats(
+        self, room_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get booking statistics for many rooms at once, keyed by room ID"""
+        pass
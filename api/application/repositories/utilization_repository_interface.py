@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+
+class UtilizationRepositoryInterface(ABC):
+    """
+    Repository interface for the pre-aggregated booking utilization
+    (booked minutes and coffee servings per room and local hour)
+    """
+
+    @abstractmethod
+    def get_room_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        hour_from: int = 0,
+        hour_to: int = 24,
+        location_id: Optional[str] = None,
+        room_id: Optional[str] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Booked minutes and coffee servings per room between two dates (both
+        included), counting only hours in [hour_from, hour_to)
+        """
+        pass
+
+    @abstractmethod
+    def get_hour_of_week_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        hour_from: int = 0,
+        hour_to: int = 24,
+        location_id: Optional[str] = None,
+        room_id: Optional[str] = None,
+    ) -> Dict[Tuple[int, int], Dict[str, int]]:
+        """
+        Booked minutes and coffee servings per (ISO weekday, hour) between two
+        dates (both included)
+        """
+        pass
+
+    @abstractmethod
+    def rebuild(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> int:
+        """Recompute the aggregates from the bookings, returning rows written"""
+        pass
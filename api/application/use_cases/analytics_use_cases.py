@@ -0,0 +1,190 @@
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from ..repositories.location_repository_interface import LocationRepositoryInterface
+from ..repositories.room_repository_interface import RoomRepositoryInterface
+from ..repositories.utilization_repository_interface import (
+    UtilizationRepositoryInterface,
+)
+from ...domain.services.utilization_domain_service import UtilizationDomainService
+
+
+class GetUtilizationUseCase:
+    """
+    Use Case: Occupancy of the rooms over a date range, per location, per
+    room or per hour of the week, read from the daily rollup
+    """
+
+    LOCATION = "location"
+    ROOM = "room"
+    HOUR_OF_WEEK = "hour_of_week"
+    GROUPINGS = (LOCATION, ROOM, HOUR_OF_WEEK)
+
+    def __init__(
+        self,
+        room_repository: RoomRepositoryInterface,
+        location_repository: LocationRepositoryInterface,
+        utilization_repository: UtilizationRepositoryInterface,
+    ):
+        self.room_repository = room_repository
+        self.location_repository = location_repository
+        self.utilization_repository = utilization_repository
+
+    def execute(
+        self,
+        start_date: date,
+        end_date: date,
+        group_by: str = LOCATION,
+        location_id: Optional[str] = None,
+        room_id: Optional[str] = None,
+        hour_from: int = 0,
+        hour_to: int = 24,
+    ) -> Dict[str, Any]:
+        """
+        Execute the use case to compute utilization
+
+        Occupancy is the booked share of the time the rooms are open:
+        ``hour_from`` to ``hour_to`` every day of the range (both dates
+        included).
+        """
+        if group_by not in self.GROUPINGS:
+            raise ValueError(f"group_by must be one of: {', '.join(self.GROUPINGS)}")
+        if start_date > end_date:
+            raise ValueError("Start date must not be after end date")
+        if not 0 <= hour_from < hour_to <= 24:
+            raise ValueError("Hours must satisfy 0 <= hour_from < hour_to <= 24")
+
+        # 1. Get the rooms in scope
+        rooms = self._rooms(location_id, room_id)
+        room_ids = {room["id"] for room in rooms}
+
+        days = (end_date - start_date).days + 1
+        open_minutes = days * (hour_to - hour_from) * 60
+        scope = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "hour_from": hour_from,
+            "hour_to": hour_to,
+            "location_id": location_id,
+            "room_id": room_id,
+        }
+
+        # 2. Read the aggregates
+        if group_by == self.HOUR_OF_WEEK:
+            totals = self.utilization_repository.get_hour_of_week_totals(
+                start_date, end_date, hour_from, hour_to, location_id, room_id
+            )
+            weekdays = UtilizationDomainService.weekday_counts(start_date, end_date)
+            results = [
+                self._figures(
+                    {"weekday": weekday, "hour": hour},
+                    totals.get((weekday, hour), {}),
+                    len(rooms) * weekdays[weekday] * 60,
+                )
+                for weekday in range(1, 8)
+                for hour in range(hour_from, hour_to)
+            ]
+            booked = list(totals.values())
+        else:
+            totals = self.utilization_repository.get_room_totals(
+                start_date, end_date, hour_from, hour_to, location_id, room_id
+            )
+            totals = {key: value for key, value in totals.items() if key in room_ids}
+            booked = list(totals.values())
+            if group_by == self.ROOM:
+                results = self._by_room(rooms, totals, open_minutes)
+            else:
+                results = self._by_location(rooms, totals, open_minutes)
+
+        # 3. Fleet totals
+        summary = self._figures(
+            {"rooms": len(rooms)},
+            {
+                "booked_minutes": sum(row["booked_minutes"] for row in booked),
+                "coffee_servings": sum(row["coffee_servings"] for row in booked),
+            },
+            len(rooms) * open_minutes,
+        )
+        return {**scope, "group_by": group_by, "totals": summary, "results": results}
+
+    def _rooms(
+        self, location_id: Optional[str], room_id: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        if room_id:
+            room = self.room_repository.get_by_id(room_id)
+            if not room or (location_id and room.location_id != location_id):
+                raise ValueError("Room not found")
+            return [
+                {
+                    "id": room.id,
+                    "name": room.name,
+                    "capacity": room.capacity,
+                    "location_id": room.location_id,
+                }
+            ]
+        return self.room_repository.get_all_rows(
+            {"location_id": location_id} if location_id else None
+        )
+
+    def _by_room(self, rooms, totals, open_minutes) -> List[Dict[str, Any]]:
+        results = [
+            self._figures(
+                {
+                    "room_id": room["id"],
+                    "name": room["name"],
+                    "capacity": room["capacity"],
+                    "location_id": room["location_id"],
+                },
+                totals.get(room["id"], {}),
+                open_minutes,
+            )
+            for room in rooms
+        ]
+        return sorted(results, key=lambda row: (-row["occupancy_percent"], row["name"]))
+
+    def _by_location(self, rooms, totals, open_minutes) -> List[Dict[str, Any]]:
+        names = {
+            location["id"]: location["name"]
+            for location in self.location_repository.get_all_rows()
+        }
+        groups: Dict[str, Dict[str, int]] = {}
+        for room in rooms:
+            group = groups.setdefault(
+                room["location_id"],
+                {"rooms": 0, "booked_minutes": 0, "coffee_servings": 0},
+            )
+            room_totals = totals.get(room["id"], {})
+            group["rooms"] += 1
+            group["booked_minutes"] += room_totals.get("booked_minutes", 0)
+            group["coffee_servings"] += room_totals.get("coffee_servings", 0)
+
+        results = [
+            self._figures(
+                {
+                    "location_id": location_id,
+                    "name": names.get(location_id),
+                    "rooms": group["rooms"],
+                },
+                group,
+                group["rooms"] * open_minutes,
+            )
+            for location_id, group in groups.items()
+        ]
+        return sorted(
+            results, key=lambda row: (-row["occupancy_percent"], row["name"] or "")
+        )
+
+    @staticmethod
+    def _figures(
+        keys: Dict[str, Any], totals: Dict[str, int], available_minutes: int
+    ) -> Dict[str, Any]:
+        booked_minutes = totals.get("booked_minutes", 0)
+        return {
+            **keys,
+            "booked_minutes": booked_minutes,
+            "available_minutes": available_minutes,
+            "occupancy_percent": UtilizationDomainService.occupancy_percent(
+                booked_minutes, available_minutes
+            ),
+            "coffee_servings": totals.get("coffee_servings", 0),
+        }
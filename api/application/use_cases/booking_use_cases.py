@@ -1,4 +1,6 @@
-from typing import List, Optional, Dict, Any
+import uuid
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from django.utils import timezone
 
 from ..repositories.booking_repository_interface import BookingRepositoryInterface
@@ -6,6 +8,10 @@ from ..repositories.room_repository_interface import RoomRepositoryInterface
 from ..repositories.manager_repository_interface import ManagerRepositoryInterface
 from ...domain.services.booking_domain_service import BookingDomainService
 from ...domain.entities.booking import Booking
+from ...domain.entities.recurrence import RecurrenceRule
+from ...domain.entities.manager import Manager
+from ...domain.entities.room import Room
+from ..dto.booking_dto import BookingOutputDTO
 
 
 class CreateBookingUseCase:
@@ -25,9 +31,16 @@ class CreateBookingUseCase:
         self.manager_repository = manager_repository
         self.domain_service = BookingDomainService()
 
-    def execute(self, booking_data: Dict[str, Any]) -> Booking:
+    def execute(
+        self,
+        booking_data: Dict[str, Any],
+        room: Optional[Room] = None,
+        manager: Optional[Manager] = None,
+    ) -> Booking:
         """
         Execute the use case to create a booking
+        room and manager may be passed when the caller already loaded them
+        (e.g. during input validation) to avoid fetching them again
         """
         # 1. Validate input data structure
         room_id = booking_data.get("room")
@@ -40,11 +53,13 @@ class CreateBookingUseCase:
         coffee_quantity = booking_data.get("coffee_quantity")
 
         # 2. Validate entities exist
-        room = self.room_repository.get_by_id(room_id)
+        if room is None or room.id != room_id:
+            room = self.room_repository.get_by_id(room_id)
         if not room:
             raise ValueError("Room not found")
 
-        manager = self.manager_repository.get_by_id(manager_id)
+        if manager is None or manager.id != manager_id:
+            manager = self.manager_repository.get_by_id(manager_id)
         if not manager:
             raise ValueError("Manager not found")
 
@@ -54,22 +69,7 @@ class CreateBookingUseCase:
             coffee_option, coffee_quantity
         )
 
-        # 4. Check room availability using RoomDomainService
-        from ...domain.services.room_domain_service import RoomDomainService
-
-        if not RoomDomainService.check_room_availability(room, start_date, end_date):
-            conflicts = RoomDomainService.get_conflicting_bookings(
-                room, start_date, end_date
-            )
-            conflict_info = [
-                f"Conflict with booking from {c.start_date} to {c.end_date} by manager {c.manager_id}"
-                for c in conflicts
-            ]
-            raise ValueError(
-                f"Room is not available for the requested time. {'; '.join(conflict_info)}"
-            )
-
-        # 5. Prepare data for repository
+        # 4. Prepare data for repository
         repository_data = {
             "room_id": room_id,
             "manager_id": manager_id,
@@ -82,8 +82,215 @@ class CreateBookingUseCase:
             "coffee_description": booking_data.get("coffee_description"),
         }
 
-        # 6. Create booking
-        return self.booking_repository.create(repository_data)
+        # 5. Create booking; the repository serializes writes per room and
+        # raises BookingConflictError if the period overlaps another booking
+        return self.booking_repository.create_if_available(
+            repository_data, room=room, manager=manager
+        )
+
+    def execute_recurring(
+        self,
+        booking_data: Dict[str, Any],
+        recurrence: RecurrenceRule,
+        room: Optional[Room] = None,
+        manager: Optional[Manager] = None,
+    ) -> List[Booking]:
+        """
+        Execute the use case to create every occurrence of a recurring booking
+
+        The occurrences are checked against the room's bookings fetched with
+        a single range query and created together with a shared series_id;
+        if any of them conflicts, none is created.
+        """
+        # 1. Validate entities exist
+        room_id = booking_data.get("room")
+        manager_id = booking_data.get("manager")
+
+        if room is None or room.id != room_id:
+            room = self.room_repository.get_by_id(room_id)
+        if not room:
+            raise ValueError("Room not found")
+
+        if manager is None or manager.id != manager_id:
+            manager = self.manager_repository.get_by_id(manager_id)
+        if not manager:
+            raise ValueError("Manager not found")
+
+        # 2. Apply domain rules to the first occurrence, the others only
+        # differ by their date
+        start_date = booking_data.get("start_date")
+        end_date = booking_data.get("end_date")
+        BookingDomainService.validate_booking_time_rules(start_date, end_date)
+        BookingDomainService.validate_coffee_requirements(
+            booking_data.get("coffee_option", False),
+            booking_data.get("coffee_quantity"),
+        )
+
+        # 3. Expand the rule and check every occurrence in one pass
+        periods = recurrence.occurrences(start_date, end_date)
+        booked = self.booking_repository.get_room_intervals(
+            [room_id], periods[0][0], periods[-1][1]
+        )
+        conflicts = BookingDomainService.find_batch_conflicts(
+            [
+                (index, room_id, start, end)
+                for index, (start, end) in enumerate(periods)
+            ],
+            booked,
+        )
+        if conflicts:
+            raise ValueError(
+                "Room is not available for every occurrence. Conflicts on: "
+                + ", ".join(
+                    periods[index][0].isoformat() for index in sorted(conflicts)
+                )
+            )
+
+        # 4. Create all occurrences under one series id
+        series_id = str(uuid.uuid4())
+        return self.booking_repository.bulk_create_if_available(
+            [
+                {
+                    "room_id": room_id,
+                    "manager_id": manager_id,
+                    "name": booking_data.get("name"),
+                    "description": booking_data.get("description"),
+                    "start_date": start,
+                    "end_date": end,
+                    "coffee_option": booking_data.get("coffee_option", False),
+                    "coffee_quantity": booking_data.get("coffee_quantity"),
+                    "coffee_description": booking_data.get("coffee_description"),
+                    "series_id": series_id,
+                }
+                for start, end in periods
+            ],
+            rooms={room.id: room},
+            managers={manager.id: manager},
+        )
+
+
+class BulkCreateBookingsUseCase:
+    """
+    Use Case: Create many bookings in one request
+    Resolves references and checks conflicts for the whole batch at once
+    """
+
+    ALL_OR_NOTHING = "all_or_nothing"
+    PARTIAL = "partial"
+    MODES = (ALL_OR_NOTHING, PARTIAL)
+    SKIPPED_ERROR = "Not created: other items in the request failed"
+
+    def __init__(
+        self,
+        booking_repository: BookingRepositoryInterface,
+        room_repository: RoomRepositoryInterface,
+        manager_repository: ManagerRepositoryInterface,
+    ):
+        self.booking_repository = booking_repository
+        self.room_repository = room_repository
+        self.manager_repository = manager_repository
+
+    def execute(
+        self, items: List[Dict[str, Any]], mode: str = ALL_OR_NOTHING
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the use case to create bookings in bulk
+
+        Returns one result per item, in input order: ``{"index", "booking"}``
+        for created items and ``{"index", "error"}`` for the others. In
+        all-or-nothing mode nothing is created if any item fails, and the
+        valid items report why they were skipped.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Mode must be one of: {', '.join(self.MODES)}")
+
+        errors: Dict[int, str] = {}
+
+        # 1. Apply domain rules to every item
+        for index, item in enumerate(items):
+            try:
+                BookingDomainService.validate_booking_time_rules(
+                    item.get("start_date"), item.get("end_date")
+                )
+                BookingDomainService.validate_coffee_requirements(
+                    item.get("coffee_option", False), item.get("coffee_quantity")
+                )
+            except ValueError as e:
+                errors[index] = str(e)
+
+        # 2. Resolve rooms and managers with one query each
+        rooms = self.room_repository.get_by_ids(item.get("room") for item in items)
+        managers = self.manager_repository.get_by_ids(
+            item.get("manager") for item in items
+        )
+        for index, item in enumerate(items):
+            if index in errors:
+                continue
+            if item.get("room") not in rooms:
+                errors[index] = "Room not found"
+            elif item.get("manager") not in managers:
+                errors[index] = "Manager not found"
+
+        # 3. Check conflicts against the database and within the batch
+        candidates = [
+            (index, item["room"], item["start_date"], item["end_date"])
+            for index, item in enumerate(items)
+            if index not in errors
+        ]
+        if candidates:
+            booked = self.booking_repository.get_room_intervals(
+                {room_id for _, room_id, _, _ in candidates},
+                min(start for _, _, start, _ in candidates),
+                max(end for _, _, _, end in candidates),
+            )
+            conflicts = BookingDomainService.find_batch_conflicts(candidates, booked)
+            for index, (kind, other) in conflicts.items():
+                if kind == "booking":
+                    errors[index] = (
+                        f"Room is not available for the requested time. "
+                        f"Conflict with booking {other}"
+                    )
+                else:
+                    errors[index] = f"Overlaps item {other} of the same request"
+
+        # 4. Create the valid items in one transaction
+        valid = [index for index in range(len(items)) if index not in errors]
+        if errors and mode == self.ALL_OR_NOTHING:
+            for index in valid:
+                errors[index] = self.SKIPPED_ERROR
+            valid = []
+
+        created: Dict[int, Booking] = {}
+        if valid:
+            bookings = self.booking_repository.bulk_create_if_available(
+                [self._repository_data(items[index]) for index in valid],
+                rooms=rooms,
+                managers=managers,
+            )
+            created = dict(zip(valid, bookings))
+
+        return [
+            (
+                {"index": index, "booking": created[index]}
+                if index in created
+                else {"index": index, "error": errors[index]}
+            )
+            for index in range(len(items))
+        ]
+
+    @staticmethod
+    def _repository_data(item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "room_id": item["room"],
+            "manager_id": item["manager"],
+            "name": item.get("name"),
+            "description": item.get("description"),
+            "start_date": item["start_date"],
+            "end_date": item["end_date"],
+            "coffee_option": item.get("coffee_option", False),
+            "coffee_quantity": item.get("coffee_quantity"),
+            "coffee_description": item.get("coffee_description"),
+        }
 
 
 class UpdateBookingUseCase:
@@ -102,9 +309,15 @@ class UpdateBookingUseCase:
         self.manager_repository = manager_repository
         self.domain_service = BookingDomainService()
 
-    def execute(self, booking_id: str, update_data: Dict[str, Any]) -> Booking:
+    def execute(
+        self,
+        booking_id: str,
+        update_data: Dict[str, Any],
+        room: Optional[Room] = None,
+    ) -> Booking:
         """
         Execute the use case to update a booking
+        room may be passed when the caller already loaded the new room
         """
         # 1. Get existing booking
         existing_booking = self.booking_repository.get_by_id(booking_id)
@@ -133,14 +346,19 @@ class UpdateBookingUseCase:
 
         # 5. Check room availability (excluding current booking)
         room_id = update_data.get("room", existing_booking.room_id)
-        room = self.room_repository.get_by_id(room_id)
+        if room is None or room.id != room_id:
+            room = self.room_repository.get_by_id(room_id)
         if not room:
             raise ValueError("Room not found")
 
         from ...domain.services.room_domain_service import RoomDomainService
 
         if not RoomDomainService.check_room_availability(
-            room, start_date, end_date, booking_id
+            room,
+            start_date,
+            end_date,
+            booking_id,
+            booking_repository=self.booking_repository,
         ):
             raise ValueError("Room is not available for the requested time")
 
@@ -191,8 +409,13 @@ class ListBookingsUseCase:
     Use Case: List bookings with optional filters
     """
 
-    def __init__(self, booking_repository: BookingRepositoryInterface):
+    def __init__(
+        self,
+        booking_repository: BookingRepositoryInterface,
+        use_read_model: bool = False,
+    ):
         self.booking_repository = booking_repository
+        self.use_read_model = use_read_model
 
     def execute(self, filters: Optional[Dict[str, Any]] = None) -> List[Booking]:
         """
@@ -200,6 +423,31 @@ class ListBookingsUseCase:
         """
         return self.booking_repository.get_all(filters)
 
+    def execute_serialized(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List bookings as output dictionaries, read straight from the
+        repository's read model when use_read_model is enabled
+        """
+        if self.use_read_model:
+            return self.booking_repository.get_all_rows(filters)
+        return [
+            BookingOutputDTO(booking).to_dict()
+            for booking in self.booking_repository.get_all(filters)
+        ]
+
+    def execute_page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Booking], Optional[str]]:
+        """
+        List one page of bookings using keyset pagination
+        """
+        return self.booking_repository.page(cursor, limit, filters)
+
     def execute_by_room(self, room_id: str) -> List[Booking]:
         """
         Get bookings for a specific room
@@ -212,6 +460,33 @@ class ListBookingsUseCase:
         """
         return self.booking_repository.get_by_manager(manager_id)
 
+    def execute_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Cheap change marker of the list: (count, latest updated_at), read
+        without loading the bookings
+        """
+        return self.booking_repository.get_list_stamp(filters)
+
+
+class ExportBookingsUseCase:
+    """
+    Use Case: Export bookings as a stream of output dictionaries
+    Memory stays flat regardless of how many bookings match
+    """
+
+    def __init__(self, booking_repository: BookingRepositoryInterface):
+        self.booking_repository = booking_repository
+
+    def execute(
+        self, filters: Optional[Dict[str, Any]] = None, chunk_size: int = 2000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the use case to stream bookings
+        """
+        return self.booking_repository.iter_rows(filters, chunk_size)
+
 
 class GetBookingUseCase:
     """
@@ -226,3 +501,10 @@ class GetBookingUseCase:
         Execute the use case to get a booking
         """
         return self.booking_repository.get_by_id(booking_id)
+
+    def execute_stamp(self, booking_id: str) -> Optional[datetime]:
+        """
+        Latest updated_at behind a booking, without loading it (None if not
+        found)
+        """
+        return self.booking_repository.get_stamp(booking_id)
@@ -1,7 +1,9 @@
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 
 from ..repositories.location_repository_interface import LocationRepositoryInterface
 from ...domain.entities.location import Location
+from ..dto.location_dto import LocationOutputDTO
 
 
 class CreateLocationUseCase:
@@ -104,9 +106,10 @@ class DeleteLocationUseCase:
         if not existing_location:
             raise ValueError("Location not found")
 
-        # 2. Check if location has rooms
-        rooms = self.location_repository.get_rooms_by_location(location_id)
-        if rooms:
+        # 2. Check if location has rooms (EXISTS, without loading them)
+        if not existing_location.can_be_deleted(
+            self.location_repository.has_active_rooms(location_id)
+        ):
             raise ValueError("Cannot delete location with existing rooms")
 
         # 3. Delete location
@@ -118,8 +121,13 @@ class ListLocationsUseCase:
     Use Case: List locations with optional filters
     """
 
-    def __init__(self, location_repository: LocationRepositoryInterface):
+    def __init__(
+        self,
+        location_repository: LocationRepositoryInterface,
+        use_read_model: bool = False,
+    ):
         self.location_repository = location_repository
+        self.use_read_model = use_read_model
 
     def execute(self, filters: Optional[Dict[str, Any]] = None) -> List[Location]:
         """
@@ -127,6 +135,40 @@ class ListLocationsUseCase:
         """
         return self.location_repository.get_all(filters)
 
+    def execute_serialized(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List locations as output dictionaries, read straight from the
+        repository's read model when use_read_model is enabled
+        """
+        if self.use_read_model:
+            return self.location_repository.get_all_rows(filters)
+        return [
+            LocationOutputDTO(location).to_dict()
+            for location in self.location_repository.get_all(filters)
+        ]
+
+    def execute_page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Location], Optional[str]]:
+        """
+        List one page of locations using keyset pagination
+        """
+        return self.location_repository.page(cursor, limit, filters)
+
+    def execute_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Cheap change marker of the list: (count, latest updated_at), read
+        without loading the locations
+        """
+        return self.location_repository.get_list_stamp(filters)
+
 
 class GetLocationUseCase:
     """
@@ -142,6 +184,13 @@ class GetLocationUseCase:
         """
         return self.location_repository.get_by_id(location_id)
 
+    def execute_stamp(self, location_id: str) -> Optional[datetime]:
+        """
+        Latest updated_at behind a location, without loading it (None if not
+        found)
+        """
+        return self.location_repository.get_stamp(location_id)
+
 
 class SearchLocationsUseCase:
     """
@@ -1,8 +1,10 @@
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 
 from ..repositories.manager_repository_interface import ManagerRepositoryInterface
 from ...domain.services.manager_domain_service import ManagerDomainService
 from ...domain.entities.manager import Manager
+from ..dto.manager_dto import ManagerOutputDTO
 
 
 class CreateManagerUseCase:
@@ -26,7 +28,9 @@ class CreateManagerUseCase:
         ManagerDomainService.validate_name_format(name)
 
         # 3. Check email uniqueness
-        if not ManagerDomainService.validate_email_uniqueness(email):
+        if not ManagerDomainService.validate_email_uniqueness(
+            email, manager_repository=self.manager_repository
+        ):
             raise ValueError(f"Manager with email '{email}' already exists")
 
         # 4. Prepare data for repository
@@ -70,7 +74,7 @@ class UpdateManagerUseCase:
             # Check uniqueness only if email is being changed
             if new_email != existing_manager.email:
                 if not ManagerDomainService.validate_email_uniqueness(
-                    new_email, manager_id
+                    new_email, manager_id, manager_repository=self.manager_repository
                 ):
                     raise ValueError(f"Manager with email '{new_email}' already exists")
 
@@ -110,7 +114,9 @@ class DeleteManagerUseCase:
             raise ValueError("Manager not found")
 
         # 2. Check if manager has active bookings
-        if ManagerDomainService.has_active_bookings(existing_manager):
+        if ManagerDomainService.has_active_bookings(
+            existing_manager, manager_repository=self.manager_repository
+        ):
             raise ValueError("Cannot delete manager with active bookings")
 
         # 3. Delete manager
@@ -122,8 +128,13 @@ class ListManagersUseCase:
     Use Case: List managers with optional filters
     """
 
-    def __init__(self, manager_repository: ManagerRepositoryInterface):
+    def __init__(
+        self,
+        manager_repository: ManagerRepositoryInterface,
+        use_read_model: bool = False,
+    ):
         self.manager_repository = manager_repository
+        self.use_read_model = use_read_model
 
     def execute(self, filters: Optional[Dict[str, Any]] = None) -> List[Manager]:
         """
@@ -131,12 +142,46 @@ class ListManagersUseCase:
         """
         return self.manager_repository.get_all(filters)
 
+    def execute_serialized(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List managers as output dictionaries, read straight from the
+        repository's read model when use_read_model is enabled
+        """
+        if self.use_read_model:
+            return self.manager_repository.get_all_rows(filters)
+        return [
+            ManagerOutputDTO(manager).to_dict()
+            for manager in self.manager_repository.get_all(filters)
+        ]
+
+    def execute_page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Manager], Optional[str]]:
+        """
+        List one page of managers using keyset pagination
+        """
+        return self.manager_repository.page(cursor, limit, filters)
+
     def execute_by_department(self, department: str) -> List[Manager]:
         """
         Get managers by department
         """
         return self.manager_repository.get_by_department(department)
 
+    def execute_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Cheap change marker of the list: (count, latest updated_at), read
+        without loading the managers
+        """
+        return self.manager_repository.get_list_stamp(filters)
+
 
 class GetManagerUseCase:
     """
@@ -152,6 +197,13 @@ class GetManagerUseCase:
         """
         return self.manager_repository.get_by_id(manager_id)
 
+    def execute_stamp(self, manager_id: str) -> Optional[datetime]:
+        """
+        Latest updated_at behind a manager, without loading it (None if not
+        found)
+        """
+        return self.manager_repository.get_stamp(manager_id)
+
 
 class SearchManagersUseCase:
     """
@@ -192,7 +244,9 @@ class GetManagerStatsUseCase:
             raise ValueError("Manager not found")
 
         # 2. Get statistics from domain service
-        stats = ManagerDomainService.calculate_manager_stats(manager)
+        stats = ManagerDomainService.calculate_manager_stats(
+            manager, manager_repository=self.manager_repository
+        )
 
         return {
             "manager_id": manager_id,
@@ -1,9 +1,16 @@
-from typing import List, Optional, Dict, Any
+import heapq
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple
+
+from django.utils import timezone
 
 from ..repositories.room_repository_interface import RoomRepositoryInterface
 from ..repositories.location_repository_interface import LocationRepositoryInterface
+from ..repositories.booking_repository_interface import BookingRepositoryInterface
 from ...domain.services.room_domain_service import RoomDomainService
+from ...domain.services.booking_domain_service import BookingDomainService
 from ...domain.entities.room import Room
+from ..dto.room_dto import RoomOutputDTO
 
 
 class CreateRoomUseCase:
@@ -41,7 +48,9 @@ class CreateRoomUseCase:
         RoomDomainService.validate_room_name_format(name)
 
         # 4. Check name uniqueness within location
-        if not RoomDomainService.validate_room_name_uniqueness(name, location_id):
+        if not RoomDomainService.validate_room_name_uniqueness(
+            name, location_id, room_repository=self.room_repository
+        ):
             raise ValueError(
                 f"Room with name '{name}' already exists in this location"
             )  # 5. Prepare data for repository
@@ -98,7 +107,7 @@ class UpdateRoomUseCase:
 
             if new_name != existing_room.name:
                 if not RoomDomainService.validate_room_name_uniqueness(
-                    new_name, location_id, room_id
+                    new_name, location_id, room_id, room_repository=self.room_repository
                 ):
                     raise ValueError(
                         f"Room with name '{new_name}' already exists in this location"
@@ -145,7 +154,9 @@ class DeleteRoomUseCase:
             raise ValueError("Room not found")
 
         # 2. Check if room has active bookings
-        if RoomDomainService.has_active_bookings(existing_room):
+        if RoomDomainService.has_active_bookings(
+            existing_room, room_repository=self.room_repository
+        ):
             raise ValueError("Cannot delete room with active bookings")
 
         # 3. Delete room
@@ -157,8 +168,11 @@ class ListRoomsUseCase:
     Use Case: List rooms with optional filters
     """
 
-    def __init__(self, room_repository: RoomRepositoryInterface):
+    def __init__(
+        self, room_repository: RoomRepositoryInterface, use_read_model: bool = False
+    ):
         self.room_repository = room_repository
+        self.use_read_model = use_read_model
 
     def execute(self, filters: Optional[Dict[str, Any]] = None) -> List[Room]:
         """
@@ -166,6 +180,31 @@ class ListRoomsUseCase:
         """
         return self.room_repository.get_all(filters)
 
+    def execute_serialized(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List rooms as output dictionaries, read straight from the
+        repository's read model when use_read_model is enabled
+        """
+        if self.use_read_model:
+            return self.room_repository.get_all_rows(filters)
+        return [
+            RoomOutputDTO(room).to_dict()
+            for room in self.room_repository.get_all(filters)
+        ]
+
+    def execute_page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Room], Optional[str]]:
+        """
+        List one page of rooms using keyset pagination
+        """
+        return self.room_repository.page(cursor, limit, filters)
+
     def execute_by_location(self, location_id: str) -> List[Room]:
         """
         Get rooms for a specific location
@@ -173,15 +212,28 @@ class ListRoomsUseCase:
         return self.room_repository.get_by_location(location_id)
 
     def execute_available_rooms(
-        self, start_date, end_date, location_id: Optional[str] = None
+        self,
+        start_date,
+        end_date,
+        location_id: Optional[str] = None,
+        capacity_min: Optional[int] = None,
     ) -> List[Room]:
         """
         Get available rooms for a time period
         """
         return self.room_repository.get_available_rooms(
-            start_date, end_date, location_id
+            start_date, end_date, location_id, capacity_min
         )
 
+    def execute_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Cheap change marker of the list: (count, latest updated_at), read
+        without loading the rooms
+        """
+        return self.room_repository.get_list_stamp(filters)
+
 
 class GetRoomUseCase:
     """
@@ -197,14 +249,26 @@ class GetRoomUseCase:
         """
         return self.room_repository.get_by_id(room_id)
 
+    def execute_stamp(self, room_id: str) -> Optional[datetime]:
+        """
+        Latest updated_at behind a room, without loading it (None if not
+        found)
+        """
+        return self.room_repository.get_stamp(room_id)
+
 
 class CheckRoomAvailabilityUseCase:
     """
     Use Case: Check if a room is available for booking
     """
 
-    def __init__(self, room_repository: RoomRepositoryInterface):
+    def __init__(
+        self,
+        room_repository: RoomRepositoryInterface,
+        booking_repository: Optional[BookingRepositoryInterface] = None,
+    ):
         self.room_repository = room_repository
+        self.booking_repository = booking_repository
         self.domain_service = RoomDomainService()
 
     def execute(self, room_id: str, start_date, end_date) -> Dict[str, Any]:
@@ -217,9 +281,10 @@ class CheckRoomAvailabilityUseCase:
             raise ValueError("Room not found")
 
         # 2. Check availability
-        is_available = RoomDomainService.check_room_availability(
-            room, start_date, end_date
+        conflicts = RoomDomainService.get_conflicting_bookings(
+            room, start_date, end_date, booking_repository=self.booking_repository
         )
+        is_available = len(conflicts) == 0
 
         result = {
             "room_id": room_id,
@@ -229,10 +294,6 @@ class CheckRoomAvailabilityUseCase:
         }
 
         if not is_available:
-            # Get conflicting bookings for details
-            conflicts = RoomDomainService.get_conflicting_bookings(
-                room, start_date, end_date
-            )
             result["conflicts"] = [
                 {
                     "booking_id": conflict.id,
@@ -244,3 +305,153 @@ class CheckRoomAvailabilityUseCase:
             ]
 
         return result
+
+
+class GetAvailabilityGridUseCase:
+    """
+    Use Case: Free/busy grid of every room of a location over a time window
+    Replaces one availability check per room and slot with two queries
+    """
+
+    def __init__(
+        self,
+        room_repository: RoomRepositoryInterface,
+        booking_repository: BookingRepositoryInterface,
+    ):
+        self.room_repository = room_repository
+        self.booking_repository = booking_repository
+
+    def execute(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        slot: timedelta,
+        location_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute the use case to build the availability grid
+
+        Each room lists its busy slots as ``[first, last)`` runs of slot
+        indexes, slot ``i`` starting at ``start_date + i * slot``.
+        """
+        if start_date >= end_date:
+            raise ValueError("Start date must be before end date")
+
+        # 1. Get rooms
+        rooms = self.room_repository.get_all_rows(
+            {"location_id": location_id} if location_id else None
+        )
+
+        # 2. Get the bookings of all rooms overlapping the window at once
+        room_ids = [room["id"] for room in rooms]
+        booked = (
+            self.booking_repository.get_room_intervals(room_ids, start_date, end_date)
+            if room_ids
+            else {}
+        )
+
+        # 3. Sweep each room's bookings into busy slot runs
+        grid = RoomDomainService.build_availability_grid(
+            room_ids, booked, start_date, end_date, slot
+        )
+
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "slot_minutes": int(slot.total_seconds() // 60),
+            "slots": -((start_date - end_date) // slot),
+            "rooms": [
+                {
+                    "room_id": room["id"],
+                    "name": room["name"],
+                    "capacity": room["capacity"],
+                    "busy": grid[room["id"]],
+                }
+                for room in rooms
+            ],
+        }
+
+
+class FindFreeSlotUseCase:
+    """
+    Use Case: Find the earliest free periods among rooms with enough seats
+    Uses two queries (rooms, then their bookings) whatever the room count
+    """
+
+    def __init__(
+        self,
+        room_repository: RoomRepositoryInterface,
+        booking_repository: BookingRepositoryInterface,
+    ):
+        self.room_repository = room_repository
+        self.booking_repository = booking_repository
+
+    def execute(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        duration: timedelta,
+        capacity: Optional[int] = None,
+        location_id: Optional[str] = None,
+        limit: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the use case to find free periods
+
+        Returns up to ``limit`` candidates, one per room (its earliest free
+        start), ranked by start time and then by the smallest room that fits.
+        """
+        # 1. Apply domain rules
+        BookingDomainService.validate_booking_duration(duration)
+        now = timezone.now()
+        if start_date < now:
+            # Search from the next whole minute, bookings cannot be in the past
+            start_date = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        if end_date - start_date < duration:
+            raise ValueError("The search window is shorter than the duration")
+
+        # 2. Get rooms with enough seats
+        filters = {}
+        if location_id:
+            filters["location_id"] = location_id
+        if capacity:
+            filters["capacity_min"] = capacity
+        rooms = self.room_repository.get_all_rows(filters or None)
+        if not rooms:
+            return []
+
+        # 3. Get the bookings of all rooms overlapping the window at once
+        booked = self.booking_repository.get_room_intervals(
+            [room["id"] for room in rooms], start_date, end_date
+        )
+
+        # 4. Earliest gap per room, keeping the best ``limit`` candidates
+        candidates = []
+        for room in rooms:
+            start = RoomDomainService.find_earliest_gap(
+                booked.get(room["id"], []), start_date, end_date, duration
+            )
+            if start is not None:
+                candidates.append((start, room))
+
+        best = heapq.nsmallest(
+            limit,
+            candidates,
+            key=lambda candidate: (
+                candidate[0],
+                candidate[1]["capacity"] is None,
+                candidate[1]["capacity"] or 0,
+                candidate[1]["name"],
+            ),
+        )
+        return [
+            {
+                "room_id": room["id"],
+                "name": room["name"],
+                "capacity": room["capacity"],
+                "location_id": room["location_id"],
+                "start_date": start,
+                "end_date": start + duration,
+            }
+            for start, room in best
+        ]
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        from .infrastructure import metrics, sqlite_tuning
+        from .infrastructure.connection_stats import connection_stats
+
+        connection_stats.install()
+        sqlite_tuning.install()
+        metrics.install()
@@ -9,6 +9,25 @@ class Booking:
     Represents a room reservation with business rules
     """
 
+    __slots__ = (
+        "id",
+        "room_id",
+        "manager_id",
+        "room",
+        "manager",
+        "name",
+        "description",
+        "start_date",
+        "end_date",
+        "coffee_option",
+        "coffee_quantity",
+        "coffee_description",
+        "created_at",
+        "updated_at",
+        "deleted_at",
+        "series_id",
+    )
+
     def __init__(
         self,
         id: str = None,
@@ -26,6 +45,7 @@ class Booking:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
         deleted_at: Optional[datetime] = None,
+        series_id: Optional[str] = None,
     ):
         self.id = id or str(uuid.uuid4())
         self.room_id = room_id
@@ -42,12 +62,18 @@ class Booking:
         self.created_at = created_at
         self.updated_at = updated_at
         self.deleted_at = deleted_at
+        self.series_id = series_id
 
     def __str__(self):
         if self.name:
             return f"Booking {self.name} ({self.id[:8]}...)"
         return f"Booking {self.id} - {self.start_date} to {self.end_date}"
 
+    @property
+    def is_recurring(self) -> bool:
+        """Domain method to check if booking is an occurrence of a series"""
+        return self.series_id is not None
+
     @property
     def is_active(self) -> bool:
         """Domain method to check if booking is active"""
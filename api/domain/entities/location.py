@@ -9,6 +9,16 @@ class Location:
     Represents a physical location where rooms can be found
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "address",
+        "description",
+        "created_at",
+        "updated_at",
+        "deleted_at",
+    )
+
     def __init__(
         self,
         id: str = None,
@@ -9,6 +9,16 @@ class Manager:
     Represents a person responsible for booking rooms
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "email",
+        "phone",
+        "created_at",
+        "updated_at",
+        "deleted_at",
+    )
+
     def __init__(
         self,
         id: str = None,
@@ -0,0 +1,107 @@
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta
+
+
+class RecurrenceRule:
+    """
+    Domain Entity: RecurrenceRule
+    RRULE-style repetition of a booking: daily or weekly (optionally on given
+    weekdays), every ``interval`` days/weeks, until a date or for a count
+    """
+
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    FREQUENCIES = (DAILY, WEEKLY)
+
+    # Upper bound on the occurrences a single series may expand to
+    MAX_OCCURRENCES = 366
+
+    __slots__ = ("frequency", "interval", "weekdays", "until", "count")
+
+    def __init__(
+        self,
+        frequency: str = None,
+        interval: int = 1,
+        weekdays: Optional[List[int]] = None,
+        until: Optional[datetime] = None,
+        count: Optional[int] = None,
+    ):
+        self.frequency = frequency
+        self.interval = interval
+        self.weekdays = sorted(set(weekdays)) if weekdays else []
+        self.until = until
+        self.count = count
+
+    def __str__(self):
+        limit = f"until {self.until}" if self.until else f"{self.count} times"
+        return f"Every {self.interval} {self.frequency} ({limit})"
+
+    def validate(self) -> None:
+        """Domain rule: the rule must be well formed and bounded"""
+        if self.frequency not in self.FREQUENCIES:
+            raise ValueError(
+                f"Recurrence frequency must be one of: {', '.join(self.FREQUENCIES)}"
+            )
+        if not isinstance(self.interval, int) or self.interval < 1:
+            raise ValueError("Recurrence interval must be a positive integer")
+        if any(day not in range(7) for day in self.weekdays):
+            raise ValueError("Recurrence weekdays must be between 0 (Monday) and 6")
+        if self.weekdays and self.frequency != self.WEEKLY:
+            raise ValueError("Recurrence weekdays require a weekly frequency")
+        if (self.until is None) == (self.count is None):
+            raise ValueError("Recurrence needs exactly one of 'until' or 'count'")
+        if self.count is not None and not 1 <= self.count <= self.MAX_OCCURRENCES:
+            raise ValueError(
+                f"Recurrence count must be between 1 and {self.MAX_OCCURRENCES}"
+            )
+
+    def occurrences(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Domain method to expand the rule into (start, end) periods starting
+        at the given one (weekly rules with weekdays only keep the listed
+        days). Days are added in the wall-clock time of ``start_date``'s
+        timezone, so a series keeps its local hour. A rule that matches no
+        day up to ``until`` is rejected.
+        """
+        self.validate()
+        if self.until is not None and self.until < start_date:
+            raise ValueError("Recurrence 'until' must not be before the start date")
+
+        duration = end_date - start_date
+        offsets = self._day_offsets(start_date.weekday())
+
+        periods = []
+        for offset in offsets:
+            start = start_date + timedelta(days=offset)
+            if self.until is not None and start > self.until:
+                break
+            if len(periods) == (self.count or self.MAX_OCCURRENCES):
+                if self.count is None:
+                    raise ValueError(
+                        f"Recurrence cannot exceed {self.MAX_OCCURRENCES} occurrences"
+                    )
+                break
+            periods.append((start, start + duration))
+        if not periods:
+            # e.g. weekdays whose first match falls after 'until'
+            raise ValueError("Recurrence rule produces no occurrences")
+        return periods
+
+    def _day_offsets(self, first_weekday: int):
+        """Days after the first occurrence on which the series repeats"""
+        if self.frequency == self.DAILY:
+            offset = 0
+            while True:
+                yield offset
+                offset += self.interval
+
+        weekdays = self.weekdays or [first_weekday]
+        week = 0
+        while True:
+            for weekday in weekdays:
+                offset = week * 7 + weekday - first_weekday
+                if offset >= 0:
+                    yield offset
+            week += self.interval
@@ -9,6 +9,17 @@ class Room:
     Represents a bookable room within a location
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "capacity",
+        "location_id",
+        "description",
+        "created_at",
+        "updated_at",
+        "deleted_at",
+    )
+
     def __init__(
         self,
         id: str = None,
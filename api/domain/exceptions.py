@@ -0,0 +1,23 @@
+"""
+Domain Exceptions - Business rule violations raised across layers
+"""
+
+from typing import List
+
+
+class BookingConflictError(ValueError):
+    """
+    Raised when a booking overlaps active bookings of the same room.
+    Subclasses ValueError so callers that report business rule violations
+    as 400 responses keep handling it unchanged.
+    """
+
+    def __init__(self, conflicts: List = None):
+        self.conflicts = conflicts or []
+        conflict_info = [
+            f"Conflict with booking from {c.start_date} to {c.end_date} by manager {c.manager_id}"
+            for c in self.conflicts
+        ]
+        super().__init__(
+            f"Room is not available for the requested time. {'; '.join(conflict_info)}"
+        )
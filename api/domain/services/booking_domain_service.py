@@ -1,4 +1,6 @@
-from typing import Optional
+import bisect
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
 from django.utils import timezone
 
@@ -9,6 +11,9 @@ class BookingDomainService:
     that involve multiple entities or external concerns
     """
 
+    MIN_DURATION = timedelta(minutes=30)
+    MAX_DURATION = timedelta(hours=8)
+
     @staticmethod
     def validate_booking_time_rules(start_date: datetime, end_date: datetime) -> None:
         """
@@ -24,11 +29,17 @@ class BookingDomainService:
         if start_date < now - timedelta(minutes=5):
             raise ValueError("Cannot create booking in the past")
 
-        duration = end_date - start_date
-        if duration > timedelta(hours=8):
+        BookingDomainService.validate_booking_duration(end_date - start_date)
+
+    @staticmethod
+    def validate_booking_duration(duration: timedelta) -> None:
+        """
+        Domain rule: Validate booking duration limits
+        """
+        if duration > BookingDomainService.MAX_DURATION:
             raise ValueError("Booking duration cannot exceed 8 hours")
 
-        if duration < timedelta(minutes=30):
+        if duration < BookingDomainService.MIN_DURATION:
             raise ValueError("Booking duration must be at least 30 minutes")
 
     @staticmethod
@@ -54,6 +65,53 @@ class BookingDomainService:
                     "Coffee quantity should not be specified when coffee option is disabled"
                 )
 
+    @staticmethod
+    def find_batch_conflicts(
+        candidates: Iterable[Tuple[Any, str, datetime, datetime]],
+        booked_by_room: Dict[str, List[Tuple[datetime, datetime, str]]],
+    ) -> Dict[Any, Tuple[str, Any]]:
+        """
+        Domain rule: Find which candidate periods cannot be booked, checking
+        them against existing bookings and against each other
+
+        ``candidates`` are ``(key, room_id, start, end)`` tuples and
+        ``booked_by_room`` maps a room to its existing ``(start, end, id)``
+        periods. Each room is swept once in start order: a candidate
+        conflicts with an existing booking when the furthest-reaching
+        booking starting before its end ends after its start, and with
+        another candidate when it starts before the last accepted one ends
+        (so the candidate starting first wins, ties going to the lower key).
+
+        Returns ``{key: ("booking", booking_id) | ("item", other_key)}``.
+        """
+        candidates_by_room = defaultdict(list)
+        for key, room_id, start, end in candidates:
+            candidates_by_room[room_id].append((start, key, end))
+
+        conflicts = {}
+        for room_id, room_candidates in candidates_by_room.items():
+            booked = sorted(booked_by_room.get(room_id, ()))
+            starts = [start for start, _, _ in booked]
+            # Furthest end reached by the bookings sorted up to each position
+            reach = []
+            for _, end, booking_id in booked:
+                if not reach or end > reach[-1][0]:
+                    reach.append((end, booking_id))
+                else:
+                    reach.append(reach[-1])
+
+            last_end, last_key = None, None
+            for start, key, end in sorted(room_candidates, key=lambda c: c[:2]):
+                position = bisect.bisect_left(starts, end)
+                if position and reach[position - 1][0] > start:
+                    conflicts[key] = ("booking", reach[position - 1][1])
+                elif last_end is not None and last_end > start:
+                    conflicts[key] = ("item", last_key)
+                else:
+                    last_end, last_key = end, key
+
+        return conflicts
+
     @staticmethod
     def can_modify_booking(booking) -> bool:
         """
@@ -1,11 +1,13 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 import re
-from django.utils import timezone
 
 
 class ManagerDomainService:
     """
     Domain service for manager-related business logic
+
+    Methods that need data access accept the caller's repository (e.g. the one
+    of the request's unit of work) and only build their own as a fallback.
     """
 
     @staticmethod
@@ -55,7 +57,9 @@ class ManagerDomainService:
             )
 
     @staticmethod
-    def validate_email_uniqueness(email: str, exclude_id: Optional[str] = None) -> bool:
+    def validate_email_uniqueness(
+        email: str, exclude_id: Optional[str] = None, manager_repository=None
+    ) -> bool:
         """
         Validate email uniqueness by checking with repository
         This should be implemented with actual database check via repository
@@ -65,11 +69,11 @@ class ManagerDomainService:
             DjangoManagerRepository,
         )
 
-        repository = DjangoManagerRepository()
+        repository = manager_repository or DjangoManagerRepository()
         return repository.check_email_uniqueness(email, exclude_id)
 
     @staticmethod
-    def has_active_bookings(manager) -> bool:
+    def has_active_bookings(manager, manager_repository=None) -> bool:
         """
         Check if manager has active bookings
         """
@@ -78,49 +82,50 @@ class ManagerDomainService:
             DjangoManagerRepository,
         )
 
-        repository = DjangoManagerRepository()
+        repository = manager_repository or DjangoManagerRepository()
         active_count = repository.get_active_bookings_count(manager.id)
         return active_count > 0
 
     @staticmethod
-    def calculate_manager_stats(manager) -> Dict[str, Any]:
+    def calculate_manager_stats(manager, manager_repository=None) -> Dict[str, Any]:
         """
         Calculate manager statistics
         """
+        return ManagerDomainService.calculate_managers_stats(
+            [manager.id], manager_repository
+        )[str(manager.id)]
+
+    @staticmethod
+    def calculate_managers_stats(
+        manager_ids: Iterable[str], manager_repository=None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Calculate statistics of many managers, keyed by manager ID,
+        aggregated by the repository in one query
+        """
 
         from ...infrastructure.repositories.django_manager_repository import (
             DjangoManagerRepository,
         )
 
-        repository = DjangoManagerRepository()
-        bookings = repository.get_bookings_for_manager(manager.id)
-
-        now = timezone.now()
-        stats = {
-            "total_bookings": len(bookings),
-            "active_bookings": 0,
-            "completed_bookings": 0,
-            "cancelled_bookings": 0,
-            "future_bookings": 0,
-            "past_bookings": 0,
+        repository = manager_repository or DjangoManagerRepository()
+        return {
+            manager_id: {
+                "total_bookings": stats["total"],
+                "active_bookings": stats["active"],
+                "completed_bookings": stats["completed"],
+                # Cancelled bookings are soft deleted and not counted
+                "cancelled_bookings": 0,
+                "future_bookings": stats["upcoming"],
+                "past_bookings": stats["completed"],
+                "average_duration_hours": stats["average_duration_hours"],
+                "most_booked_room": stats["most_frequent_room_id"],
+            }
+            for manager_id, stats in repository.get_managers_bookings_stats(
+                manager_ids
+            ).items()
         }
 
-        for booking in bookings:
-            # Check if booking is active (currently happening)
-            if booking.start_date <= now <= booking.end_date:
-                stats["active_bookings"] += 1
-            elif booking.end_date < now:
-                stats["completed_bookings"] += 1
-            elif booking.start_date > now:
-                stats["future_bookings"] += 1
-
-            # Note: cancelled_bookings would require a status field in the booking
-            # For now, we're using soft delete, so cancelled bookings won't appear here
-
-        stats["past_bookings"] = stats["completed_bookings"]
-
-        return stats
-
     @staticmethod
     def validate_department_format(department: str) -> None:
         """
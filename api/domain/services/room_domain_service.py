@@ -1,10 +1,14 @@
-from typing import Dict, Any, Optional, List
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Iterable, Tuple
 from django.utils import timezone
 
 
 class RoomDomainService:
     """
     Domain service for room-related business logic
+
+    Methods that need data access accept the caller's repositories (e.g. those
+    of the request's unit of work) and only build their own as a fallback.
     """
 
     @staticmethod
@@ -26,7 +30,10 @@ class RoomDomainService:
 
     @staticmethod
     def validate_room_name_uniqueness(
-        name: str, location_id: str, exclude_room_id: Optional[str] = None
+        name: str,
+        location_id: str,
+        exclude_room_id: Optional[str] = None,
+        room_repository=None,
     ) -> bool:
         """
         Validate room name uniqueness within a location
@@ -36,11 +43,11 @@ class RoomDomainService:
             DjangoRoomRepository,
         )
 
-        repository = DjangoRoomRepository()
+        repository = room_repository or DjangoRoomRepository()
         return repository.check_name_uniqueness(name, location_id, exclude_room_id)
 
     @staticmethod
-    def has_active_bookings(room) -> bool:
+    def has_active_bookings(room, room_repository=None) -> bool:
         """
         Check if room has active bookings
         """
@@ -49,7 +56,7 @@ class RoomDomainService:
             DjangoRoomRepository,
         )
 
-        repository = DjangoRoomRepository()
+        repository = room_repository or DjangoRoomRepository()
         now = timezone.now()
 
         bookings = repository.get_bookings_for_room(room.id, start_date=now)
@@ -57,19 +64,33 @@ class RoomDomainService:
 
     @staticmethod
     def check_room_availability(
-        room, start_date, end_date, exclude_booking_id: Optional[str] = None
+        room,
+        start_date,
+        end_date,
+        exclude_booking_id: Optional[str] = None,
+        booking_repository=None,
     ) -> bool:
         """
-        Check if room is available for a given time period
+        Check if room is available for a given time period, against the
+        database (used before writes)
         """
-        conflicts = RoomDomainService.get_conflicting_bookings(
-            room, start_date, end_date, exclude_booking_id
+        from ...infrastructure.repositories.django_booking_repository import (
+            DjangoBookingRepository,
+        )
+
+        repository = booking_repository or DjangoBookingRepository()
+        conflicts = repository.find_conflicts(
+            room.id, start_date, end_date, exclude_booking_id
         )
         return len(conflicts) == 0
 
     @staticmethod
     def get_conflicting_bookings(
-        room, start_date, end_date, exclude_booking_id: Optional[str] = None
+        room,
+        start_date,
+        end_date,
+        exclude_booking_id: Optional[str] = None,
+        booking_repository=None,
     ) -> List:
         """
         Get bookings that conflict with the given time range
@@ -79,11 +100,65 @@ class RoomDomainService:
             DjangoBookingRepository,
         )
 
-        repository = DjangoBookingRepository()
+        repository = booking_repository or DjangoBookingRepository()
         return repository.get_conflicting_bookings(
             room.id, start_date, end_date, exclude_booking_id
         )
 
+    @staticmethod
+    def build_availability_grid(
+        room_ids: Iterable[str],
+        booked_by_room: Dict[str, List[Tuple[datetime, datetime, Any]]],
+        start_date: datetime,
+        end_date: datetime,
+        slot: timedelta,
+    ) -> Dict[str, List[List[int]]]:
+        """
+        Split the window into slots and return, per room, the busy slots as
+        sorted ``[first, last)`` runs of slot indexes. A slot is busy if any
+        booking overlaps part of it. ``booked_by_room`` maps each room to its
+        (start, end, id) bookings sorted by start, so every room is a single
+        sweep that extends or opens a run.
+        """
+        slots = -((start_date - end_date) // slot)
+
+        grid = {}
+        for room_id in room_ids:
+            runs = []
+            for booking_start, booking_end, _ in booked_by_room.get(room_id, ()):
+                first = max(0, (booking_start - start_date) // slot)
+                last = min(slots, -((start_date - booking_end) // slot))
+                if first >= last:
+                    continue
+                if runs and first <= runs[-1][1]:
+                    runs[-1][1] = max(runs[-1][1], last)
+                else:
+                    runs.append([first, last])
+            grid[room_id] = runs
+        return grid
+
+    @staticmethod
+    def find_earliest_gap(
+        booked: List[Tuple[datetime, datetime, Any]],
+        start_date: datetime,
+        end_date: datetime,
+        duration: timedelta,
+    ) -> Optional[datetime]:
+        """
+        Earliest start within [start_date, end_date] of a free period of
+        ``duration``, given the room's bookings sorted by start, or None.
+        Walks the bookings once, keeping the end of the busy time so far.
+        """
+        free_from = start_date
+        for booking_start, booking_end, _ in booked:
+            if booking_start - free_from >= duration:
+                break
+            free_from = max(free_from, booking_end)
+
+        if end_date - free_from >= duration:
+            return free_from
+        return None
+
     @staticmethod
     def validate_room_name_format(name: str) -> None:
         """
@@ -108,57 +183,36 @@ class RoomDomainService:
             raise ValueError("Room description cannot exceed 500 characters")
 
     @staticmethod
-    def get_room_utilization_stats(room) -> Dict[str, Any]:
+    def get_room_utilization_stats(room, room_repository=None) -> Dict[str, Any]:
         """
         Calculate room utilization statistics
         """
+        return RoomDomainService.get_rooms_utilization_stats(
+            [room.id], room_repository
+        )[str(room.id)]
+
+    @staticmethod
+    def get_rooms_utilization_stats(
+        room_ids: Iterable[str], room_repository=None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Calculate utilization statistics of many rooms, keyed by room ID,
+        aggregated by the repository in one query
+        """
 
         from ...infrastructure.repositories.django_room_repository import (
             DjangoRoomRepository,
         )
 
-        repository = DjangoRoomRepository()
-        now = timezone.now()
-
-        all_bookings = repository.get_bookings_for_room(room.id)
-
-        stats = {
-            "total_bookings": len(all_bookings),
-            "active_bookings": 0,
-            "future_bookings": 0,
-            "past_bookings": 0,
-            "average_duration_hours": 0,
-            "most_frequent_user": None,
+        repository = room_repository or DjangoRoomRepository()
+        return {
+            room_id: {
+                "total_bookings": stats["total"],
+                "active_bookings": stats["active"],
+                "future_bookings": stats["upcoming"],
+                "past_bookings": stats["completed"],
+                "average_duration_hours": stats["average_duration_hours"],
+                "most_frequent_user": stats["most_frequent_manager_id"],
+            }
+            for room_id, stats in repository.get_rooms_bookings_stats(room_ids).items()
         }
-
-        total_duration_hours = 0
-        user_booking_count = {}
-
-        for booking in all_bookings:
-            if booking.start_date <= now <= booking.end_date:
-                stats["active_bookings"] += 1
-            elif booking.end_date < now:
-                stats["past_bookings"] += 1
-            elif booking.start_date > now:
-                stats["future_bookings"] += 1
-
-            duration = booking.end_date - booking.start_date
-            total_duration_hours += duration.total_seconds() / 3600
-
-            if booking.manager_id:
-                manager_id = booking.manager_id
-                user_booking_count[manager_id] = (
-                    user_booking_count.get(manager_id, 0) + 1
-                )
-
-        if len(all_bookings) > 0:
-            stats["average_duration_hours"] = round(
-                total_duration_hours / len(all_bookings), 2
-            )
-
-        if user_booking_count:
-            stats["most_frequent_user"] = max(
-                user_booking_count, key=user_booking_count.get
-            )
-
-        return stats
@@ -0,0 +1,59 @@
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Dict, List, Tuple
+
+from django.utils import timezone
+
+
+class UtilizationDomainService:
+    """
+    Domain service for room utilization (occupancy) rules
+
+    Utilization is tracked per room and local hour: a booking counts the
+    minutes it covers in each (date, hour) of the server's TIME_ZONE, and its
+    coffee servings in the hour it starts.
+    """
+
+    @staticmethod
+    def hourly_buckets(
+        start_date: datetime, end_date: datetime
+    ) -> List[Tuple[date, int, int]]:
+        """
+        Domain method to split a booking period into ``(date, hour, minutes)``
+        buckets of local time
+        """
+        buckets = []
+        cursor = start_date
+        while cursor < end_date:
+            local = timezone.localtime(cursor)
+            hour_start = local.replace(minute=0, second=0, microsecond=0)
+            # Step in UTC so DST changes and half-hour offsets stay correct
+            next_hour = min(
+                hour_start.astimezone(dt_timezone.utc) + timedelta(hours=1), end_date
+            )
+            minutes = round((next_hour - cursor).total_seconds() / 60)
+            if minutes:
+                buckets.append((local.date(), local.hour, minutes))
+            cursor = next_hour
+        return buckets
+
+    @staticmethod
+    def weekday_counts(start_date: date, end_date: date) -> Dict[int, int]:
+        """
+        Number of times each ISO weekday (1 = Monday) occurs between the two
+        dates, both included
+        """
+        days = (end_date - start_date).days + 1
+        counts = Counter({weekday: days // 7 for weekday in range(1, 8)})
+        for offset in range(days % 7):
+            counts[(start_date + timedelta(days=offset)).isoweekday()] += 1
+        return dict(counts)
+
+    @staticmethod
+    def occupancy_percent(booked_minutes: int, available_minutes: int) -> float:
+        """
+        Domain rule: share of the available room time that is booked
+        """
+        if available_minutes <= 0:
+            return 0.0
+        return round(booked_minutes * 100 / available_minutes, 2)
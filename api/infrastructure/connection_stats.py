@@ -0,0 +1,96 @@
+"""
+Per-process database connection statistics
+
+Without a pool (Django < 5.1 or psycopg 2) each worker thread keeps one
+persistent connection (``CONN_MAX_AGE``). The useful signals are then how
+many connections are open and how often new ones are opened: with reuse
+working, ``opened_total`` stays flat while ``requests_total`` grows.
+
+With a psycopg pool the pool's own counters are reported as well, plus the
+share of its maximum size checked out (``saturation``) and the requests
+waiting for a connection.
+"""
+
+import threading
+import weakref
+from typing import Any, Dict
+
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+
+class ConnectionStats:
+    """Counts connections and requests of this process through Django signals"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wrappers = weakref.WeakSet()
+        self._opened: Dict[str, int] = {}
+        self.requests_total = 0
+        self.requests_in_flight = 0
+
+    def install(self) -> None:
+        """Connect the signal receivers (idempotent)"""
+        connection_created.connect(
+            self._connection_created, dispatch_uid="connection_stats.created"
+        )
+        request_started.connect(
+            self._request_started, dispatch_uid="connection_stats.started"
+        )
+        request_finished.connect(
+            self._request_finished, dispatch_uid="connection_stats.finished"
+        )
+
+    def _connection_created(self, sender, connection, **kwargs) -> None:
+        with self._lock:
+            self._wrappers.add(connection)
+            self._opened[connection.alias] = self._opened.get(connection.alias, 0) + 1
+
+    def _request_started(self, sender, **kwargs) -> None:
+        with self._lock:
+            self.requests_total += 1
+            self.requests_in_flight += 1
+
+    def _request_finished(self, sender, **kwargs) -> None:
+        with self._lock:
+            self.requests_in_flight = max(0, self.requests_in_flight - 1)
+
+    def snapshot(self, alias: str = "default") -> Dict[str, Any]:
+        """Connection and pool figures of one database alias"""
+        wrapper = connections[alias]
+        with self._lock:
+            open_connections = sum(
+                1
+                for other in self._wrappers
+                if other.alias == alias and other.connection is not None
+            )
+            stats = {
+                "alias": alias,
+                "vendor": wrapper.vendor,
+                "conn_max_age": wrapper.settings_dict.get("CONN_MAX_AGE"),
+                "health_checks": wrapper.settings_dict.get("CONN_HEALTH_CHECKS"),
+                "opened_total": self._opened.get(alias, 0),
+                "open": open_connections,
+                "requests_total": self.requests_total,
+                "requests_in_flight": self.requests_in_flight,
+                "pool": None,
+            }
+
+        # DatabaseWrapper.pool exists from Django 5.1 (None when not pooled)
+        pool = getattr(wrapper, "pool", None)
+        if pool is not None:
+            pool_stats = pool.get_stats()
+            in_use = pool_stats.get("pool_size", 0) - pool_stats.get(
+                "pool_available", 0
+            )
+            pool_max = pool_stats.get("pool_max") or 1
+            stats["pool"] = {
+                **pool_stats,
+                "in_use": in_use,
+                "saturation": round(in_use / pool_max, 3),
+            }
+        return stats
+
+
+connection_stats = ConnectionStats()
@@ -0,0 +1,25 @@
+"""
+Logging formatters referenced from ``settings.LOGGING``
+
+Kept free of Django and DRF imports: logging is configured before the app
+registry is ready.
+"""
+
+import json
+import logging
+
+
+class JSONLogFormatter(logging.Formatter):
+    """One JSON object per record, merged with the record's ``fields``"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
@@ -0,0 +1,288 @@
+"""
+Prometheus metrics
+
+``GET /metrics`` exposes, in the Prometheus text format:
+
+- ``api_requests_total`` / ``api_request_duration_seconds``: per ViewSet
+  action (``MetricsMixin``)
+- ``api_use_case_duration_seconds`` / ``api_use_case_errors_total``: per
+  use case class and ``execute*`` method
+- ``api_repository_duration_seconds`` / ``api_repository_errors_total``:
+  per repository implementation and public method
+- ``api_read_cache_lookups_total``: read cache hits and misses (hit ratio
+  in PromQL: ``sum(rate(...{result="hit"}[5m])) / sum(rate(...[5m]))``)
+- ``api_db_connections_*`` / ``api_db_pool_*``: database connections and,
+  where Django pools them, the psycopg pool
+
+Use cases and repositories are not edited: ``install()`` (run from
+``ApiConfig.ready``) finds the ``*UseCase`` classes and the implementations
+of the ``*RepositoryInterface`` ABCs and wraps their methods with a timing
+decorator whose labelled histogram child is resolved once, at install time.
+
+Under gunicorn, ``gunicorn.conf.py`` sets ``PROMETHEUS_MULTIPROC_DIR``:
+each worker writes its samples to its own memory-mapped files (no locks
+shared between processes) and ``/metrics`` merges the files of all
+workers, whichever one serves the scrape. Without it (runserver, tests) the
+metrics live in the process.
+
+``prometheus_client`` is optional: without it nothing is wrapped and
+``/metrics`` answers 503.
+"""
+
+import functools
+import importlib
+import inspect
+import os
+import pkgutil
+import time
+from typing import Iterable
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+
+from .connection_stats import connection_stats
+
+try:
+    import prometheus_client
+    from prometheus_client import Counter, Gauge, Histogram, multiprocess
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None
+
+# Use cases and repository calls are mostly sub-millisecond
+BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Connection gauges are refreshed at most this often per process
+GAUGE_REFRESH_SECONDS = 1.0
+
+if prometheus_client is not None:
+    REQUESTS = Counter(
+        "api_requests",
+        "API requests by ViewSet action",
+        ["viewset", "action", "method", "status"],
+    )
+    REQUEST_DURATION = Histogram(
+        "api_request_duration_seconds",
+        "API request latency by ViewSet action",
+        ["viewset", "action"],
+        buckets=BUCKETS,
+    )
+    USE_CASE_DURATION = Histogram(
+        "api_use_case_duration_seconds",
+        "Use case latency",
+        ["use_case", "method"],
+        buckets=BUCKETS,
+    )
+    USE_CASE_ERRORS = Counter(
+        "api_use_case_errors",
+        "Use case calls that raised",
+        ["use_case", "method", "exception"],
+    )
+    REPOSITORY_DURATION = Histogram(
+        "api_repository_duration_seconds",
+        "Repository method latency",
+        ["repository", "method"],
+        buckets=BUCKETS,
+    )
+    REPOSITORY_ERRORS = Counter(
+        "api_repository_errors",
+        "Repository calls that raised",
+        ["repository", "method", "exception"],
+    )
+    READ_CACHE_LOOKUPS = Counter(
+        "api_read_cache_lookups",
+        "Read cache lookups",
+        ["entity", "part", "result"],
+    )
+    DB_CONNECTIONS_OPENED = Counter(
+        "api_db_connections_opened", "Database connections opened", ["alias"]
+    )
+    DB_CONNECTIONS_OPEN = Gauge(
+        "api_db_connections_open",
+        "Open database connections",
+        ["alias"],
+        multiprocess_mode="livesum",
+    )
+    DB_POOL = Gauge(
+        "api_db_pool",
+        "psycopg pool figures (pool_size, pool_available, pool_max, "
+        "requests_waiting)",
+        ["alias", "stat"],
+        multiprocess_mode="livesum",
+    )
+
+POOL_STATS = ("pool_size", "pool_available", "pool_max", "requests_waiting")
+
+_last_refresh = 0.0
+
+
+def enabled() -> bool:
+    """prometheus_client is installed and settings.METRICS leaves it on"""
+    return prometheus_client is not None and getattr(settings, "METRICS", {}).get(
+        "ENABLED", True
+    )
+
+
+def _timed(func, histogram, errors, labels):
+    """Wrap ``func`` to observe its duration and count its exceptions"""
+    child = histogram.labels(*labels)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as error:
+            errors.labels(*labels, type(error).__name__).inc()
+            raise
+        finally:
+            child.observe(time.perf_counter() - started)
+
+    wrapper.__wrapped_by_metrics__ = True
+    return wrapper
+
+
+def instrument_class(cls, names: Iterable[str], histogram, errors) -> None:
+    """Replace the given methods of ``cls`` with timed wrappers (idempotent)"""
+    for name in names:
+        func = cls.__dict__.get(name)
+        if (
+            not inspect.isfunction(func)
+            or getattr(func, "__wrapped_by_metrics__", False)
+            # Only creating a generator would be timed, not consuming it
+            or inspect.isgeneratorfunction(func)
+        ):
+            continue
+        setattr(cls, name, _timed(func, histogram, errors, (cls.__name__, name)))
+
+
+def _package_classes(package_name: str, suffix: str):
+    package = importlib.import_module(package_name)
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package_name}.{module_info.name}")
+        for name, cls in vars(module).items():
+            if (
+                inspect.isclass(cls)
+                and name.endswith(suffix)
+                and cls.__module__ == module.__name__
+            ):
+                yield cls
+
+
+def _implementations(interface):
+    for subclass in interface.__subclasses__():
+        yield subclass
+        yield from _implementations(subclass)
+
+
+def _public_methods(cls):
+    return [
+        name
+        for name, member in vars(cls).items()
+        if inspect.isfunction(member) and not name.startswith("_")
+    ]
+
+
+def install() -> None:
+    """Instrument use cases and repositories and connect the DB receivers"""
+    if not enabled():
+        return
+
+    # Importing the unit of work loads every repository implementation
+    from . import unit_of_work  # noqa: F401
+
+    for use_case in _package_classes("api.application.use_cases", "UseCase"):
+        instrument_class(
+            use_case,
+            [name for name in _public_methods(use_case) if name.startswith("execute")],
+            USE_CASE_DURATION,
+            USE_CASE_ERRORS,
+        )
+
+    for interface in _package_classes(
+        "api.application.repositories", "RepositoryInterface"
+    ):
+        for repository in _implementations(interface):
+            instrument_class(
+                repository,
+                _public_methods(repository),
+                REPOSITORY_DURATION,
+                REPOSITORY_ERRORS,
+            )
+
+    connection_created.connect(
+        _connection_created, dispatch_uid="metrics.connection_created"
+    )
+    request_finished.connect(_refresh_gauges, dispatch_uid="metrics.request_finished")
+
+
+def observe_request(viewset: str, action: str, method: str, status, seconds) -> None:
+    if not enabled():
+        return
+    REQUESTS.labels(viewset, action, method, str(status)).inc()
+    REQUEST_DURATION.labels(viewset, action).observe(seconds)
+
+
+def cache_lookup(key: str, part: str, hit: bool) -> None:
+    """Count a read cache lookup; keys look like ``read:<entity>:...``"""
+    if not enabled():
+        return
+    READ_CACHE_LOOKUPS.labels(
+        key.split(":", 2)[1], part, "hit" if hit else "miss"
+    ).inc()
+
+
+def _connection_created(sender, connection, **kwargs) -> None:
+    DB_CONNECTIONS_OPENED.labels(connection.alias).inc()
+
+
+def _refresh_gauges(sender, force: bool = False, **kwargs) -> None:
+    global _last_refresh
+    now = time.monotonic()
+    if not force and now - _last_refresh < GAUGE_REFRESH_SECONDS:
+        return
+    _last_refresh = now
+
+    stats = connection_stats.snapshot("default")
+    DB_CONNECTIONS_OPEN.labels("default").set(stats["open"])
+    pool = stats["pool"]
+    if pool is not None:
+        for stat in POOL_STATS:
+            DB_POOL.labels("default", stat).set(pool.get(stat, 0))
+
+
+def metrics_view(request):
+    """Prometheus exposition of this process, or of all gunicorn workers"""
+    if not enabled():
+        return HttpResponse(
+            "prometheus_client is not installed or METRICS is disabled\n",
+            status=503,
+            content_type="text/plain",
+        )
+
+    _refresh_gauges(None, force=True)
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return HttpResponse(
+        prometheus_client.generate_latest(registry),
+        content_type=prometheus_client.CONTENT_TYPE_LATEST,
+    )
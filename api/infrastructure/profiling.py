@@ -0,0 +1,312 @@
+"""
+On-demand profiling of single requests
+
+A request is profiled when ``settings.PROFILING`` asks for it, checked in
+this order:
+
+- a valid signed ``X-Profile`` header (``manage.py profiling_token``),
+  which also picks the mode
+- its endpoint (``"RoomViewSet.available"``) is listed in ``ENDPOINTS``
+- it falls in the ``SAMPLE_RATE`` fraction of requests
+
+Two modes:
+
+- ``sample``: a background thread samples the request thread's stack every
+  ``INTERVAL_MS`` and writes the stacks in collapsed format (``a;b;c 12``
+  per line), ready for ``flamegraph.pl`` or speedscope
+- ``cprofile``: deterministic profile dumped as a ``.prof`` file (pstats,
+  snakeviz)
+
+Frames are labelled by layer: ``viewset:``, ``use_case:``, ``domain:``,
+``repository:`` and ``sql:`` for the database driver call, below which the
+stack is cut. Other frames (Django, DRF, the standard library) are left
+out of the collapsed stacks unless ``FULL_STACKS`` is set, so their time
+counts towards the nearest project frame. Each profile is logged to
+``api.profiling`` with the share of time per layer, and only the newest
+``MAX_FILES`` profiles are kept in ``OUTPUT_DIR``.
+
+Profiling is off by default, and stays off while ``SECRET_KEY`` is one of
+the placeholder keys shipped with the project: anyone could sign an
+``X-Profile`` header with them.
+"""
+
+import cProfile
+import itertools
+import logging
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core import signing
+
+logger = logging.getLogger("api.profiling")
+
+DEFAULT_SETTINGS = {
+    "ENABLED": False,
+    "ENDPOINTS": [],
+    "SAMPLE_RATE": 0.0,
+    "HEADER_MAX_AGE": 300,
+    "MODE": "sample",
+    "INTERVAL_MS": 5,
+    "OUTPUT_DIR": "profiles",
+    "MAX_FILES": 100,
+    "FULL_STACKS": False,
+}
+
+MODES = ("sample", "cprofile")
+HEADER_SALT = "api.profiling"
+EXTENSIONS = (".collapsed", ".prof")
+
+# Placeholder keys from core/settings.py and docker-compose.yml (Django's
+# own check flags the "django-insecure-" prefix too)
+INSECURE_KEY_PREFIX = "django-insecure-"
+PLACEHOLDER_KEYS = {"change-me-in-production"}
+
+# Path fragment -> layer, first match wins
+LAYERS = (
+    (os.path.join("api", "infrastructure", "viewsets", ""), "viewset"),
+    (os.path.join("api", "application", "use_cases", ""), "use_case"),
+    (os.path.join("api", "domain", ""), "domain"),
+    (os.path.join("api", "infrastructure", "repositories", ""), "repository"),
+    (os.path.join("django", "db", "backends", ""), "sql"),
+)
+
+_labels: Dict[Any, Optional[str]] = {}
+_sequence = itertools.count()
+_warned_insecure_key = False
+
+
+def _profiling_settings() -> Dict[str, Any]:
+    """Read PROFILING from settings, filling in defaults"""
+    return {**DEFAULT_SETTINGS, **getattr(settings, "PROFILING", {})}
+
+
+def insecure_secret_key() -> bool:
+    """Whether SECRET_KEY is a placeholder anyone can sign headers with"""
+    key = str(settings.SECRET_KEY)
+    return key.startswith(INSECURE_KEY_PREFIX) or key in PLACEHOLDER_KEYS
+
+
+def enabled() -> bool:
+    """PROFILING is enabled and SECRET_KEY is not a placeholder"""
+    global _warned_insecure_key
+
+    if not _profiling_settings()["ENABLED"]:
+        return False
+    if insecure_secret_key():
+        if not _warned_insecure_key:
+            logger.warning("profiling disabled: SECRET_KEY is a placeholder key")
+            _warned_insecure_key = True
+        return False
+    return True
+
+
+def layer_of(filename: str) -> Optional[str]:
+    """Layer of a source file, None outside the layered code"""
+    for fragment, layer in LAYERS:
+        if fragment in filename:
+            return layer
+    return None
+
+
+def sign_mode(mode: str = "sample") -> str:
+    """Value of an X-Profile header requesting a profile in ``mode``"""
+    if mode not in MODES:
+        raise ValueError(f"Unknown profiling mode: {mode}")
+    return signing.TimestampSigner(salt=HEADER_SALT).sign(mode)
+
+
+def requested_mode(request, endpoint: str) -> Optional[str]:
+    """Mode to profile this request in, or None to leave it alone"""
+    if not enabled():
+        return None
+    config = _profiling_settings()
+
+    header = request.headers.get("X-Profile")
+    if header:
+        try:
+            mode = signing.TimestampSigner(salt=HEADER_SALT).unsign(
+                header, max_age=config["HEADER_MAX_AGE"]
+            )
+        except signing.BadSignature:
+            mode = None
+        if mode in MODES:
+            return mode
+
+    if endpoint in config["ENDPOINTS"] or random.random() < config["SAMPLE_RATE"]:
+        return config["MODE"]
+    return None
+
+
+def _frame_label(frame, full: bool) -> Optional[str]:
+    code = frame.f_code
+    label = _labels.get(code)
+    if label is None and code not in _labels:
+        layer = layer_of(code.co_filename)
+        label = f"{layer}:{code.co_qualname}" if layer else None
+        _labels[code] = label
+    if label is None and full:
+        label = f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}"
+    return label
+
+
+def collapse(frame, full: bool = False) -> str:
+    """Collapsed stack (root first) of a frame, cut at the first sql frame"""
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+
+    labels = []
+    for frame in reversed(frames):
+        label = _frame_label(frame, full)
+        if label is None:
+            continue
+        labels.append(label)
+        if label.startswith("sql:"):
+            break
+    return ";".join(labels) or "other"
+
+
+class StackSampler:
+    """Samples one thread's stack from a background thread"""
+
+    def __init__(self, thread_id: int, interval: float, full: bool = False):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.full = full
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse(frame, self.full)] += 1
+
+    def layer_shares(self) -> Dict[str, float]:
+        """Share of samples per innermost layer"""
+        layers: Counter = Counter()
+        for stack, count in self.stacks.items():
+            layers[stack.rsplit(";", 1)[-1].split(":", 1)[0]] += count
+        total = sum(layers.values()) or 1
+        return {layer: round(count / total, 3) for layer, count in layers.items()}
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as output:
+            for stack, count in self.stacks.most_common():
+                output.write(f"{stack} {count}\n")
+
+
+def _cprofile_layer_shares(profiler: cProfile.Profile) -> Dict[str, float]:
+    """Share of own (tottime) time per layer, ``other`` outside the layers"""
+    layers: Counter = Counter()
+    for (filename, _, _), stat in pstats.Stats(profiler).stats.items():
+        layers[layer_of(filename) or "other"] += stat[2]
+    total = sum(layers.values()) or 1
+    return {layer: round(seconds / total, 3) for layer, seconds in layers.items()}
+
+
+def prune(output_dir: str, keep: int) -> None:
+    """Delete all but the ``keep`` newest profiles in ``output_dir``"""
+    paths = [
+        entry.path
+        for entry in os.scandir(output_dir)
+        if entry.is_file() and entry.name.endswith(EXTENSIONS)
+    ]
+    if len(paths) <= keep:
+        return
+    paths.sort(key=os.path.getmtime)
+    for path in paths[: len(paths) - keep]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Pruned concurrently by another worker
+            pass
+
+
+class ProfileResult:
+    """Where a finished profile was written"""
+
+    __slots__ = ("path",)
+
+    def __init__(self):
+        self.path: Optional[str] = None
+
+    @property
+    def name(self) -> Optional[str]:
+        """File name of the profile, without the server's directory"""
+        return os.path.basename(self.path) if self.path else None
+
+
+@contextmanager
+def profile(endpoint: str, mode: str):
+    """Profile the enclosed block of the current thread and write the result"""
+    config = _profiling_settings()
+    output_dir = str(config["OUTPUT_DIR"])
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.join(
+        output_dir,
+        f"{time.strftime('%Y%m%dT%H%M%S')}-{endpoint}-{os.getpid()}-{next(_sequence)}",
+    )
+    result = ProfileResult()
+
+    started = time.perf_counter()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield result
+        finally:
+            profiler.disable()
+            result.path = f"{stem}.prof"
+            profiler.dump_stats(result.path)
+            layers = _cprofile_layer_shares(profiler)
+    else:
+        sampler = StackSampler(
+            threading.get_ident(),
+            config["INTERVAL_MS"] / 1000,
+            full=config["FULL_STACKS"],
+        )
+        sampler.start()
+        try:
+            yield result
+        finally:
+            sampler.stop()
+            result.path = f"{stem}.collapsed"
+            sampler.write(result.path)
+            layers = sampler.layer_shares()
+
+    prune(output_dir, config["MAX_FILES"])
+    logger.info(
+        "profiled %s (%s) into %s",
+        endpoint,
+        mode,
+        result.path,
+        extra={
+            "fields": {
+                "endpoint": endpoint,
+                "mode": mode,
+                "path": result.path,
+                "duration_ms": round((time.perf_counter() - started) * 1e3, 2),
+                "layers": layers,
+            }
+        },
+    )
@@ -0,0 +1,155 @@
+"""
+Per-request SQL query accounting
+
+``QueryAccountingMiddleware`` wraps a sample of requests
+(``settings.QUERY_ACCOUNTING["SAMPLE_RATE"]``) in
+``connection.execute_wrapper`` and records, for each one, the number of
+queries, the time spent in the database and how often each statement
+repeats. The figures are returned as headers::
+
+    Server-Timing: db;dur=4.1;desc="6 queries", app;dur=11.8
+    X-DB-Queries: 6
+
+and logged to the ``api.queries`` logger. A statement repeated at least
+``N_PLUS_ONE_THRESHOLD`` times in one request (the same SQL with different
+parameters, typically a query per row of a list) is logged as a warning.
+
+Statements are counted by their SQL text, which Django keeps separate from
+the parameters, so the per-query cost is a counter increment. Fingerprints
+(``IN (...)`` lists of any length collapsed) are only computed when the
+request ends. Unsampled requests are not wrapped at all.
+
+Queries run by a streaming response after the view returns are not
+counted; the booking export issues its single query before returning.
+"""
+
+import hashlib
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+from typing import Any, Dict, List
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("api.queries")
+
+DEFAULT_SETTINGS = {
+    "ENABLED": True,
+    "SAMPLE_RATE": 1.0,
+    "N_PLUS_ONE_THRESHOLD": 5,
+    "HEADERS": True,
+}
+
+_IN_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+
+
+def _accounting_settings() -> Dict[str, Any]:
+    """Read QUERY_ACCOUNTING from settings, filling in defaults"""
+    return {**DEFAULT_SETTINGS, **getattr(settings, "QUERY_ACCOUNTING", {})}
+
+
+def fingerprint(sql: str) -> str:
+    """Statement shape: the SQL with ``IN (%s, %s, ...)`` lists collapsed"""
+    return _IN_LIST.sub("(%s...)", sql)
+
+
+class QueryRecorder:
+    """execute_wrapper callable counting statements and database time"""
+
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.statements[sql] += 1
+
+    def repeated(self, threshold: int) -> List[Dict[str, Any]]:
+        """Fingerprints executed at least ``threshold`` times, most first"""
+        shapes: Counter = Counter()
+        for sql, count in self.statements.items():
+            shapes[fingerprint(sql)] += count
+        return [
+            {
+                "fingerprint": hashlib.md5(
+                    shape.encode(), usedforsecurity=False
+                ).hexdigest()[:12],
+                "count": count,
+                "sql": shape[:300],
+            }
+            for shape, count in shapes.most_common()
+            if count >= threshold
+        ]
+
+
+class QueryAccountingMiddleware:
+    """Count the queries of sampled requests; see the module docstring"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        config = _accounting_settings()
+        if not config["ENABLED"] or random.random() >= config["SAMPLE_RATE"]:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(recorder))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        if config["HEADERS"]:
+            timing = (
+                f'db;dur={recorder.duration * 1e3:.1f};desc="{recorder.count} queries"'
+                f", app;dur={elapsed * 1e3:.1f}"
+            )
+            if response.has_header("Server-Timing"):
+                timing = f"{response['Server-Timing']}, {timing}"
+            response["Server-Timing"] = timing
+            response["X-DB-Queries"] = str(recorder.count)
+
+        self._log(request, response, recorder, elapsed, config)
+        return response
+
+    @staticmethod
+    def _log(request, response, recorder, elapsed, config) -> None:
+        repeated = recorder.repeated(config["N_PLUS_ONE_THRESHOLD"])
+        level = logging.WARNING if repeated else logging.INFO
+        if not logger.isEnabledFor(level):
+            return
+
+        stats = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": recorder.count,
+            "db_ms": round(recorder.duration * 1e3, 2),
+            "total_ms": round(elapsed * 1e3, 2),
+        }
+        if repeated:
+            stats["repeated"] = repeated
+        logger.log(
+            level,
+            "%s %s: %d queries in %.1f ms%s",
+            request.method,
+            request.path,
+            recorder.count,
+            recorder.duration * 1e3,
+            " (repeated statements, possible N+1)" if repeated else "",
+            extra={"fields": stats},
+        )
@@ -0,0 +1,84 @@
+"""
+JSON rendering of API responses
+
+``FastJSONRenderer`` serializes with orjson when it is installed and falls
+back to the standard library otherwise. Both paths write datetimes, dates
+and times as ``isoformat()`` strings, so the output DTOs can hand datetime
+objects straight to the renderer (``settings.API_NATIVE_DATETIMES``) and the
+JSON is the same as when they convert them in Python.
+"""
+
+import datetime
+import json
+from typing import Optional
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class _Encoder(encoders.JSONEncoder):
+    """DRF encoder writing datetimes exactly like ``isoformat()`` (and orjson)"""
+
+    def default(self, obj):
+        if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+            return obj.isoformat()
+        return super().default(obj)
+
+
+_fallback_encoder = _Encoder()
+
+
+def _stdlib_dumps(data, indent: Optional[int] = None) -> bytes:
+    """Serialize with the standard library, any indent width"""
+    return json.dumps(
+        data,
+        cls=_Encoder,
+        ensure_ascii=False,
+        indent=indent or None,
+        separators=(",", ": ") if indent else (",", ":"),
+    ).encode()
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(data, indent: Optional[int] = None) -> bytes:
+        """
+        Serialize to compact or indented UTF-8 JSON; orjson only indents by
+        2 spaces, so other widths go through the standard library
+        """
+        if indent and indent != 2:
+            return _stdlib_dumps(data, indent)
+        option = (_OPTIONS | orjson.OPT_INDENT_2) if indent else _OPTIONS
+        return orjson.dumps(data, default=_fallback_encoder.default, option=option)
+
+else:  # pragma: no cover - exercised only without orjson
+    dumps = _stdlib_dumps
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer (same media type, format and
+    ``indent`` handling) backed by ``dumps`` above
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        content = dumps(data, indent=indent)
+
+        # Keep the output a strict JavaScript subset, like JSONRenderer. The
+        # single-byte probe (U+2028/U+2029 start with 0xE2) is a memchr,
+        # far cheaper than searching for the full sequences
+        if b"\xe2" in content:
+            content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return content
@@ -0,0 +1,273 @@
+"""
+In-memory interval index of active bookings per room
+
+Keeps, for every room that has been queried, a sorted array of the active
+bookings that end after a configurable lookback point. Overlap checks are
+answered with two binary searches instead of a database round trip, and a
+room is loaded with a single query the first time it is needed (or once its
+entry expires).
+
+The index lives in the process memory, so each worker keeps its own copy.
+Entries expire after ``TTL_SECONDS`` so writes made by other processes are
+picked up, and the ORM query remains the fallback whenever the index cannot
+answer (disabled, unparseable dates or ranges older than the lookback).
+
+Because another worker's bookings may be missing for up to ``TTL_SECONDS``,
+the index only answers read-only availability queries
+(``get_conflicting_bookings``). Checks guarding writes (``find_conflicts``,
+create and update) always query the database.
+"""
+
+import bisect
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ...models import Booking as BookingModel
+
+DEFAULT_SETTINGS = {
+    "ENABLED": True,
+    "TTL_SECONDS": 60,
+    "LOOKBACK_HOURS": 24,
+}
+
+
+def _index_settings() -> Dict[str, Any]:
+    """Read BOOKING_INTERVAL_INDEX from settings, filling in defaults"""
+    return {**DEFAULT_SETTINGS, **getattr(settings, "BOOKING_INTERVAL_INDEX", {})}
+
+
+def coerce_datetime(value) -> Optional[datetime]:
+    """Convert a datetime or ISO string to an aware datetime, or None"""
+    if isinstance(value, str):
+        value = parse_datetime(value)
+    if not isinstance(value, datetime):
+        return None
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+class _RoomIntervals:
+    """
+    Sorted interval array for a single room
+
+    Entries are ``(start, end, booking_id)`` tuples ordered by start. Since
+    bookings of the same room may still overlap in legacy data, the longest
+    duration seen is kept so a query can bound how far back it has to look.
+    """
+
+    __slots__ = (
+        "entries",
+        "starts",
+        "by_id",
+        "max_duration",
+        "window_start",
+        "loaded_at",
+    )
+
+    def __init__(
+        self,
+        rows: Iterable[Tuple[datetime, datetime, str]],
+        window_start: datetime,
+        loaded_at: float,
+    ):
+        self.entries = sorted(rows)
+        self.starts = [entry[0] for entry in self.entries]
+        self.by_id = {entry[2]: entry for entry in self.entries}
+        self.max_duration = max(
+            (end - start for start, end, _ in self.entries), default=timedelta(0)
+        )
+        self.window_start = window_start
+        self.loaded_at = loaded_at
+
+    def add(self, start: datetime, end: datetime, booking_id: str) -> None:
+        self.remove(booking_id)
+        entry = (start, end, booking_id)
+        position = bisect.bisect_left(self.entries, entry)
+        self.entries.insert(position, entry)
+        self.starts.insert(position, start)
+        self.by_id[booking_id] = entry
+        self.max_duration = max(self.max_duration, end - start)
+
+    def remove(self, booking_id: str) -> None:
+        entry = self.by_id.pop(booking_id, None)
+        if entry is None:
+            return
+        position = bisect.bisect_left(self.entries, entry)
+        del self.entries[position]
+        del self.starts[position]
+
+    def overlapping(
+        self, start: datetime, end: datetime, exclude_booking_id: Optional[str] = None
+    ) -> List[str]:
+        """Return IDs of bookings with entry.start < end and entry.end > start"""
+        upper = bisect.bisect_left(self.starts, end)
+        lower = bisect.bisect_left(self.starts, start - self.max_duration)
+        return [
+            booking_id
+            for entry_start, entry_end, booking_id in self.entries[lower:upper]
+            if entry_end > start and booking_id != exclude_booking_id
+        ]
+
+
+class BookingIntervalIndex:
+    """
+    Per-room interval index of active bookings, shared by the repositories
+    of a process
+    """
+
+    def __init__(self):
+        self._rooms: Dict[str, _RoomIntervals] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(_index_settings()["ENABLED"])
+
+    def find_conflicts(
+        self,
+        room_id: str,
+        start_date,
+        end_date,
+        exclude_booking_id: Optional[str] = None,
+    ) -> Optional[List[str]]:
+        """
+        Return the IDs of active bookings overlapping the period, or None
+        when the index cannot answer and the caller must query the database
+        """
+        if not self.enabled or not room_id:
+            return None
+
+        start = coerce_datetime(start_date)
+        end = coerce_datetime(end_date)
+        if start is None or end is None:
+            return None
+
+        intervals = self._get_room(str(room_id))
+        if start < intervals.window_start:
+            return None
+
+        with self._lock:
+            return intervals.overlapping(start, end, exclude_booking_id)
+
+    def add(self, booking_id: str, room_id: str, start_date, end_date) -> None:
+        """Register an active booking"""
+        start = coerce_datetime(start_date)
+        end = coerce_datetime(end_date)
+        room_id = str(room_id)
+
+        with self._lock:
+            self._bump(room_id)
+            intervals = self._rooms.get(room_id)
+            if intervals is None:
+                return
+            if start is None or end is None:
+                self._rooms.pop(room_id, None)
+            elif end > intervals.window_start:
+                intervals.add(start, end, str(booking_id))
+
+    def discard(self, booking_id: str, room_id: Optional[str] = None) -> None:
+        """Forget a booking (cancelled, moved or deleted)"""
+        booking_id = str(booking_id)
+        with self._lock:
+            rooms = [str(room_id)] if room_id else list(self._rooms)
+            for key in rooms:
+                self._bump(key)
+                intervals = self._rooms.get(key)
+                if intervals is not None:
+                    intervals.remove(booking_id)
+
+    def add_on_commit(
+        self, booking_id: str, room_id: str, start_date, end_date
+    ) -> None:
+        """Register a booking once the surrounding transaction commits"""
+        transaction.on_commit(
+            lambda: self.add(booking_id, room_id, start_date, end_date)
+        )
+
+    def discard_on_commit(self, booking_id: str, room_id: Optional[str] = None) -> None:
+        """Forget a booking once the surrounding transaction commits"""
+        transaction.on_commit(lambda: self.discard(booking_id, room_id))
+
+    def invalidate(self, room_id: Optional[str] = None) -> None:
+        """Drop the cached intervals of one room, or of every room"""
+        with self._lock:
+            if room_id is None:
+                for key in self._rooms:
+                    self._bump(key)
+                self._rooms.clear()
+            else:
+                self._bump(str(room_id))
+                self._rooms.pop(str(room_id), None)
+
+    def rebuild(self, room_id: Optional[str] = None) -> None:
+        """Reload the index from BookingModel, for one room or every room"""
+        if room_id is not None:
+            self.invalidate(room_id)
+            self._get_room(str(room_id))
+            return
+
+        window_start = self._window_start()
+        rows_by_room: Dict[str, List[Tuple[datetime, datetime, str]]] = {}
+        with self._lock:
+            generations = dict(self._generations)
+
+        rows = BookingModel.objects.filter(
+            deleted_at__isnull=True, end_date__gt=window_start
+        ).values_list("room_id", "start_date", "end_date", "id")
+        for booking_room_id, start, end, booking_id in rows.iterator():
+            rows_by_room.setdefault(str(booking_room_id), []).append(
+                (start, end, str(booking_id))
+            )
+
+        loaded_at = time.monotonic()
+        with self._lock:
+            self._rooms.clear()
+            for key, room_rows in rows_by_room.items():
+                if self._generations.get(key, 0) == generations.get(key, 0):
+                    self._rooms[key] = _RoomIntervals(
+                        room_rows, window_start, loaded_at
+                    )
+
+    def _get_room(self, room_id: str) -> _RoomIntervals:
+        ttl = _index_settings()["TTL_SECONDS"]
+        with self._lock:
+            intervals = self._rooms.get(room_id)
+            if intervals is not None and time.monotonic() - intervals.loaded_at < ttl:
+                return intervals
+            generation = self._generations.get(room_id, 0)
+
+        window_start = self._window_start()
+        rows = BookingModel.objects.filter(
+            room_id=room_id, deleted_at__isnull=True, end_date__gt=window_start
+        ).values_list("start_date", "end_date", "id")
+        intervals = _RoomIntervals(
+            [(start, end, str(booking_id)) for start, end, booking_id in rows],
+            window_start,
+            time.monotonic(),
+        )
+
+        with self._lock:
+            # Only keep the snapshot if no write touched the room meanwhile
+            if self._generations.get(room_id, 0) == generation:
+                self._rooms[room_id] = intervals
+        return intervals
+
+    def _bump(self, room_id: str) -> None:
+        self._generations[room_id] = self._generations.get(room_id, 0) + 1
+
+    @staticmethod
+    def _window_start() -> datetime:
+        hours = _index_settings()["LOOKBACK_HOURS"]
+        return timezone.now() - timedelta(hours=hours)
+
+
+booking_interval_index = BookingIntervalIndex()
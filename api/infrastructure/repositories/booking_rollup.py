@@ -0,0 +1,164 @@
+"""
+Incremental maintenance of the ``booking_daily_rollup`` table
+
+Every booking write turns the booking's period into signed per-hour deltas
+(see UtilizationDomainService.hourly_buckets), which are applied with two
+queries whatever their number: an INSERT of the missing (room, date, hour)
+rows that ignores existing ones, then a single UPDATE adding each delta with
+a CASE expression. Callers run it inside the transaction of the booking
+write, so the rollup never drifts from committed bookings.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import models, transaction
+from django.utils import timezone
+
+from ...domain.services.utilization_domain_service import UtilizationDomainService
+from ...models import Booking as BookingModel
+from ...models import BookingDailyRollup as RollupModel
+
+# (room_id, date, hour) -> [booked minutes, coffee servings]
+Deltas = Dict[Tuple[str, object, int], List[int]]
+
+# Keys per UPDATE statement, keeping the CASE expression below SQLite's
+# expression depth limit
+UPDATE_CHUNK_SIZE = 200
+
+
+def snapshot(booking_model) -> Tuple:
+    """The fields of a booking that the rollup depends on"""
+    return (
+        booking_model.room_id,
+        booking_model.start_date,
+        booking_model.end_date,
+        booking_model.coffee_quantity if booking_model.coffee_option else None,
+    )
+
+
+def add_deltas(deltas: Deltas, booking_snapshot: Tuple, sign: int) -> None:
+    """Accumulate the contribution of a booking snapshot (sign +1 or -1)"""
+    room_id, start_date, end_date, coffee_servings = booking_snapshot
+    buckets = UtilizationDomainService.hourly_buckets(start_date, end_date)
+    for index, (day, hour, minutes) in enumerate(buckets):
+        delta = deltas[(str(room_id), day, hour)]
+        delta[0] += sign * minutes
+        if index == 0 and coffee_servings:
+            delta[1] += sign * coffee_servings
+
+
+def record(booking_models: Iterable, sign: int = 1) -> None:
+    """Add (sign=1) or remove (sign=-1) bookings from the rollup"""
+    deltas: Deltas = defaultdict(lambda: [0, 0])
+    for booking_model in booking_models:
+        add_deltas(deltas, snapshot(booking_model), sign)
+    apply(deltas)
+
+
+def record_change(previous: Tuple, booking_model) -> None:
+    """Move a booking from its previous snapshot to its current state"""
+    deltas: Deltas = defaultdict(lambda: [0, 0])
+    add_deltas(deltas, previous, -1)
+    add_deltas(deltas, snapshot(booking_model), 1)
+    apply(deltas)
+
+
+def apply(deltas: Deltas) -> None:
+    """Add the deltas to the rollup rows, creating missing rows"""
+    changes = {key: delta for key, delta in deltas.items() if any(delta)}
+    if not changes:
+        return
+
+    RollupModel.objects.bulk_create(
+        [
+            RollupModel(room_id=room_id, date=day, hour=hour)
+            for room_id, day, hour in changes
+        ],
+        ignore_conflicts=True,
+    )
+
+    keys = list(changes)
+    for offset in range(0, len(keys), UPDATE_CHUNK_SIZE):
+        conditions = []
+        matches = models.Q()
+        for room_id, day, hour in keys[offset : offset + UPDATE_CHUNK_SIZE]:
+            condition = models.Q(room_id=room_id, date=day, hour=hour)
+            conditions.append((condition, changes[(room_id, day, hour)]))
+            matches |= condition
+        RollupModel.objects.filter(matches).update(
+            booked_minutes=models.F("booked_minutes")
+            + models.Case(
+                *[
+                    models.When(condition, then=delta[0])
+                    for condition, delta in conditions
+                ],
+                default=0,
+                output_field=models.IntegerField(),
+            ),
+            coffee_servings=models.F("coffee_servings")
+            + models.Case(
+                *[
+                    models.When(condition, then=delta[1])
+                    for condition, delta in conditions
+                ],
+                default=0,
+                output_field=models.IntegerField(),
+            ),
+        )
+
+
+def rebuild(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    batch_size: int = 2000,
+) -> int:
+    """
+    Recompute the rollup rows between two local dates (both included; all
+    rows when omitted) from the active bookings. Returns the rows written.
+    """
+    rollups = RollupModel.objects.all()
+    bookings = BookingModel.objects.filter(deleted_at__isnull=True)
+    if start_date:
+        rollups = rollups.filter(date__gte=start_date)
+        bookings = bookings.filter(
+            end_date__gt=timezone.make_aware(datetime.combine(start_date, time.min))
+        )
+    if end_date:
+        rollups = rollups.filter(date__lte=end_date)
+        bookings = bookings.filter(
+            start_date__lt=timezone.make_aware(
+                datetime.combine(end_date + timedelta(days=1), time.min)
+            )
+        )
+
+    rows = bookings.values_list(
+        "room_id", "start_date", "end_date", "coffee_option", "coffee_quantity"
+    )
+    with transaction.atomic():
+        deltas: Deltas = defaultdict(lambda: [0, 0])
+        for room_id, start, end, coffee_option, coffee_quantity in rows.iterator():
+            add_deltas(
+                deltas,
+                (room_id, start, end, coffee_quantity if coffee_option else None),
+                1,
+            )
+
+        rollups.delete()
+        written = RollupModel.objects.bulk_create(
+            [
+                RollupModel(
+                    room_id=room_id,
+                    date=day,
+                    hour=hour,
+                    booked_minutes=minutes,
+                    coffee_servings=coffee_servings,
+                )
+                for (room_id, day, hour), (minutes, coffee_servings) in deltas.items()
+                if (not start_date or day >= start_date)
+                and (not end_date or day <= end_date)
+            ],
+            batch_size=batch_size,
+        )
+    return len(written)
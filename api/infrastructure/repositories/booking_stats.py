@@ -0,0 +1,100 @@
+"""
+Booking statistics per room or manager, aggregated in the database
+
+One grouped query computes, for every requested room (or manager), the
+booking counts by state with conditional aggregation, the average
+duration, and optionally the most frequent value of another column via a
+correlated subquery, instead of one count() per figure or loading the
+bookings into Python.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from django.db import models
+from django.utils import timezone
+
+from ...models import Booking as BookingModel
+
+
+def empty_stats(most_frequent_field: Optional[str] = None) -> Dict[str, Any]:
+    """Statistics of a room or manager without bookings"""
+    stats = {
+        "total": 0,
+        "active": 0,
+        "upcoming": 0,
+        "completed": 0,
+        "average_duration_hours": 0,
+    }
+    if most_frequent_field:
+        stats[f"most_frequent_{most_frequent_field}"] = None
+    return stats
+
+
+def aggregate_booking_stats(
+    group_field: str, ids: Iterable[str], most_frequent_field: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Statistics of the active bookings of each id in ``ids``, grouped by
+    ``group_field`` ("room_id" or "manager_id"), with a single query. With
+    ``most_frequent_field`` the most common value of that column is added as
+    ``most_frequent_<field>``. Ids without bookings get ``empty_stats()``.
+    """
+    ids = {str(value) for value in ids if value is not None}
+    if not ids:
+        return {}
+
+    now = timezone.now()
+    annotations = {
+        "total": models.Count("id"),
+        "active": models.Count(
+            "id", filter=models.Q(start_date__lte=now, end_date__gte=now)
+        ),
+        "upcoming": models.Count("id", filter=models.Q(start_date__gt=now)),
+        "completed": models.Count("id", filter=models.Q(end_date__lt=now)),
+        "average_duration": models.Avg(
+            models.ExpressionWrapper(
+                models.F("end_date") - models.F("start_date"),
+                output_field=models.DurationField(),
+            )
+        ),
+    }
+    if most_frequent_field:
+        annotations["most_frequent"] = models.Subquery(
+            BookingModel.objects.filter(
+                **{group_field: models.OuterRef(group_field)},
+                deleted_at__isnull=True,
+            )
+            .values(most_frequent_field)
+            .annotate(bookings=models.Count("id"))
+            .order_by("-bookings", most_frequent_field)
+            .values(most_frequent_field)[:1]
+        )
+
+    rows = (
+        BookingModel.objects.filter(
+            **{f"{group_field}__in": ids}, deleted_at__isnull=True
+        )
+        .values(group_field)
+        .annotate(**annotations)
+        .order_by()
+    )
+
+    stats = {value: empty_stats(most_frequent_field) for value in ids}
+    for row in rows:
+        average = row["average_duration"]
+        group_stats = stats[str(row[group_field])]
+        group_stats.update(
+            total=row["total"],
+            active=row["active"],
+            upcoming=row["upcoming"],
+            completed=row["completed"],
+            average_duration_hours=(
+                round(average.total_seconds() / 3600, 2) if average else 0
+            ),
+        )
+        if most_frequent_field:
+            value = row["most_frequent"]
+            group_stats[f"most_frequent_{most_frequent_field}"] = (
+                str(value) if value is not None else None
+            )
+    return stats
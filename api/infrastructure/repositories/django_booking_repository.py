@@ -1,5 +1,8 @@
-from typing import List, Optional, Dict, Any
-from django.db import models
+import threading
+from contextlib import ExitStack
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple
+from django.db import IntegrityError, connection, models, transaction
 from django.utils import timezone
 
 from ...models import (
@@ -10,7 +13,45 @@ from ...models import (
 from ...application.repositories.booking_repository_interface import (
     BookingRepositoryInterface,
 )
+from ...application.dto.datetimes import output_datetime
 from ...domain.entities.booking import Booking
+from ...domain.entities.manager import Manager
+from ...domain.entities.room import Room
+from ...domain.exceptions import BookingConflictError
+from . import booking_rollup
+from .booking_interval_index import booking_interval_index
+from .identity_map import IdentityMap
+from .pagination import keyset_page
+from ..sqlite_tuning import immediate_atomic
+
+# Exclusion constraint (PostgreSQL) / triggers (SQLite) added in migration 0005
+ROOM_OVERLAP_CONSTRAINT = "bookings_room_no_overlap"
+OVERLAP_GUARDED_VENDORS = ("postgresql", "sqlite")
+
+# Striped in-process locks serializing writes to the same room
+_ROOM_LOCKS = [threading.Lock() for _ in range(64)]
+
+# Columns read by the row-based read paths, matching BookingOutputDTO.to_dict
+ROW_FIELDS = (
+    "id",
+    "room_id",
+    "manager_id",
+    "name",
+    "description",
+    "start_date",
+    "end_date",
+    "coffee_option",
+    "coffee_quantity",
+    "coffee_description",
+    "series_id",
+    "created_at",
+    "updated_at",
+    "room__name",
+    "room__capacity",
+    "room__location_id",
+    "manager__name",
+    "manager__email",
+)
 
 
 class DjangoBookingRepository(BookingRepositoryInterface):
@@ -18,27 +59,254 @@ class DjangoBookingRepository(BookingRepositoryInterface):
     Django ORM implementation of BookingRepositoryInterface
     """
 
-    def create(self, data: Dict[str, Any]) -> Booking:
+    def __init__(self, identity_map: Optional[IdentityMap] = None):
+        # Shared with the other repositories of a unit of work; None disables
+        # identity tracking for standalone use
+        self.identity_map = identity_map
+
+    def create(
+        self,
+        data: Dict[str, Any],
+        room: Optional[Room] = None,
+        manager: Optional[Manager] = None,
+    ) -> Booking:
         """Create a new booking"""
-        booking_model = BookingModel.objects.create(**data)
+        # Booking and rollup commit together; no savepoint of its own, the
+        # caller's (create_if_available) already rolls back a failed insert
+        with transaction.atomic(savepoint=False):
+            booking_model = BookingModel.objects.create(**data)
+            booking_rollup.record([booking_model])
+        booking_interval_index.add_on_commit(
+            booking_model.id,
+            booking_model.room_id,
+            booking_model.start_date,
+            booking_model.end_date,
+        )
+        if room is not None and manager is not None:
+            # Related entities are already known, no need to reload them
+            return self._remember(
+                self._model_to_entity(booking_model, room=room, manager=manager)
+            )
+
         # Reload with related data
         booking_model = BookingModel.objects.select_related(
             "room", "manager", "room__location"
         ).get(id=booking_model.id)
-        return self._model_to_entity(booking_model)
+        return self._remember(self._model_to_entity(booking_model))
+
+    def create_if_available(
+        self,
+        data: Dict[str, Any],
+        room: Optional[Room] = None,
+        manager: Optional[Manager] = None,
+    ) -> Booking:
+        """
+        Create a booking only if its room is free for the requested period
+
+        Writes to the same room are serialized by an in-process lock and a
+        SELECT ... FOR UPDATE on the room row. Where the database enforces
+        the overlap constraint, the insert is attempted directly and a
+        violation is reported as BookingConflictError; other backends check
+        for conflicts inside the locked transaction first. On SQLite the
+        transaction starts with BEGIN IMMEDIATE, so writers in other
+        processes wait for the write lock instead of failing.
+        """
+        room_id = data["room_id"]
+
+        with immediate_atomic(), self._room_lock(room_id):
+            if connection.features.has_select_for_update:
+                list(
+                    RoomModel.objects.select_for_update()
+                    .filter(id=room_id)
+                    .values_list("id", flat=True)
+                )
+
+            if connection.vendor not in OVERLAP_GUARDED_VENDORS:
+                conflicts = self._query_conflicting(
+                    room_id, data["start_date"], data["end_date"]
+                )
+                if conflicts:
+                    raise BookingConflictError(conflicts)
+
+            try:
+                with transaction.atomic():
+                    return self.create(data, room=room, manager=manager)
+            except IntegrityError as error:
+                self._raise_if_overlap(error, room_id, data)
+                raise
+
+    def bulk_create_if_available(
+        self,
+        data_list: List[Dict[str, Any]],
+        rooms: Optional[Dict[str, Room]] = None,
+        managers: Optional[Dict[str, Manager]] = None,
+    ) -> List[Booking]:
+        """
+        Create several bookings with one bulk INSERT, all or none
+
+        Uses the same per-room serialization as create_if_available, taking
+        the locks of every room involved in a fixed order. Any overlap
+        rejects the whole batch with BookingConflictError.
+        """
+        rooms = rooms or {}
+        managers = managers or {}
+        room_ids = sorted({str(data["room_id"]) for data in data_list})
+
+        with ExitStack() as stack:
+            # Transaction first: on SQLite it holds the write lock, which
+            # create_if_available and update also take before any room lock
+            stack.enter_context(immediate_atomic())
+            for lock in self._room_locks(room_ids):
+                stack.enter_context(lock)
+
+            if connection.features.has_select_for_update:
+                list(
+                    RoomModel.objects.select_for_update()
+                    .filter(id__in=room_ids)
+                    .order_by("id")
+                    .values_list("id", flat=True)
+                )
+
+            if connection.vendor not in OVERLAP_GUARDED_VENDORS:
+                conflicts = [
+                    conflict
+                    for data in data_list
+                    for conflict in self._query_conflicting(
+                        data["room_id"], data["start_date"], data["end_date"]
+                    )
+                ]
+                if conflicts:
+                    raise BookingConflictError(conflicts)
+
+            try:
+                with transaction.atomic():
+                    booking_models = BookingModel.objects.bulk_create(
+                        [BookingModel(**data) for data in data_list]
+                    )
+                    booking_rollup.record(booking_models)
+            except IntegrityError as error:
+                if ROOM_OVERLAP_CONSTRAINT not in str(error):
+                    raise
+                for room_id in room_ids:
+                    booking_interval_index.invalidate(room_id)
+                raise BookingConflictError(
+                    [
+                        conflict
+                        for data in data_list
+                        for conflict in self._query_conflicting(
+                            data["room_id"], data["start_date"], data["end_date"]
+                        )
+                    ]
+                ) from error
+
+        bookings = []
+        for booking_model in booking_models:
+            booking_interval_index.add_on_commit(
+                booking_model.id,
+                booking_model.room_id,
+                booking_model.start_date,
+                booking_model.end_date,
+            )
+            bookings.append(
+                self._remember(
+                    self._model_to_entity(
+                        booking_model,
+                        room=rooms.get(booking_model.room_id)
+                        or self._cached(Room, booking_model.room_id),
+                        manager=managers.get(booking_model.manager_id)
+                        or self._cached(Manager, booking_model.manager_id),
+                    )
+                )
+            )
+        return bookings
 
     def get_by_id(self, booking_id: str) -> Optional[Booking]:
         """Get booking by ID"""
+        cached = self._cached(Booking, booking_id)
+        if cached is not None:
+            return cached
+
         try:
             booking_model = BookingModel.objects.select_related(
                 "room", "manager", "room__location"
             ).get(id=booking_id, deleted_at__isnull=True)
-            return self._model_to_entity(booking_model)
+            return self._remember(self._model_to_entity(booking_model))
         except BookingModel.DoesNotExist:
             return None
 
     def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Booking]:
         """Get all bookings with optional filters"""
+        queryset = self._filtered_queryset(filters)
+        return [self._model_to_entity(booking) for booking in queryset]
+
+    def page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Booking], Optional[str]]:
+        """Get one page of bookings ordered by (start_date, id)"""
+        bookings, next_cursor = keyset_page(
+            self._filtered_queryset(filters), "start_date", cursor, limit
+        )
+        return [self._model_to_entity(booking) for booking in bookings], next_cursor
+
+    def get_all_rows(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all bookings as output dictionaries built from a values()
+        projection, skipping model instances and domain entities
+        """
+        queryset = self._filtered_queryset(filters).values(*ROW_FIELDS)
+        return [self._row_to_dict(row) for row in queryset]
+
+    def iter_rows(
+        self, filters: Optional[Dict[str, Any]] = None, chunk_size: int = 2000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream bookings as output dictionaries straight from the database,
+        without building model instances or domain entities
+        """
+        queryset = (
+            self._filtered_queryset(filters)
+            .order_by("start_date", "id")
+            .values(*ROW_FIELDS)
+        )
+        for row in queryset.iterator(chunk_size=chunk_size):
+            yield self._row_to_dict(row)
+
+    def get_list_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        Count of the bookings matching the filters and the latest updated_at
+        among them, their rooms and their managers
+        """
+        stamp = (
+            self._filtered_queryset(filters)
+            .select_related(None)
+            .aggregate(
+                count=models.Count("id"),
+                booking=models.Max("updated_at"),
+                room=models.Max("room__updated_at"),
+                manager=models.Max("manager__updated_at"),
+            )
+        )
+        latest = [stamp[key] for key in ("booking", "room", "manager") if stamp[key]]
+        return stamp["count"], max(latest, default=None)
+
+    def get_stamp(self, booking_id: str) -> Optional[datetime]:
+        """Latest updated_at of an active booking, its room and its manager"""
+        row = (
+            BookingModel.objects.filter(id=booking_id, deleted_at__isnull=True)
+            .values_list("updated_at", "room__updated_at", "manager__updated_at")
+            .first()
+        )
+        return max((value for value in row if value), default=None) if row else None
+
+    def _filtered_queryset(self, filters: Optional[Dict[str, Any]] = None):
+        """Active bookings matching the list filters"""
         queryset = BookingModel.objects.select_related(
             "room", "manager", "room__location"
         ).filter(deleted_at__isnull=True)
@@ -58,8 +326,32 @@ class DjangoBookingRepository(BookingRepositoryInterface):
                 queryset = queryset.filter(end_date__lte=filters["end_date_to"])
             if "coffee_option" in filters:
                 queryset = queryset.filter(coffee_option=filters["coffee_option"])
-
-        return [self._model_to_entity(booking) for booking in queryset]
+            if "series_id" in filters:
+                queryset = queryset.filter(series_id=filters["series_id"])
+
+        return queryset
+
+    def get_room_intervals(
+        self, room_ids: Iterable[str], start_date: datetime, end_date: datetime
+    ) -> Dict[str, List[Tuple[datetime, datetime, str]]]:
+        """
+        Get the periods of active bookings overlapping the range, per room
+        and sorted by start, with a single query
+        """
+        rows = (
+            BookingModel.objects.filter(
+                room_id__in=set(room_ids),
+                start_date__lt=end_date,
+                end_date__gt=start_date,
+                deleted_at__isnull=True,
+            )
+            .order_by("start_date")
+            .values_list("room_id", "start_date", "end_date", "id")
+        )
+        intervals = {}
+        for room_id, start, end, booking_id in rows:
+            intervals.setdefault(str(room_id), []).append((start, end, str(booking_id)))
+        return intervals
 
     def get_by_room(self, room_id: str) -> List[Booking]:
         """Get bookings by room"""
@@ -82,20 +374,11 @@ class DjangoBookingRepository(BookingRepositoryInterface):
         end_date,
         exclude_booking_id: Optional[str] = None,
     ) -> List[Booking]:
-        """Get bookings that conflict with the given time range"""
-        queryset = BookingModel.objects.select_related(
-            "room", "manager", "room__location"
-        ).filter(
-            room_id=room_id,
-            start_date__lt=end_date,
-            end_date__gt=start_date,
-            deleted_at__isnull=True,
-        )
-
-        if exclude_booking_id:
-            queryset = queryset.exclude(id=exclude_booking_id)
-
-        return [self._model_to_entity(booking) for booking in queryset]
+        """
+        Get bookings that conflict with the given time range, for read-only
+        availability queries (may lag writes of other worker processes)
+        """
+        return self._find_conflicting(room_id, start_date, end_date, exclude_booking_id)
 
     def update(self, booking_id: str, data: Dict[str, Any]) -> Optional[Booking]:
         """Update booking"""
@@ -103,11 +386,50 @@ class DjangoBookingRepository(BookingRepositoryInterface):
             booking_model = BookingModel.objects.get(
                 id=booking_id, deleted_at__isnull=True
             )
+            previous_room_id = booking_model.room_id
+            previous = booking_rollup.snapshot(booking_model)
             for key, value in data.items():
                 setattr(booking_model, key, value)
             booking_model.updated_at = timezone.now()
-            booking_model.save()
-            return self._model_to_entity(booking_model)
+            try:
+                with immediate_atomic(), self._room_lock(booking_model.room_id):
+                    if connection.vendor not in OVERLAP_GUARDED_VENDORS:
+                        conflicts = self._query_conflicting(
+                            booking_model.room_id,
+                            booking_model.start_date,
+                            booking_model.end_date,
+                            exclude_booking_id=booking_model.id,
+                        )
+                        if conflicts:
+                            raise BookingConflictError(conflicts)
+                    with transaction.atomic():
+                        booking_model.save()
+                        booking_rollup.record_change(previous, booking_model)
+            except IntegrityError as error:
+                self._raise_if_overlap(
+                    error,
+                    booking_model.room_id,
+                    {
+                        "start_date": booking_model.start_date,
+                        "end_date": booking_model.end_date,
+                    },
+                    exclude_booking_id=booking_model.id,
+                )
+                raise
+            booking_interval_index.discard_on_commit(booking_model.id, previous_room_id)
+            booking_interval_index.add_on_commit(
+                booking_model.id,
+                booking_model.room_id,
+                booking_model.start_date,
+                booking_model.end_date,
+            )
+            return self._remember(
+                self._model_to_entity(
+                    booking_model,
+                    room=self._cached(Room, booking_model.room_id),
+                    manager=self._cached(Manager, booking_model.manager_id),
+                )
+            )
         except BookingModel.DoesNotExist:
             return None
 
@@ -118,7 +440,13 @@ class DjangoBookingRepository(BookingRepositoryInterface):
                 id=booking_id, deleted_at__isnull=True
             )
             booking_model.deleted_at = timezone.now()
-            booking_model.save()
+            with transaction.atomic():
+                booking_model.save()
+                booking_rollup.record([booking_model], sign=-1)
+            booking_interval_index.discard_on_commit(
+                booking_model.id, booking_model.room_id
+            )
+            self._forget(booking_id)
             return True
         except BookingModel.DoesNotExist:
             return False
@@ -153,21 +481,14 @@ class DjangoBookingRepository(BookingRepositoryInterface):
         end_date,
         exclude_booking_id: Optional[str] = None,
     ) -> List[Booking]:
-        """Find conflicting bookings for a time period"""
-        queryset = BookingModel.objects.select_related(
-            "room", "manager", "room__location"
-        ).filter(
-            room_id=room_id,
-            start_date__lt=end_date,
-            end_date__gt=start_date,
-            deleted_at__isnull=True,
+        """
+        Find conflicting bookings for a time period, always against the
+        database: this is the check guarding writes
+        """
+        return self._query_conflicting(
+            room_id, start_date, end_date, exclude_booking_id
         )
 
-        if exclude_booking_id:
-            queryset = queryset.exclude(id=exclude_booking_id)
-
-        return [self._model_to_entity(booking) for booking in queryset]
-
     def get_active_bookings(
         self, manager_id: Optional[str] = None, room_id: Optional[str] = None
     ) -> List[Booking]:
@@ -229,14 +550,151 @@ class DjangoBookingRepository(BookingRepositoryInterface):
         conflicts = self.find_conflicts(room_id, start_date, end_date)
         return len(conflicts) == 0
 
-    def _model_to_entity(self, booking_model: BookingModel) -> Booking:
-        """Convert Django model to domain entity"""
-        from ...domain.entities.room import Room
-        from ...domain.entities.manager import Manager
+    def _find_conflicting(
+        self,
+        room_id: str,
+        start_date,
+        end_date,
+        exclude_booking_id: Optional[str] = None,
+    ) -> List[Booking]:
+        """
+        Resolve overlapping bookings through the in-memory interval index,
+        falling back to the ORM overlap query when the index cannot answer.
+        Read paths only: the index is per process and may be stale.
+        """
+        queryset = BookingModel.objects.select_related(
+            "room", "manager", "room__location"
+        )
+
+        conflict_ids = booking_interval_index.find_conflicts(
+            room_id, start_date, end_date, exclude_booking_id
+        )
+        if conflict_ids is not None:
+            if not conflict_ids:
+                return []
+            queryset = queryset.filter(id__in=conflict_ids, deleted_at__isnull=True)
+            return [self._model_to_entity(booking) for booking in queryset]
+
+        return self._query_conflicting(
+            room_id, start_date, end_date, exclude_booking_id
+        )
 
+    def _query_conflicting(
+        self,
+        room_id: str,
+        start_date,
+        end_date,
+        exclude_booking_id: Optional[str] = None,
+    ) -> List[Booking]:
+        """Overlap query against the database, bypassing the interval index"""
+        queryset = BookingModel.objects.select_related(
+            "room", "manager", "room__location"
+        ).filter(
+            room_id=room_id,
+            start_date__lt=end_date,
+            end_date__gt=start_date,
+            deleted_at__isnull=True,
+        )
+
+        if exclude_booking_id:
+            queryset = queryset.exclude(id=exclude_booking_id)
+
+        return [self._model_to_entity(booking) for booking in queryset]
+
+    def _raise_if_overlap(
+        self,
+        error: IntegrityError,
+        room_id: str,
+        data: Dict[str, Any],
+        exclude_booking_id: Optional[str] = None,
+    ) -> None:
+        """Translate an overlap constraint violation into BookingConflictError"""
+        if ROOM_OVERLAP_CONSTRAINT not in str(error):
+            return
+        booking_interval_index.invalidate(room_id)
+        raise BookingConflictError(
+            self._query_conflicting(
+                room_id, data["start_date"], data["end_date"], exclude_booking_id
+            )
+        ) from error
+
+    @staticmethod
+    def _room_lock(room_id: str) -> threading.Lock:
+        return _ROOM_LOCKS[hash(str(room_id)) % len(_ROOM_LOCKS)]
+
+    @staticmethod
+    def _room_locks(room_ids: Iterable[str]) -> List[threading.Lock]:
+        """Distinct lock stripes of several rooms, in a deadlock-free order"""
+        stripes = {hash(str(room_id)) % len(_ROOM_LOCKS) for room_id in room_ids}
+        return [_ROOM_LOCKS[stripe] for stripe in sorted(stripes)]
+
+    @staticmethod
+    def _row_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a values() row like BookingOutputDTO.to_dict"""
+        start_date = row["start_date"]
+        end_date = row["end_date"]
+        created_at = row["created_at"]
+        updated_at = row["updated_at"]
+        return {
+            "id": row["id"],
+            "room_id": row["room_id"],
+            "manager_id": row["manager_id"],
+            "name": row["name"],
+            "description": row["description"],
+            "start_date": output_datetime(start_date),
+            "end_date": output_datetime(end_date),
+            "coffee_option": row["coffee_option"],
+            "coffee_quantity": row["coffee_quantity"],
+            "coffee_description": row["coffee_description"],
+            "series_id": row["series_id"],
+            "created_at": output_datetime(created_at),
+            "updated_at": output_datetime(updated_at),
+            "room": {
+                "id": row["room_id"],
+                "name": row["room__name"],
+                "capacity": row["room__capacity"],
+                "location_id": row["room__location_id"],
+            },
+            "manager": {
+                "id": row["manager_id"],
+                "name": row["manager__name"],
+                "email": row["manager__email"],
+            },
+        }
+
+    def _cached(self, entity_type: type, entity_id) -> Optional[Any]:
+        """Entity already loaded in the identity map, if any"""
+        if self.identity_map is None:
+            return None
+        return self.identity_map.get(entity_type, entity_id)
+
+    def _remember(self, booking: Optional[Booking]) -> Optional[Booking]:
+        """Track a loaded or written booking in the identity map"""
+        if self.identity_map is not None:
+            self.identity_map.add(booking)
+        return booking
+
+    def _forget(self, booking_id: str) -> None:
+        if self.identity_map is not None:
+            self.identity_map.remove(Booking, booking_id)
+
+    def _model_to_entity(
+        self,
+        booking_model: BookingModel,
+        room: Optional[Room] = None,
+        manager: Optional[Manager] = None,
+    ) -> Booking:
+        """
+        Convert Django model to domain entity, attaching the given room and
+        manager entities instead of reading the related models when provided
+        """
         # Convert related objects to entities if they exist
-        room_entity = None
-        if hasattr(booking_model, "room") and booking_model.room:
+        room_entity = room
+        if (
+            room_entity is None
+            and hasattr(booking_model, "room")
+            and booking_model.room
+        ):
             room_entity = Room(
                 id=str(booking_model.room.id),
                 name=booking_model.room.name,
@@ -248,8 +706,12 @@ class DjangoBookingRepository(BookingRepositoryInterface):
                 ),
             )
 
-        manager_entity = None
-        if hasattr(booking_model, "manager") and booking_model.manager:
+        manager_entity = manager
+        if (
+            manager_entity is None
+            and hasattr(booking_model, "manager")
+            and booking_model.manager
+        ):
             manager_entity = Manager(
                 id=str(booking_model.manager.id),
                 name=booking_model.manager.name,
@@ -274,4 +736,5 @@ class DjangoBookingRepository(BookingRepositoryInterface):
             created_at=booking_model.created_at,
             updated_at=booking_model.updated_at,
             deleted_at=booking_model.deleted_at,
+            series_id=booking_model.series_id,
         )
@@ -1,4 +1,5 @@
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
 from django.db import models
 from django.utils import timezone
 
@@ -6,7 +7,21 @@ from ...models import Location as LocationModel
 from ...application.repositories.location_repository_interface import (
     LocationRepositoryInterface,
 )
+from ...application.dto.datetimes import output_datetime
 from ...domain.entities.location import Location
+from .identity_map import IdentityMap
+from .pagination import keyset_page
+from .read_cache import read_cache
+
+# Columns read by the row-based read path, matching LocationOutputDTO.to_dict
+ROW_FIELDS = (
+    "id",
+    "name",
+    "address",
+    "description",
+    "created_at",
+    "updated_at",
+)
 
 
 class DjangoLocationRepository(LocationRepositoryInterface):
@@ -14,18 +29,28 @@ class DjangoLocationRepository(LocationRepositoryInterface):
     Django ORM implementation of LocationRepositoryInterface
     """
 
+    def __init__(self, identity_map: Optional[IdentityMap] = None):
+        # Shared with the other repositories of a unit of work; None disables
+        # identity tracking for standalone use
+        self.identity_map = identity_map
+
     def create(self, data: Dict[str, Any]) -> Location:
         """Create a new location"""
         location_model = LocationModel.objects.create(**data)
-        return self._model_to_entity(location_model)
+        read_cache.invalidate("location")
+        return self._remember(self._model_to_entity(location_model))
 
     def get_by_id(self, location_id: str) -> Optional[Location]:
         """Get location by ID"""
+        cached = self._cached(Location, location_id)
+        if cached is not None:
+            return cached
+
         try:
             location_model = LocationModel.objects.get(
                 id=location_id, deleted_at__isnull=True
             )
-            return self._model_to_entity(location_model)
+            return self._remember(self._model_to_entity(location_model))
         except LocationModel.DoesNotExist:
             return None
 
@@ -41,6 +66,50 @@ class DjangoLocationRepository(LocationRepositoryInterface):
 
     def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Location]:
         """Get all locations with optional filters"""
+        queryset = self._filtered_queryset(filters)
+        return [self._model_to_entity(location) for location in queryset]
+
+    def page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Location], Optional[str]]:
+        """Get one page of locations ordered by (created_at, id)"""
+        locations, next_cursor = keyset_page(
+            self._filtered_queryset(filters), "created_at", cursor, limit
+        )
+        return [self._model_to_entity(location) for location in locations], next_cursor
+
+    def get_all_rows(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all locations as output dictionaries built from a values()
+        projection, skipping model instances and domain entities
+        """
+        queryset = self._filtered_queryset(filters).values(*ROW_FIELDS)
+        return [self._row_to_dict(row) for row in queryset]
+
+    def get_list_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """Count and latest updated_at of the locations matching the filters"""
+        stamp = self._filtered_queryset(filters).aggregate(
+            count=models.Count("id"), last_updated=models.Max("updated_at")
+        )
+        return stamp["count"], stamp["last_updated"]
+
+    def get_stamp(self, location_id: str) -> Optional[datetime]:
+        """updated_at of an active location"""
+        return (
+            LocationModel.objects.filter(id=location_id, deleted_at__isnull=True)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+
+    def _filtered_queryset(self, filters: Optional[Dict[str, Any]] = None):
+        """Active locations matching the list filters"""
         queryset = LocationModel.objects.filter(deleted_at__isnull=True)
 
         if filters:
@@ -49,7 +118,7 @@ class DjangoLocationRepository(LocationRepositoryInterface):
             if "address" in filters:
                 queryset = queryset.filter(address__icontains=filters["address"])
 
-        return [self._model_to_entity(location) for location in queryset]
+        return queryset
 
     def update(self, location_id: str, data: Dict[str, Any]) -> Optional[Location]:
         """Update location"""
@@ -61,7 +130,8 @@ class DjangoLocationRepository(LocationRepositoryInterface):
                 setattr(location_model, key, value)
             location_model.updated_at = timezone.now()
             location_model.save()
-            return self._model_to_entity(location_model)
+            read_cache.invalidate("location", location_model.id)
+            return self._remember(self._model_to_entity(location_model))
         except LocationModel.DoesNotExist:
             return None
 
@@ -73,6 +143,8 @@ class DjangoLocationRepository(LocationRepositoryInterface):
             )
             location_model.deleted_at = timezone.now()
             location_model.save()
+            read_cache.invalidate("location", location_model.id)
+            self._forget(location_id)
             return True
         except LocationModel.DoesNotExist:
             return False
@@ -112,6 +184,36 @@ class DjangoLocationRepository(LocationRepositoryInterface):
             location_id=location_id, deleted_at__isnull=True
         ).exists()
 
+    @staticmethod
+    def _row_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a values() row like LocationOutputDTO.to_dict"""
+        created_at = row["created_at"]
+        updated_at = row["updated_at"]
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "address": row["address"],
+            "description": row["description"],
+            "created_at": output_datetime(created_at),
+            "updated_at": output_datetime(updated_at),
+        }
+
+    def _cached(self, entity_type: type, entity_id) -> Optional[Any]:
+        """Entity already loaded in the identity map, if any"""
+        if self.identity_map is None:
+            return None
+        return self.identity_map.get(entity_type, entity_id)
+
+    def _remember(self, location: Optional[Location]) -> Optional[Location]:
+        """Track a loaded or written location in the identity map"""
+        if self.identity_map is not None:
+            self.identity_map.add(location)
+        return location
+
+    def _forget(self, location_id: str) -> None:
+        if self.identity_map is not None:
+            self.identity_map.remove(Location, location_id)
+
     def _model_to_entity(self, location_model: LocationModel) -> Location:
         """Convert Django model to domain entity"""
         return Location(
@@ -1,4 +1,5 @@
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from django.db import models
 from django.utils import timezone
 
@@ -6,7 +7,22 @@ from ...models import Manager as ManagerModel, Booking as BookingModel
 from ...application.repositories.manager_repository_interface import (
     ManagerRepositoryInterface,
 )
+from ...application.dto.datetimes import output_datetime
 from ...domain.entities.manager import Manager
+from .booking_stats import aggregate_booking_stats
+from .identity_map import IdentityMap
+from .pagination import keyset_page
+from .read_cache import read_cache
+
+# Columns read by the row-based read path, matching ManagerOutputDTO.to_dict
+ROW_FIELDS = (
+    "id",
+    "name",
+    "email",
+    "phone",
+    "created_at",
+    "updated_at",
+)
 
 
 class DjangoManagerRepository(ManagerRepositoryInterface):
@@ -14,18 +30,28 @@ class DjangoManagerRepository(ManagerRepositoryInterface):
     Django ORM implementation of ManagerRepositoryInterface
     """
 
+    def __init__(self, identity_map: Optional[IdentityMap] = None):
+        # Shared with the other repositories of a unit of work; None disables
+        # identity tracking for standalone use
+        self.identity_map = identity_map
+
     def create(self, data: Dict[str, Any]) -> Manager:
         """Create a new manager"""
         manager_model = ManagerModel.objects.create(**data)
-        return self._model_to_entity(manager_model)
+        read_cache.invalidate("manager")
+        return self._remember(self._model_to_entity(manager_model))
 
     def get_by_id(self, manager_id: str) -> Optional[Manager]:
         """Get manager by ID"""
+        cached = self._cached(Manager, manager_id)
+        if cached is not None:
+            return cached
+
         try:
             manager_model = ManagerModel.objects.get(
                 id=manager_id, deleted_at__isnull=True
             )
-            return self._model_to_entity(manager_model)
+            return self._remember(self._model_to_entity(manager_model))
         except ManagerModel.DoesNotExist:
             return None
 
@@ -39,8 +65,72 @@ class DjangoManagerRepository(ManagerRepositoryInterface):
         except ManagerModel.DoesNotExist:
             return None
 
+    def get_by_ids(self, manager_ids: Iterable[str]) -> Dict[str, Manager]:
+        """Get active managers by ID with a single query, keyed by ID"""
+        found = {}
+        missing = []
+        for manager_id in set(manager_ids):
+            cached = self._cached(Manager, manager_id)
+            if cached is not None:
+                found[cached.id] = cached
+            else:
+                missing.append(manager_id)
+
+        if missing:
+            queryset = ManagerModel.objects.filter(
+                id__in=missing, deleted_at__isnull=True
+            )
+            for manager_model in queryset:
+                manager = self._remember(self._model_to_entity(manager_model))
+                found[manager.id] = manager
+        return found
+
     def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Manager]:
         """Get all managers with optional filters"""
+        queryset = self._filtered_queryset(filters)
+        return [self._model_to_entity(manager) for manager in queryset]
+
+    def page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Manager], Optional[str]]:
+        """Get one page of managers ordered by (created_at, id)"""
+        managers, next_cursor = keyset_page(
+            self._filtered_queryset(filters), "created_at", cursor, limit
+        )
+        return [self._model_to_entity(manager) for manager in managers], next_cursor
+
+    def get_all_rows(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all managers as output dictionaries built from a values()
+        projection, skipping model instances and domain entities
+        """
+        queryset = self._filtered_queryset(filters).values(*ROW_FIELDS)
+        return [self._row_to_dict(row) for row in queryset]
+
+    def get_list_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """Count and latest updated_at of the managers matching the filters"""
+        stamp = self._filtered_queryset(filters).aggregate(
+            count=models.Count("id"), last_updated=models.Max("updated_at")
+        )
+        return stamp["count"], stamp["last_updated"]
+
+    def get_stamp(self, manager_id: str) -> Optional[datetime]:
+        """updated_at of an active manager"""
+        return (
+            ManagerModel.objects.filter(id=manager_id, deleted_at__isnull=True)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+
+    def _filtered_queryset(self, filters: Optional[Dict[str, Any]] = None):
+        """Active managers matching the list filters"""
         queryset = ManagerModel.objects.filter(deleted_at__isnull=True)
 
         if filters:
@@ -49,7 +139,7 @@ class DjangoManagerRepository(ManagerRepositoryInterface):
             if "email" in filters:
                 queryset = queryset.filter(email__icontains=filters["email"])
 
-        return [self._model_to_entity(manager) for manager in queryset]
+        return queryset
 
     def get_by_department(self, department: str) -> List[Manager]:
         """Get managers by department"""
@@ -75,7 +165,8 @@ class DjangoManagerRepository(ManagerRepositoryInterface):
                 setattr(manager_model, key, value)
             manager_model.updated_at = timezone.now()
             manager_model.save()
-            return self._model_to_entity(manager_model)
+            read_cache.invalidate("manager", manager_model.id)
+            return self._remember(self._model_to_entity(manager_model))
         except ManagerModel.DoesNotExist:
             return None
 
@@ -87,6 +178,8 @@ class DjangoManagerRepository(ManagerRepositoryInterface):
             )
             manager_model.deleted_at = timezone.now()
             manager_model.save()
+            read_cache.invalidate("manager", manager_model.id)
+            self._forget(manager_id)
             return True
         except ManagerModel.DoesNotExist:
             return False
@@ -140,33 +233,49 @@ class DjangoManagerRepository(ManagerRepositoryInterface):
 
     def get_manager_bookings_count(self, manager_id: str) -> Dict[str, int]:
         """Get booking statistics for a manager"""
-        now = timezone.now()
+        stats = self.get_managers_bookings_stats([manager_id])[str(manager_id)]
+        return {key: stats[key] for key in ("total", "active", "upcoming", "completed")}
 
-        total = BookingModel.objects.filter(
-            manager_id=manager_id, deleted_at__isnull=True
-        ).count()
+    def get_managers_bookings_stats(
+        self, manager_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Booking statistics (counts, average duration, most booked room) of
+        many managers with one aggregate query
+        """
+        return aggregate_booking_stats(
+            "manager_id", manager_ids, most_frequent_field="room_id"
+        )
 
-        active = BookingModel.objects.filter(
-            manager_id=manager_id,
-            deleted_at__isnull=True,
-            start_date__lte=now,
-            end_date__gte=now,
-        ).count()
+    @staticmethod
+    def _row_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a values() row like ManagerOutputDTO.to_dict"""
+        created_at = row["created_at"]
+        updated_at = row["updated_at"]
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "email": row["email"],
+            "phone": row["phone"],
+            "created_at": output_datetime(created_at),
+            "updated_at": output_datetime(updated_at),
+        }
 
-        upcoming = BookingModel.objects.filter(
-            manager_id=manager_id, deleted_at__isnull=True, start_date__gt=now
-        ).count()
+    def _cached(self, entity_type: type, entity_id) -> Optional[Any]:
+        """Entity already loaded in the identity map, if any"""
+        if self.identity_map is None:
+            return None
+        return self.identity_map.get(entity_type, entity_id)
 
-        completed = BookingModel.objects.filter(
-            manager_id=manager_id, deleted_at__isnull=True, end_date__lt=now
-        ).count()
+    def _remember(self, manager: Optional[Manager]) -> Optional[Manager]:
+        """Track a loaded or written manager in the identity map"""
+        if self.identity_map is not None:
+            self.identity_map.add(manager)
+        return manager
 
-        return {
-            "total": total,
-            "active": active,
-            "upcoming": upcoming,
-            "completed": completed,
-        }
+    def _forget(self, manager_id: str) -> None:
+        if self.identity_map is not None:
+            self.identity_map.remove(Manager, manager_id)
 
     def _model_to_entity(self, manager_model: ManagerModel) -> Manager:
         """Convert Django model to domain entity"""
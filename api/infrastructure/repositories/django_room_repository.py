@@ -1,4 +1,5 @@
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from django.db import models
 from django.utils import timezone
 
@@ -10,7 +11,23 @@ from ...models import (
 from ...application.repositories.room_repository_interface import (
     RoomRepositoryInterface,
 )
+from ...application.dto.datetimes import output_datetime
 from ...domain.entities.room import Room
+from .booking_stats import aggregate_booking_stats
+from .identity_map import IdentityMap
+from .pagination import keyset_page
+from .read_cache import read_cache
+
+# Columns read by the row-based read path, matching RoomOutputDTO.to_dict
+ROW_FIELDS = (
+    "id",
+    "name",
+    "capacity",
+    "description",
+    "location_id",
+    "created_at",
+    "updated_at",
+)
 
 
 class DjangoRoomRepository(RoomRepositoryInterface):
@@ -18,23 +35,97 @@ class DjangoRoomRepository(RoomRepositoryInterface):
     Django ORM implementation of RoomRepositoryInterface
     """
 
+    def __init__(self, identity_map: Optional[IdentityMap] = None):
+        # Shared with the other repositories of a unit of work; None disables
+        # identity tracking for standalone use
+        self.identity_map = identity_map
+
     def create(self, data: Dict[str, Any]) -> Room:
         """Create a new room"""
         room_model = RoomModel.objects.create(**data)
-        return self._model_to_entity(room_model)
+        read_cache.invalidate("room")
+        return self._remember(self._model_to_entity(room_model))
 
     def get_by_id(self, room_id: str) -> Optional[Room]:
         """Get room by ID"""
+        cached = self._cached(Room, room_id)
+        if cached is not None:
+            return cached
+
         try:
             room_model = RoomModel.objects.select_related("location").get(
                 id=room_id, deleted_at__isnull=True
             )
-            return self._model_to_entity(room_model)
+            return self._remember(self._model_to_entity(room_model))
         except RoomModel.DoesNotExist:
             return None
 
+    def get_by_ids(self, room_ids: Iterable[str]) -> Dict[str, Room]:
+        """Get active rooms by ID with a single query, keyed by ID"""
+        found = {}
+        missing = []
+        for room_id in set(room_ids):
+            cached = self._cached(Room, room_id)
+            if cached is not None:
+                found[cached.id] = cached
+            else:
+                missing.append(room_id)
+
+        if missing:
+            queryset = RoomModel.objects.select_related("location").filter(
+                id__in=missing, deleted_at__isnull=True
+            )
+            for room_model in queryset:
+                room = self._remember(self._model_to_entity(room_model))
+                found[room.id] = room
+        return found
+
     def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Room]:
         """Get all rooms with optional filters"""
+        queryset = self._filtered_queryset(filters)
+        return [self._model_to_entity(room) for room in queryset]
+
+    def page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Room], Optional[str]]:
+        """Get one page of rooms ordered by (created_at, id)"""
+        rooms, next_cursor = keyset_page(
+            self._filtered_queryset(filters), "created_at", cursor, limit
+        )
+        return [self._model_to_entity(room) for room in rooms], next_cursor
+
+    def get_all_rows(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all rooms as output dictionaries built from a values()
+        projection, skipping model instances and domain entities
+        """
+        queryset = self._filtered_queryset(filters).values(*ROW_FIELDS)
+        return [self._row_to_dict(row) for row in queryset]
+
+    def get_list_stamp(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Optional[datetime]]:
+        """Count and latest updated_at of the rooms matching the filters"""
+        stamp = self._filtered_queryset(filters).aggregate(
+            count=models.Count("id"), last_updated=models.Max("updated_at")
+        )
+        return stamp["count"], stamp["last_updated"]
+
+    def get_stamp(self, room_id: str) -> Optional[datetime]:
+        """updated_at of an active room"""
+        return (
+            RoomModel.objects.filter(id=room_id, deleted_at__isnull=True)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+
+    def _filtered_queryset(self, filters: Optional[Dict[str, Any]] = None):
+        """Active rooms matching the list filters"""
         queryset = RoomModel.objects.select_related("location").filter(
             deleted_at__isnull=True
         )
@@ -49,7 +140,7 @@ class DjangoRoomRepository(RoomRepositoryInterface):
             if "capacity_max" in filters:
                 queryset = queryset.filter(capacity__lte=filters["capacity_max"])
 
-        return [self._model_to_entity(room) for room in queryset]
+        return queryset
 
     def get_by_location(self, location_id: str) -> List[Room]:
         """Get rooms by location"""
@@ -59,25 +150,45 @@ class DjangoRoomRepository(RoomRepositoryInterface):
         return [self._model_to_entity(room) for room in queryset]
 
     def get_available_rooms(
-        self, start_date, end_date, location_id: Optional[str] = None
+        self,
+        start_date,
+        end_date,
+        location_id: Optional[str] = None,
+        capacity_min: Optional[int] = None,
     ) -> List[Room]:
         """Get available rooms for a time period"""
-        # Base queryset
+        queryset = self._available_queryset(
+            start_date, end_date, location_id, capacity_min
+        )
+        return [self._model_to_entity(room) for room in queryset]
+
+    def _available_queryset(
+        self,
+        start_date,
+        end_date,
+        location_id: Optional[str] = None,
+        capacity_min: Optional[int] = None,
+    ):
+        """Active rooms without bookings overlapping the period"""
         queryset = RoomModel.objects.select_related("location").filter(
             deleted_at__isnull=True
         )
 
         if location_id:
             queryset = queryset.filter(location_id=location_id)
+        if capacity_min:
+            queryset = queryset.filter(capacity__gte=capacity_min)
 
-        # Exclude rooms with conflicting bookings
+        # Anti-join: NOT EXISTS correlated on each candidate room, so only the
+        # bookings of those rooms are probed (via the room/period index)
+        # instead of collecting every overlapping booking of every location
         conflicting_bookings = BookingModel.objects.filter(
-            start_date__lt=end_date, end_date__gt=start_date, deleted_at__isnull=True
-        ).values_list("room_id", flat=True)
-
-        queryset = queryset.exclude(id__in=conflicting_bookings)
-
-        return [self._model_to_entity(room) for room in queryset]
+            room_id=models.OuterRef("pk"),
+            start_date__lt=end_date,
+            end_date__gt=start_date,
+            deleted_at__isnull=True,
+        )
+        return queryset.filter(~models.Exists(conflicting_bookings))
 
     def update(self, room_id: str, data: Dict[str, Any]) -> Optional[Room]:
         """Update room"""
@@ -87,7 +198,8 @@ class DjangoRoomRepository(RoomRepositoryInterface):
                 setattr(room_model, key, value)
             room_model.updated_at = timezone.now()
             room_model.save()
-            return self._model_to_entity(room_model)
+            read_cache.invalidate("room", room_model.id)
+            return self._remember(self._model_to_entity(room_model))
         except RoomModel.DoesNotExist:
             return None
 
@@ -97,6 +209,8 @@ class DjangoRoomRepository(RoomRepositoryInterface):
             room_model = RoomModel.objects.get(id=room_id, deleted_at__isnull=True)
             room_model.deleted_at = timezone.now()
             room_model.save()
+            read_cache.invalidate("room", room_model.id)
+            self._forget(room_id)
             return True
         except RoomModel.DoesNotExist:
             return False
@@ -131,24 +245,6 @@ class DjangoRoomRepository(RoomRepositoryInterface):
         booking_repo = DjangoBookingRepository()
         return [booking_repo._model_to_entity(booking) for booking in queryset]
 
-    def get_available_rooms(
-        self, start_date: Any, end_date: Any, location_id: Optional[str] = None
-    ) -> List[Room]:
-        """Get available rooms for a time period"""
-        queryset = RoomModel.objects.filter(deleted_at__isnull=True)
-
-        if location_id:
-            queryset = queryset.filter(location_id=location_id)
-
-        # Get rooms that don't have conflicting bookings
-        conflicting_bookings = BookingModel.objects.filter(
-            deleted_at__isnull=True, start_date__lt=end_date, end_date__gt=start_date
-        ).values_list("room_id", flat=True)
-
-        available_rooms = queryset.exclude(id__in=conflicting_bookings)
-
-        return [self._model_to_entity(room) for room in available_rooms]
-
     def has_active_bookings(self, room_id: str) -> bool:
         """Check if room has any active bookings"""
         now = timezone.now()
@@ -158,33 +254,50 @@ class DjangoRoomRepository(RoomRepositoryInterface):
 
     def get_room_bookings_count(self, room_id: str) -> Dict[str, int]:
         """Get booking statistics for a room"""
-        now = timezone.now()
-
-        total = BookingModel.objects.filter(
-            room_id=room_id, deleted_at__isnull=True
-        ).count()
+        stats = self.get_rooms_bookings_stats([room_id])[str(room_id)]
+        return {key: stats[key] for key in ("total", "active", "upcoming", "completed")}
+
+    def get_rooms_bookings_stats(
+        self, room_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Booking statistics (counts, average duration, most frequent manager)
+        of many rooms with one aggregate query
+        """
+        return aggregate_booking_stats(
+            "room_id", room_ids, most_frequent_field="manager_id"
+        )
 
-        active = BookingModel.objects.filter(
-            room_id=room_id,
-            deleted_at__isnull=True,
-            start_date__lte=now,
-            end_date__gte=now,
-        ).count()
+    @staticmethod
+    def _row_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a values() row like RoomOutputDTO.to_dict"""
+        created_at = row["created_at"]
+        updated_at = row["updated_at"]
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "capacity": row["capacity"],
+            "description": row["description"],
+            "location_id": row["location_id"],
+            "created_at": output_datetime(created_at),
+            "updated_at": output_datetime(updated_at),
+        }
 
-        upcoming = BookingModel.objects.filter(
-            room_id=room_id, deleted_at__isnull=True, start_date__gt=now
-        ).count()
+    def _cached(self, entity_type: type, entity_id) -> Optional[Any]:
+        """Entity already loaded in the identity map, if any"""
+        if self.identity_map is None:
+            return None
+        return self.identity_map.get(entity_type, entity_id)
 
-        completed = BookingModel.objects.filter(
-            room_id=room_id, deleted_at__isnull=True, end_date__lt=now
-        ).count()
+    def _remember(self, room: Optional[Room]) -> Optional[Room]:
+        """Track a loaded or written room in the identity map"""
+        if self.identity_map is not None:
+            self.identity_map.add(room)
+        return room
 
-        return {
-            "total": total,
-            "active": active,
-            "upcoming": upcoming,
-            "completed": completed,
-        }
+    def _forget(self, room_id: str) -> None:
+        if self.identity_map is not None:
+            self.identity_map.remove(Room, room_id)
 
     def _model_to_entity(self, room_model: RoomModel) -> Room:
         """Convert Django model to domain entity"""
@@ -0,0 +1,109 @@
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from django.db import models
+from django.db.models.functions import ExtractIsoWeekDay
+
+from ...models import BookingDailyRollup as RollupModel
+from ...application.repositories.utilization_repository_interface import (
+    UtilizationRepositoryInterface,
+)
+from . import booking_rollup
+
+
+class DjangoUtilizationRepository(UtilizationRepositoryInterface):
+    """
+    Django implementation of UtilizationRepositoryInterface
+
+    Reads only the ``booking_daily_rollup`` table (joined to rooms for the
+    location filter), never the bookings themselves.
+    """
+
+    def get_room_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        hour_from: int = 0,
+        hour_to: int = 24,
+        location_id: Optional[str] = None,
+        room_id: Optional[str] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """Booked minutes and coffee servings per room"""
+        rows = (
+            self._filtered_queryset(
+                start_date, end_date, hour_from, hour_to, location_id, room_id
+            )
+            .values("room_id")
+            .annotate(**self._totals())
+            .order_by()
+        )
+        return {
+            str(row["room_id"]): {
+                "booked_minutes": row["booked_minutes"],
+                "coffee_servings": row["coffee_servings"],
+            }
+            for row in rows
+        }
+
+    def get_hour_of_week_totals(
+        self,
+        start_date: date,
+        end_date: date,
+        hour_from: int = 0,
+        hour_to: int = 24,
+        location_id: Optional[str] = None,
+        room_id: Optional[str] = None,
+    ) -> Dict[Tuple[int, int], Dict[str, int]]:
+        """Booked minutes and coffee servings per (ISO weekday, hour)"""
+        rows = (
+            self._filtered_queryset(
+                start_date, end_date, hour_from, hour_to, location_id, room_id
+            )
+            .annotate(weekday=ExtractIsoWeekDay("date"))
+            .values("weekday", "hour")
+            .annotate(**self._totals())
+            .order_by()
+        )
+        return {
+            (row["weekday"], row["hour"]): {
+                "booked_minutes": row["booked_minutes"],
+                "coffee_servings": row["coffee_servings"],
+            }
+            for row in rows
+        }
+
+    def rebuild(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> int:
+        """Recompute the rollup rows from the active bookings"""
+        return booking_rollup.rebuild(start_date, end_date)
+
+    @staticmethod
+    def _filtered_queryset(
+        start_date: date,
+        end_date: date,
+        hour_from: int,
+        hour_to: int,
+        location_id: Optional[str],
+        room_id: Optional[str],
+    ):
+        """Rollup rows of active rooms in the date and hour range"""
+        queryset = RollupModel.objects.filter(
+            date__gte=start_date,
+            date__lte=end_date,
+            hour__gte=hour_from,
+            hour__lt=hour_to,
+            room__deleted_at__isnull=True,
+        )
+        if location_id:
+            queryset = queryset.filter(room__location_id=location_id)
+        if room_id:
+            queryset = queryset.filter(room_id=room_id)
+        return queryset
+
+    @staticmethod
+    def _totals() -> Dict[str, models.Aggregate]:
+        return {
+            "booked_minutes": models.Sum("booked_minutes"),
+            "coffee_servings": models.Sum("coffee_servings"),
+        }
@@ -0,0 +1,38 @@
+"""
+Identity map shared by the repositories of one unit of work
+
+Holds at most one loaded entity per ``(entity type, id)`` so repeated
+``get_by_id`` calls within a request are answered from memory and every
+caller sees the same object. Writes go through the repositories, which
+refresh or evict the affected entries.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+
+class IdentityMap:
+    """Entities keyed by (entity type, id)"""
+
+    def __init__(self):
+        self._entities: Dict[Tuple[type, str], Any] = {}
+
+    def get(self, entity_type: type, entity_id) -> Optional[Any]:
+        """Return the loaded entity, or None if it is not in the map"""
+        if entity_id is None:
+            return None
+        return self._entities.get((entity_type, str(entity_id)))
+
+    def add(self, entity) -> None:
+        """Remember an entity loaded or written during the unit of work"""
+        if entity is not None:
+            self._entities[(type(entity), str(entity.id))] = entity
+
+    def remove(self, entity_type: type, entity_id) -> None:
+        """Forget an entity (e.g. after a soft delete)"""
+        self._entities.pop((entity_type, str(entity_id)), None)
+
+    def clear(self) -> None:
+        self._entities.clear()
+
+    def __len__(self) -> int:
+        return len(self._entities)
@@ -0,0 +1,74 @@
+"""
+Keyset (cursor) pagination helpers shared by the Django repositories
+
+A cursor is an opaque, URL-safe token encoding the sort key of the last row
+of the previous page: ``(ordering_value, id)``. The next page is fetched
+with ``WHERE (field, id) > (value, id)`` on an ``ORDER BY field, id`` query,
+so every page costs the same regardless of how deep the client is.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from django.db.models import Model, Q, QuerySet
+from django.utils.dateparse import parse_datetime
+
+
+def encode_cursor(value: Any, object_id: str) -> str:
+    """Build an opaque cursor from a sort value and a row ID"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([value, object_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor, raising ValueError if invalid
+
+    Every list is ordered by a datetime column, so anything other than a
+    ``[datetime string, id string]`` pair is a tampered cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, object_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(value, str) or not isinstance(object_id, str):
+        raise ValueError("Invalid cursor")
+    try:
+        parsed = parse_datetime(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValueError("Invalid cursor")
+    return parsed, object_id
+
+
+def keyset_page(
+    queryset: QuerySet, ordering_field: str, cursor: Optional[str], limit: int
+) -> Tuple[List[Model], Optional[str]]:
+    """
+    Return one page of ``queryset`` ordered by ``(ordering_field, id)``
+    together with the cursor of the next page (None on the last page)
+    """
+    queryset = queryset.order_by(ordering_field, "id")
+
+    if cursor:
+        value, object_id = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(**{f"{ordering_field}__gt": value})
+            | Q(**{ordering_field: value, "id__gt": object_id})
+        )
+
+    rows = list(queryset[: limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, ordering_field), str(last.id))
@@ -0,0 +1,128 @@
+"""
+Shared cache of serialized list and detail reads
+
+The list and detail endpoints of locations, rooms and managers answer from
+Django's cache framework (``settings.READ_CACHE["ALIAS"]``, locmem unless a
+shared backend is configured). Each read caches two parts under the same
+key: the response body and its conditional GET validators, so a 304 never
+needs the body.
+
+Keys embed version counters instead of being deleted on writes:
+
+- ``read:v:<entity>``: bumped by every create, update and delete of the
+  entity type, retiring all of its cached lists at once
+- ``read:v:<entity>:<id>``: bumped by updates and deletes of one row,
+  retiring its cached detail
+
+The repositories bump the counters right away and once more when the
+transaction commits, so a reader that filled an entry from the
+pre-commit state during the transaction is retired as well. Counters start
+from the clock, so a counter evicted by the backend never comes back at a
+value older entries were stored under.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from .. import metrics
+
+DEFAULT_SETTINGS = {
+    "ENABLED": True,
+    "ALIAS": "default",
+    "TIMEOUT": 300,
+}
+
+
+def _cache_settings() -> Dict[str, Any]:
+    """Read READ_CACHE from settings, filling in defaults"""
+    return {**DEFAULT_SETTINGS, **getattr(settings, "READ_CACHE", {})}
+
+
+class ReadCache:
+    """Versioned cache of List*/Get* use case results per entity type"""
+
+    @property
+    def enabled(self) -> bool:
+        return bool(_cache_settings()["ENABLED"])
+
+    @property
+    def cache(self):
+        return caches[_cache_settings()["ALIAS"]]
+
+    def list_key(self, entity: str, filters: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Current key of a list read with the given filters (None if disabled)"""
+        if not self.enabled:
+            return None
+        digest = hashlib.md5(
+            json.dumps(filters or {}, sort_keys=True, default=str).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        version = self._version(self._version_key(entity))
+        return f"read:{entity}:list:{version}:{digest}"
+
+    def item_key(self, entity: str, entity_id: str) -> Optional[str]:
+        """Current key of a detail read (None if disabled)"""
+        if not self.enabled:
+            return None
+        version = self._version(self._version_key(entity, entity_id))
+        return f"read:{entity}:{entity_id}:{version}"
+
+    def fetch(self, key: Optional[str], part: str, producer: Callable[[], Any]) -> Any:
+        """
+        Cached part ("body" or "validators") of a read, produced on a miss.
+        None results (not found) are not cached; a None key bypasses the
+        cache.
+        """
+        if key is None:
+            return producer()
+
+        cache = self.cache
+        value = cache.get(f"{key}:{part}")
+        metrics.cache_lookup(key, part, value is not None)
+        if value is None:
+            value = producer()
+            if value is not None:
+                cache.set(f"{key}:{part}", value, _cache_settings()["TIMEOUT"])
+        return value
+
+    def invalidate(self, entity: str, entity_id: Optional[str] = None) -> None:
+        """
+        Retire the cached lists of an entity type and, given an id, the
+        cached detail of that row, now and again when the current
+        transaction commits
+        """
+        self._bump(entity, entity_id)
+        transaction.on_commit(lambda: self._bump(entity, entity_id))
+
+    def _bump(self, entity: str, entity_id: Optional[str]) -> None:
+        keys = [self._version_key(entity)]
+        if entity_id is not None:
+            keys.append(self._version_key(entity, entity_id))
+
+        cache = self.cache
+        for key in keys:
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Counter missing (never read or evicted): nothing cached
+                # under it can be served once it restarts from the clock
+                cache.set(key, time.time_ns(), None)
+
+    def _version(self, key: str) -> int:
+        return self.cache.get_or_set(key, time.time_ns, None)
+
+    @staticmethod
+    def _version_key(entity: str, entity_id: Optional[str] = None) -> str:
+        if entity_id is None:
+            return f"read:v:{entity}"
+        return f"read:v:{entity}:{entity_id}"
+
+
+# Process-wide instance used by the repositories and viewsets
+read_cache = ReadCache()
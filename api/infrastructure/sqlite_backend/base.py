@@ -0,0 +1,22 @@
+"""
+SQLite backend that can open transactions with ``BEGIN IMMEDIATE``
+
+Django 4.2 always starts SQLite transactions with a deferred ``BEGIN``: the
+write lock is only requested at the first write, and when another
+connection already holds it SQLite fails the transaction with "database is
+locked" at once instead of waiting out ``busy_timeout``. Transactions opened
+while ``begin_immediate`` is set take the write lock up front, so
+concurrent writers queue on ``busy_timeout`` instead (see
+``api/infrastructure/sqlite_tuning.py``).
+"""
+
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.begin_immediate = False
+
+    def _start_transaction_under_autocommit(self):
+        self.cursor().execute("BEGIN IMMEDIATE" if self.begin_immediate else "BEGIN")
@@ -0,0 +1,124 @@
+"""
+Tuned SQLite profile for single-node deployments
+
+``configure_connection`` runs on every new SQLite connection
+(``connection_created``) and applies ``settings.SQLITE_TUNING``:
+
+- ``journal_mode=WAL``: readers no longer wait for the writer, and the
+  writer no longer waits for readers
+- ``synchronous=NORMAL``: fsync at checkpoints instead of every commit; a
+  power loss may drop the last commits, never corrupt the file
+- ``busy_timeout``: how long a writer waits for the lock before failing
+- ``mmap_size``, ``cache_size`` (negative = KiB), ``temp_store=MEMORY``
+
+The profile is off unless ``SQLITE_TUNING`` is set, which
+``gunicorn.conf.py`` does for the server: WAL is recorded in the database
+file, so management commands must not switch it on.
+
+``immediate_atomic`` wraps write transactions that read before they write
+(the booking repository's writes) so they take the write lock with
+``BEGIN IMMEDIATE`` when they start. A deferred transaction that has
+already read cannot wait for the lock and fails with "database is locked"
+when another connection writes first. Keep these transactions short: the
+lock is held until they end.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.backends.signals import connection_created
+
+DEFAULT_SETTINGS = {
+    "ENABLED": False,
+    "JOURNAL_MODE": "WAL",
+    "SYNCHRONOUS": "NORMAL",
+    "BUSY_TIMEOUT_MS": 5000,
+    "MMAP_SIZE": 256 * 1024 * 1024,
+    "CACHE_SIZE": -16384,
+    "TEMP_STORE": "MEMORY",
+    "IMMEDIATE_WRITES": True,
+}
+
+
+# One writer at a time per database alias and process: threads queue here
+# instead of polling SQLite's busy handler (which sleeps in growing steps);
+# busy_timeout then only arbitrates between processes
+_write_locks: Dict[str, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+
+def _write_lock(alias: str) -> threading.Lock:
+    with _write_locks_guard:
+        return _write_locks.setdefault(alias, threading.Lock())
+
+
+def _tuning_settings() -> Dict[str, Any]:
+    """Read SQLITE_TUNING from settings, filling in defaults"""
+    return {**DEFAULT_SETTINGS, **getattr(settings, "SQLITE_TUNING", {})}
+
+
+def pragmas() -> Dict[str, Any]:
+    """PRAGMA name -> value applied to new connections (empty if disabled)"""
+    tuning = _tuning_settings()
+    if not tuning["ENABLED"]:
+        return {}
+    return {
+        "journal_mode": tuning["JOURNAL_MODE"],
+        "synchronous": tuning["SYNCHRONOUS"],
+        "busy_timeout": tuning["BUSY_TIMEOUT_MS"],
+        "mmap_size": tuning["MMAP_SIZE"],
+        "cache_size": tuning["CACHE_SIZE"],
+        "temp_store": tuning["TEMP_STORE"],
+    }
+
+
+def configure_connection(sender, connection, **kwargs) -> None:
+    """connection_created receiver applying the PRAGMAs to SQLite connections"""
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas().items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def install() -> None:
+    """Connect the receiver (idempotent)"""
+    connection_created.connect(
+        configure_connection, dispatch_uid="sqlite_tuning.configure_connection"
+    )
+
+
+@contextmanager
+def immediate_atomic(using: str = DEFAULT_DB_ALIAS):
+    """
+    ``transaction.atomic()`` that starts with ``BEGIN IMMEDIATE`` on SQLite
+
+    Only the outermost block opens a transaction (holding this process's
+    write lock until it ends), so inside an existing one this is a plain
+    savepoint. Other databases, backends other than
+    ``api.infrastructure.sqlite_backend`` and a disabled profile get a plain
+    ``atomic()``.
+    """
+    connection = connections[using]
+    tuning = _tuning_settings()
+    if not (
+        tuning["ENABLED"]
+        and tuning["IMMEDIATE_WRITES"]
+        and hasattr(connection, "begin_immediate")
+        and not connection.in_atomic_block
+    ):
+        with transaction.atomic(using=using):
+            yield
+        return
+
+    with _write_lock(using):
+        connection.begin_immediate = True
+        try:
+            with transaction.atomic(using=using):
+                connection.begin_immediate = False
+                yield
+        finally:
+            connection.begin_immediate = False
@@ -0,0 +1,54 @@
+"""
+Request-scoped unit of work for the Django repositories
+"""
+
+from contextlib import contextmanager
+
+from django.db import transaction
+
+from .repositories.django_booking_repository import DjangoBookingRepository
+from .repositories.django_location_repository import DjangoLocationRepository
+from .repositories.django_manager_repository import DjangoManagerRepository
+from .repositories.django_room_repository import DjangoRoomRepository
+from .repositories.django_utilization_repository import DjangoUtilizationRepository
+from .repositories.identity_map import IdentityMap
+from .sqlite_tuning import immediate_atomic
+
+
+class DjangoUnitOfWork:
+    """
+    Owns one repository per aggregate, all sharing a single identity map,
+    and the transaction boundary for the writes of a request
+
+    Create one per request (ViewSets are instantiated per request) and hand
+    its repositories to use cases and domain services, so a row fetched by
+    one of them is not fetched again by the next.
+    """
+
+    def __init__(self):
+        self.identity_map = IdentityMap()
+        self.bookings = DjangoBookingRepository(identity_map=self.identity_map)
+        self.rooms = DjangoRoomRepository(identity_map=self.identity_map)
+        self.managers = DjangoManagerRepository(identity_map=self.identity_map)
+        self.locations = DjangoLocationRepository(identity_map=self.identity_map)
+        # Read side of the pre-aggregated utilization (no entities to map)
+        self.utilization = DjangoUtilizationRepository()
+
+    @contextmanager
+    def atomic(self, immediate: bool = False):
+        """
+        Run the enclosed writes in one transaction. The identity map is
+        cleared if the transaction is rolled back, since the entities it
+        holds may no longer match the database.
+
+        ``immediate`` takes SQLite's write lock when the transaction starts,
+        for writes that read first (see ``sqlite_tuning.immediate_atomic``).
+        """
+        try:
+            with immediate_atomic() if immediate else transaction.atomic():
+                yield self
+                if transaction.get_rollback():
+                    self.identity_map.clear()
+        except Exception:
+            self.identity_map.clear()
+            raise
@@ -0,0 +1,60 @@
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+from rest_framework.decorators import action
+
+from ...application.use_cases.analytics_use_cases import GetUtilizationUseCase
+from ...application.dto.analytics_dto import UtilizationInputDTO
+from .metrics import MetricsMixin
+from .profiling import ProfilingMixin
+from .unit_of_work import UnitOfWorkMixin
+from ..unit_of_work import DjangoUnitOfWork
+
+
+class AnalyticsViewSet(MetricsMixin, ProfilingMixin, UnitOfWorkMixin, viewsets.ViewSet):
+    """
+    ViewSet for read-only analytics using Clean Architecture
+
+    Figures are read from pre-aggregated tables, never from raw bookings.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.unit_of_work = DjangoUnitOfWork()
+
+        # Initialize use cases
+        self.utilization_use_case = GetUtilizationUseCase(
+            self.unit_of_work.rooms,
+            self.unit_of_work.locations,
+            self.unit_of_work.utilization,
+        )
+
+    @action(detail=False, methods=["get"])
+    def utilization(self, request):
+        """Occupancy per location, room or hour of the week over a date range"""
+        try:
+            input_dto = UtilizationInputDTO(data=request.query_params)
+            if not input_dto.is_valid():
+                return Response(
+                    {"errors": input_dto.errors}, status=status.HTTP_400_BAD_REQUEST
+                )
+            params = input_dto.validated_data
+
+            result = self.utilization_use_case.execute(
+                params["start_date"],
+                params["end_date"],
+                group_by=params["group_by"],
+                location_id=params.get("location_id"),
+                room_id=params.get("room_id"),
+                hour_from=params["hour_from"],
+                hour_to=params["hour_to"],
+            )
+
+            return Response(result, status=status.HTTP_200_OK)
+
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -1,21 +1,71 @@
+import itertools
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
 from ...application.use_cases.booking_use_cases import (
     CreateBookingUseCase,
+    BulkCreateBookingsUseCase,
     UpdateBookingUseCase,
     CancelBookingUseCase,
     ListBookingsUseCase,
+    ExportBookingsUseCase,
     GetBookingUseCase,
 )
-from ...application.dto.booking_dto import BookingInputDTO, BookingOutputDTO
-from ..repositories.django_booking_repository import DjangoBookingRepository
-from ..repositories.django_room_repository import DjangoRoomRepository
-from ..repositories.django_manager_repository import DjangoManagerRepository
-
-
-class BookingViewSet(viewsets.ViewSet):
+from ...application.dto.booking_dto import (
+    BookingInputDTO,
+    BookingOutputDTO,
+    BulkBookingInputDTO,
+)
+from ...domain.entities.recurrence import RecurrenceRule
+from .conditional import conditional_get, item_validators, list_validators
+from .pagination import get_page_params, paginated_payload
+from .read_model import read_model_enabled
+from .metrics import MetricsMixin
+from .profiling import ProfilingMixin
+from .unit_of_work import UnitOfWorkMixin
+from ..renderers import dumps
+from ..unit_of_work import DjangoUnitOfWork
+
+EXPORT_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+def _ndjson_chunks(rows, rows_per_chunk: int):
+    """Serialize rows as newline-delimited JSON, one buffer per chunk"""
+    buffer = []
+    for row in rows:
+        buffer.append(dumps(row))
+        if len(buffer) >= rows_per_chunk:
+            yield b"\n".join(buffer) + b"\n"
+            buffer = []
+    if buffer:
+        yield b"\n".join(buffer) + b"\n"
+
+
+def _json_array_chunks(rows, rows_per_chunk: int):
+    """Serialize rows as a single JSON array emitted in chunks"""
+    yield b"["
+    separator = b""
+    buffer = []
+    for row in rows:
+        buffer.append(dumps(row))
+        if len(buffer) >= rows_per_chunk:
+            yield separator + b",".join(buffer)
+            separator = b","
+            buffer = []
+    if buffer:
+        yield separator + b",".join(buffer)
+    yield b"]"
+
+
+class BookingViewSet(MetricsMixin, ProfilingMixin, UnitOfWorkMixin, viewsets.ViewSet):
     """
     ViewSet for Booking operations using Clean Architecture
 
@@ -23,33 +73,71 @@ class BookingViewSet(viewsets.ViewSet):
     No business rules are implemented here - only request/response handling.
     """
 
+    immediate_writes = True
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.booking_repository = DjangoBookingRepository()
-        self.room_repository = DjangoRoomRepository()
-        self.manager_repository = DjangoManagerRepository()
+        self.unit_of_work = DjangoUnitOfWork()
+        self.booking_repository = self.unit_of_work.bookings
+        self.room_repository = self.unit_of_work.rooms
+        self.manager_repository = self.unit_of_work.managers
 
         self.create_use_case = CreateBookingUseCase(
             self.booking_repository, self.room_repository, self.manager_repository
         )
+        self.bulk_create_use_case = BulkCreateBookingsUseCase(
+            self.booking_repository, self.room_repository, self.manager_repository
+        )
         self.update_use_case = UpdateBookingUseCase(
             self.booking_repository, self.room_repository, self.manager_repository
         )
         self.cancel_use_case = CancelBookingUseCase(self.booking_repository)
-        self.list_use_case = ListBookingsUseCase(self.booking_repository)
+        self.list_use_case = ListBookingsUseCase(
+            self.booking_repository,
+            use_read_model=read_model_enabled(ListBookingsUseCase),
+        )
+        self.export_use_case = ExportBookingsUseCase(self.booking_repository)
         self.get_use_case = GetBookingUseCase(self.booking_repository)
 
     def create(self, request):
         """Create a new booking"""
         try:
 
-            input_dto = BookingInputDTO(data=request.data)
+            input_dto = BookingInputDTO(
+                data=request.data, context=self._input_context()
+            )
             if not input_dto.is_valid():
                 return Response(
                     {"errors": input_dto.errors}, status=status.HTTP_400_BAD_REQUEST
                 )
 
-            booking = self.create_use_case.execute(input_dto.validated_data)
+            booking_data = dict(input_dto.validated_data)
+            recurrence = booking_data.pop("recurrence", None)
+            if recurrence is not None:
+                with self.unit_of_work.atomic(immediate=True):
+                    bookings = self.create_use_case.execute_recurring(
+                        booking_data,
+                        RecurrenceRule(**recurrence),
+                        room=input_dto.resolved.get("room"),
+                        manager=input_dto.resolved.get("manager"),
+                    )
+                return Response(
+                    {
+                        "series_id": bookings[0].series_id,
+                        "count": len(bookings),
+                        "bookings": [
+                            BookingOutputDTO(booking).to_dict() for booking in bookings
+                        ],
+                    },
+                    status=status.HTTP_201_CREATED,
+                )
+
+            with self.unit_of_work.atomic(immediate=True):
+                booking = self.create_use_case.execute(
+                    booking_data,
+                    room=input_dto.resolved.get("room"),
+                    manager=input_dto.resolved.get("manager"),
+                )
 
             output_dto = BookingOutputDTO(booking)
             return Response(output_dto.to_dict(), status=status.HTTP_201_CREATED)
@@ -62,49 +150,137 @@ class BookingViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-    def list(self, request):
-        """List all bookings"""
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """Create many bookings at once, reporting a result per item"""
         try:
+            bulk_dto = BulkBookingInputDTO(data=request.data)
+            if not bulk_dto.is_valid():
+                return Response(
+                    {"errors": bulk_dto.errors}, status=status.HTTP_400_BAD_REQUEST
+                )
+            items = bulk_dto.validated_data["items"]
+            mode = bulk_dto.validated_data["mode"]
 
-            filters = {}
-            if request.query_params.get("room") or request.query_params.get("room_id"):
-                filters["room_id"] = request.query_params.get(
-                    "room"
-                ) or request.query_params.get("room_id")
+            # The bulk use case creates one booking per item; a recurring
+            # item would silently lose its other occurrences
+            if any("recurrence" in item for item in items):
+                return Response(
+                    {
+                        "error": "Recurrence is not supported in bulk requests; "
+                        "create recurring bookings with POST /api/bookings/"
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
-            if request.query_params.get("manager") or request.query_params.get(
-                "manager_id"
-            ):
-                filters["manager_id"] = request.query_params.get(
-                    "manager"
-                ) or request.query_params.get("manager_id")
+            # 1. Validate each item; rooms and managers are resolved in batch
+            # by the use case
+            results = [None] * len(items)
+            valid_indexes, valid_items = [], []
+            for index, item in enumerate(items):
+                item_dto = BookingInputDTO(
+                    data=item, context={"check_references": False}
+                )
+                if item_dto.is_valid():
+                    valid_indexes.append(index)
+                    valid_items.append(item_dto.validated_data)
+                else:
+                    results[index] = {
+                        "index": index,
+                        "status": "error",
+                        "errors": item_dto.errors,
+                    }
+
+            # 2. Execute use case
+            if len(valid_items) < len(items) and mode == "all_or_nothing":
+                outcomes = [
+                    {
+                        "index": position,
+                        "error": BulkCreateBookingsUseCase.SKIPPED_ERROR,
+                    }
+                    for position in range(len(valid_items))
+                ]
+            elif valid_items:
+                with self.unit_of_work.atomic(immediate=True):
+                    outcomes = self.bulk_create_use_case.execute(valid_items, mode)
+            else:
+                outcomes = []
+
+            for outcome in outcomes:
+                index = valid_indexes[outcome["index"]]
+                if "booking" in outcome:
+                    results[index] = {
+                        "index": index,
+                        "status": "created",
+                        "booking": BookingOutputDTO(outcome["booking"]).to_dict(),
+                    }
+                else:
+                    results[index] = {
+                        "index": index,
+                        "status": "error",
+                        "error": outcome["error"],
+                    }
+
+            # 3. 201 if everything was created, 207 on partial success
+            created = sum(1 for result in results if result["status"] == "created")
+            if created == len(items):
+                response_status = status.HTTP_201_CREATED
+            elif created:
+                response_status = status.HTTP_207_MULTI_STATUS
+            else:
+                response_status = status.HTTP_400_BAD_REQUEST
 
-            if request.query_params.get("start_date_from") or request.query_params.get(
-                "start_date"
-            ):
-                filters["start_date_from"] = request.query_params.get(
-                    "start_date_from"
-                ) or request.query_params.get("start_date")
+            return Response(
+                {
+                    "mode": mode,
+                    "created": created,
+                    "failed": len(items) - created,
+                    "results": results,
+                },
+                status=response_status,
+            )
 
-            if request.query_params.get("start_date_to") or request.query_params.get(
-                "end_date"
-            ):
-                filters["start_date_to"] = request.query_params.get(
-                    "start_date_to"
-                ) or request.query_params.get("end_date")
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
 
-            if request.query_params.get("coffee_option"):
-                filters["coffee_option"] = (
-                    request.query_params.get("coffee_option").lower() == "true"
-                )
+    def list(self, request):
+        """List all bookings"""
+        try:
 
-            bookings = self.list_use_case.execute(filters if filters else None)
+            filters = self._get_list_filters(request)
 
-            output_dtos = [BookingOutputDTO(booking) for booking in bookings]
-            return Response(
-                [dto.to_dict() for dto in output_dtos], status=status.HTTP_200_OK
+            page_params = get_page_params(request)
+            if page_params is not None:
+                cursor, limit = page_params
+                bookings, next_cursor = self.list_use_case.execute_page(
+                    cursor, limit, filters if filters else None
+                )
+                return Response(
+                    paginated_payload(
+                        [BookingOutputDTO(booking).to_dict() for booking in bookings],
+                        next_cursor,
+                    ),
+                    status=status.HTTP_200_OK,
+                )
+
+            # Bookings are not in read_cache: validators cost one aggregate
+            return conditional_get(
+                request,
+                lambda: list_validators(
+                    *self.list_use_case.execute_stamp(filters if filters else None)
+                ),
+                lambda: self.list_use_case.execute_serialized(
+                    filters if filters else None
+                ),
             )
 
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response(
                 {"error": "Internal server error"},
@@ -115,15 +291,18 @@ class BookingViewSet(viewsets.ViewSet):
         """Get a specific booking"""
         try:
             # 1. Execute use case
-            booking = self.get_use_case.execute(pk)
+            response = conditional_get(
+                request,
+                lambda: item_validators(pk, self.get_use_case.execute_stamp(pk)),
+                lambda: self._get_dict(pk),
+            )
 
-            if not booking:
+            if response is None:
                 return Response(
                     {"error": "Booking not found"}, status=status.HTTP_404_NOT_FOUND
                 )
 
-            output_dto = BookingOutputDTO(booking)
-            return Response(output_dto.to_dict(), status=status.HTTP_200_OK)
+            return response
 
         except Exception as e:
             return Response(
@@ -131,17 +310,33 @@ class BookingViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def _get_dict(self, pk):
+        """Output dictionary of a booking, or None when it does not exist"""
+        booking = self.get_use_case.execute(pk)
+        return BookingOutputDTO(booking).to_dict() if booking else None
+
     def update(self, request, pk=None):
         """Update a booking"""
         try:
 
-            input_dto = BookingInputDTO(data=request.data, partial=True)
+            input_dto = BookingInputDTO(
+                data=request.data, partial=True, context=self._input_context()
+            )
             if not input_dto.is_valid():
                 return Response(
                     {"errors": input_dto.errors}, status=status.HTTP_400_BAD_REQUEST
                 )
 
-            booking = self.update_use_case.execute(pk, input_dto.validated_data)
+            if "recurrence" in input_dto.validated_data:
+                return Response(
+                    {"error": "Recurrence can only be set when creating a booking"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            with self.unit_of_work.atomic(immediate=True):
+                booking = self.update_use_case.execute(
+                    pk, input_dto.validated_data, room=input_dto.resolved.get("room")
+                )
 
             output_dto = BookingOutputDTO(booking)
             return Response(output_dto.to_dict(), status=status.HTTP_200_OK)
@@ -162,7 +357,8 @@ class BookingViewSet(viewsets.ViewSet):
         """Cancel (soft delete) a booking"""
         try:
             # 1. Execute use case
-            success = self.cancel_use_case.execute(pk)
+            with self.unit_of_work.atomic(immediate=True):
+                success = self.cancel_use_case.execute(pk)
 
             if success:
                 return Response(
@@ -182,6 +378,58 @@ class BookingViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        Stream bookings as NDJSON (default) or as a chunked JSON array
+
+        The query runs and the first chunk is serialized before the response
+        is returned, so invalid filters answer 400 and database errors 500.
+        An error after that can only abort the stream: the connection is
+        dropped before the final chunk, which clients see as an incomplete
+        transfer (and, for ``json``, as an unterminated array).
+        """
+        try:
+            output = request.query_params.get("output", "ndjson")
+            if output not in EXPORT_CONTENT_TYPES:
+                return Response(
+                    {"error": "output must be 'ndjson' or 'json'"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            filters = self._get_list_filters(request)
+            chunk_size = getattr(settings, "BOOKING_EXPORT_CHUNK_SIZE", 2000)
+            rows = self.export_use_case.execute(
+                filters if filters else None, chunk_size
+            )
+
+            if output == "ndjson":
+                content = _ndjson_chunks(rows, chunk_size)
+            else:
+                content = _json_array_chunks(rows, chunk_size)
+            first_chunk = next(content, b"")
+
+            response = StreamingHttpResponse(
+                itertools.chain((first_chunk,), content),
+                content_type=EXPORT_CONTENT_TYPES[output],
+            )
+            response["Content-Disposition"] = (
+                f'attachment; filename="bookings.{output}"'
+            )
+            return response
+
+        except DjangoValidationError as e:
+            return Response(
+                {"error": "; ".join(e.messages)}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     @action(detail=False, methods=["get"])
     def by_room(self, request):
         """Get bookings by room"""
@@ -229,3 +477,49 @@ class BookingViewSet(viewsets.ViewSet):
                 {"error": "Internal server error"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    def _input_context(self) -> dict:
+        """Serializer context letting BookingInputDTO resolve room and manager"""
+        return {
+            "room_repository": self.room_repository,
+            "manager_repository": self.manager_repository,
+        }
+
+    def _get_list_filters(self, request) -> dict:
+        """Extract list filters from query parameters"""
+        filters = {}
+        if request.query_params.get("room") or request.query_params.get("room_id"):
+            filters["room_id"] = request.query_params.get(
+                "room"
+            ) or request.query_params.get("room_id")
+
+        if request.query_params.get("manager") or request.query_params.get(
+            "manager_id"
+        ):
+            filters["manager_id"] = request.query_params.get(
+                "manager"
+            ) or request.query_params.get("manager_id")
+
+        if request.query_params.get("start_date_from") or request.query_params.get(
+            "start_date"
+        ):
+            filters["start_date_from"] = request.query_params.get(
+                "start_date_from"
+            ) or request.query_params.get("start_date")
+
+        if request.query_params.get("start_date_to") or request.query_params.get(
+            "end_date"
+        ):
+            filters["start_date_to"] = request.query_params.get(
+                "start_date_to"
+            ) or request.query_params.get("end_date")
+
+        if request.query_params.get("coffee_option"):
+            filters["coffee_option"] = (
+                request.query_params.get("coffee_option").lower() == "true"
+            )
+
+        if request.query_params.get("series_id"):
+            filters["series_id"] = request.query_params.get("series_id")
+
+        return filters
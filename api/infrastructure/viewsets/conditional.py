@@ -0,0 +1,115 @@
+"""
+Conditional GET for list and detail endpoints
+
+Validators are derived from ``updated_at`` alone, so they can be checked
+before anything is loaded or serialized:
+
+- detail: weak ETag of ``(id, updated_at)``
+- list: weak ETag of ``(count, max(updated_at))`` over the filtered rows,
+  read with one aggregate query
+
+A request whose ``If-None-Match`` / ``If-Modified-Since`` still match is
+answered with an empty 304 Not Modified, before any entity conversion or
+serialization. Other responses carry the ETag, Last-Modified and
+``Cache-Control: no-cache``, so clients store them but revalidate every
+time.
+
+Last-Modified has one-second resolution, so a write in the same second as
+the stamp would not change it. It is only sent, and ``If-Modified-Since``
+only honoured, once that second is over; until then the ETag alone
+validates. When both headers are sent, ``If-None-Match`` wins.
+"""
+
+import hashlib
+import time
+from datetime import datetime
+from typing import Any, Callable, NamedTuple, Optional
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+from ..repositories.read_cache import read_cache
+
+
+class Validators(NamedTuple):
+    """ETag and Last-Modified (epoch seconds) of a response"""
+
+    etag: str
+    last_modified: Optional[int]
+
+
+def _validators(key, last_updated: Optional[datetime]) -> Validators:
+    marker = f"{key}:{last_updated.isoformat() if last_updated else ''}"
+    digest = hashlib.md5(marker.encode(), usedforsecurity=False).hexdigest()
+    return Validators(
+        f'W/"{digest}"', int(last_updated.timestamp()) if last_updated else None
+    )
+
+
+def list_validators(count: int, last_updated: Optional[datetime]) -> Validators:
+    """Weak validators of a list from its (count, max(updated_at)) stamp"""
+    return _validators(count, last_updated)
+
+
+def item_validators(
+    entity_id: str, updated_at: Optional[datetime]
+) -> Optional[Validators]:
+    """Weak validators of a row from (id, updated_at); None if not found"""
+    if updated_at is None:
+        return None
+    return _validators(entity_id, updated_at)
+
+
+def conditional_get(
+    request,
+    validators: Callable[[], Optional[Validators]],
+    body: Callable[[], Any],
+    cache_key: Optional[str] = None,
+):
+    """
+    Answer a GET from its validators first: 304 when the client copy is
+    current, otherwise 200 with the body. With a ``read_cache`` key both
+    parts are cached, the validators computed before the body so a body
+    never goes out with validators newer than itself. Returns None when
+    either part is missing (not found).
+    """
+    current = read_cache.fetch(cache_key, "validators", validators)
+    if current is None:
+        return None
+
+    response = not_modified(request, current)
+    if response is not None:
+        return response
+
+    data = read_cache.fetch(cache_key, "body", body)
+    if data is None:
+        return None
+    return with_validators(Response(data, status=status.HTTP_200_OK), current)
+
+
+def settled_last_modified(validators: Validators) -> Optional[int]:
+    """Last-Modified once its second is over (later writes then change it)"""
+    last_modified = validators.last_modified
+    if last_modified is None or time.time() < last_modified + 1:
+        return None
+    return last_modified
+
+
+def not_modified(request, validators: Validators):
+    """304 response when the client copy is current, otherwise None"""
+    response = get_conditional_response(
+        request, etag=validators.etag, last_modified=settled_last_modified(validators)
+    )
+    return with_validators(response, validators) if response is not None else None
+
+
+def with_validators(response, validators: Validators):
+    """Attach the validators and revalidation policy to a response"""
+    response["ETag"] = validators.etag
+    last_modified = settled_last_modified(validators)
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, no_cache=True)
+    return response
@@ -0,0 +1,34 @@
+import time
+
+from django.db import DatabaseError, connections
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+
+from ..connection_stats import connection_stats
+
+
+class HealthViewSet(viewsets.ViewSet):
+    """
+    Liveness of the API and its database, with the connection statistics
+    of the worker process that answered
+    """
+
+    def list(self, request):
+        """Ping the database and report connection / pool figures"""
+        database = connection_stats.snapshot("default")
+        try:
+            started = time.perf_counter()
+            with connections["default"].cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            database["latency_ms"] = round((time.perf_counter() - started) * 1e3, 2)
+        except DatabaseError as e:
+            database["error"] = str(e)
+            return Response(
+                {"status": "unavailable", "database": database},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        return Response(
+            {"status": "ok", "database": database}, status=status.HTTP_200_OK
+        )
@@ -13,10 +13,17 @@ from ...application.use_cases.location_use_cases import (
     GetLocationWithRoomsUseCase,
 )
 from ...application.dto.location_dto import LocationInputDTO, LocationOutputDTO
-from ..repositories.django_location_repository import DjangoLocationRepository
+from .conditional import conditional_get, item_validators, list_validators
+from .pagination import get_page_params, paginated_payload
+from .read_model import read_model_enabled
+from .metrics import MetricsMixin
+from .profiling import ProfilingMixin
+from .unit_of_work import UnitOfWorkMixin
+from ..repositories.read_cache import read_cache
+from ..unit_of_work import DjangoUnitOfWork
 
 
-class LocationViewSet(viewsets.ViewSet):
+class LocationViewSet(MetricsMixin, ProfilingMixin, UnitOfWorkMixin, viewsets.ViewSet):
     """
     ViewSet for Location operations using Clean Architecture
 
@@ -26,13 +33,17 @@ class LocationViewSet(viewsets.ViewSet):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.location_repository = DjangoLocationRepository()
+        self.unit_of_work = DjangoUnitOfWork()
+        self.location_repository = self.unit_of_work.locations
 
         # Initialize use cases
         self.create_use_case = CreateLocationUseCase(self.location_repository)
         self.update_use_case = UpdateLocationUseCase(self.location_repository)
         self.delete_use_case = DeleteLocationUseCase(self.location_repository)
-        self.list_use_case = ListLocationsUseCase(self.location_repository)
+        self.list_use_case = ListLocationsUseCase(
+            self.location_repository,
+            use_read_model=read_model_enabled(ListLocationsUseCase),
+        )
         self.get_use_case = GetLocationUseCase(self.location_repository)
         self.search_use_case = SearchLocationsUseCase(self.location_repository)
         self.get_with_rooms_use_case = GetLocationWithRoomsUseCase(
@@ -122,13 +133,37 @@ class LocationViewSet(viewsets.ViewSet):
             if request.query_params.get("search"):
                 filters["search"] = request.query_params.get("search")
 
-            locations = self.list_use_case.execute(filters if filters else None)
+            page_params = get_page_params(request)
+            if page_params is not None:
+                cursor, limit = page_params
+                locations, next_cursor = self.list_use_case.execute_page(
+                    cursor, limit, filters if filters else None
+                )
+                return Response(
+                    paginated_payload(
+                        [
+                            LocationOutputDTO(location).to_dict()
+                            for location in locations
+                        ],
+                        next_cursor,
+                    ),
+                    status=status.HTTP_200_OK,
+                )
 
-            output_dtos = [LocationOutputDTO(location) for location in locations]
-            return Response(
-                [dto.to_dict() for dto in output_dtos], status=status.HTTP_200_OK
+            response = conditional_get(
+                request,
+                lambda: list_validators(
+                    *self.list_use_case.execute_stamp(filters if filters else None)
+                ),
+                lambda: self.list_use_case.execute_serialized(
+                    filters if filters else None
+                ),
+                read_cache.list_key("location", filters),
             )
+            return response
 
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response(
                 {"error": "Internal server error"},
@@ -138,16 +173,19 @@ class LocationViewSet(viewsets.ViewSet):
     def retrieve(self, request, pk=None):
         """Get a specific location"""
         try:
-            location = self.get_use_case.execute(pk)
+            response = conditional_get(
+                request,
+                lambda: item_validators(pk, self.get_use_case.execute_stamp(pk)),
+                lambda: self._get_dict(pk),
+                read_cache.item_key("location", pk),
+            )
 
-            if not location:
+            if response is None:
                 return Response(
                     {"error": "Location not found"}, status=status.HTTP_404_NOT_FOUND
                 )
 
-            # 2. Return response using DTO
-            output_dto = LocationOutputDTO(location)
-            return Response(output_dto.to_dict(), status=status.HTTP_200_OK)
+            return response
 
         except Exception as e:
             return Response(
@@ -155,6 +193,11 @@ class LocationViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def _get_dict(self, pk):
+        """Output dictionary of a location, or None when it does not exist"""
+        location = self.get_use_case.execute(pk)
+        return LocationOutputDTO(location).to_dict() if location else None
+
     def update(self, request, pk=None):
         """Update a location"""
         try:
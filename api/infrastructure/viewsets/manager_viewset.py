@@ -12,10 +12,17 @@ from ...application.use_cases.manager_use_cases import (
     GetManagerStatsUseCase,
 )
 from ...application.dto.manager_dto import ManagerInputDTO, ManagerOutputDTO
-from ..repositories.django_manager_repository import DjangoManagerRepository
+from .conditional import conditional_get, item_validators, list_validators
+from .pagination import get_page_params, paginated_payload
+from .read_model import read_model_enabled
+from .metrics import MetricsMixin
+from .profiling import ProfilingMixin
+from .unit_of_work import UnitOfWorkMixin
+from ..repositories.read_cache import read_cache
+from ..unit_of_work import DjangoUnitOfWork
 
 
-class ManagerViewSet(viewsets.ViewSet):
+class ManagerViewSet(MetricsMixin, ProfilingMixin, UnitOfWorkMixin, viewsets.ViewSet):
     """
     ViewSet for Manager operations using Clean Architecture
 
@@ -25,13 +32,17 @@ class ManagerViewSet(viewsets.ViewSet):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.manager_repository = DjangoManagerRepository()
+        self.unit_of_work = DjangoUnitOfWork()
+        self.manager_repository = self.unit_of_work.managers
 
         # Initialize use cases
         self.create_use_case = CreateManagerUseCase(self.manager_repository)
         self.update_use_case = UpdateManagerUseCase(self.manager_repository)
         self.delete_use_case = DeleteManagerUseCase(self.manager_repository)
-        self.list_use_case = ListManagersUseCase(self.manager_repository)
+        self.list_use_case = ListManagersUseCase(
+            self.manager_repository,
+            use_read_model=read_model_enabled(ListManagersUseCase),
+        )
         self.get_use_case = GetManagerUseCase(self.manager_repository)
         self.search_use_case = SearchManagersUseCase(self.manager_repository)
         self.stats_use_case = GetManagerStatsUseCase(self.manager_repository)
@@ -115,13 +126,34 @@ class ManagerViewSet(viewsets.ViewSet):
             if request.query_params.get("search"):
                 filters["search"] = request.query_params.get("search")
 
-            managers = self.list_use_case.execute(filters if filters else None)
+            page_params = get_page_params(request)
+            if page_params is not None:
+                cursor, limit = page_params
+                managers, next_cursor = self.list_use_case.execute_page(
+                    cursor, limit, filters if filters else None
+                )
+                return Response(
+                    paginated_payload(
+                        [ManagerOutputDTO(manager).to_dict() for manager in managers],
+                        next_cursor,
+                    ),
+                    status=status.HTTP_200_OK,
+                )
 
-            output_dtos = [ManagerOutputDTO(manager) for manager in managers]
-            return Response(
-                [dto.to_dict() for dto in output_dtos], status=status.HTTP_200_OK
+            response = conditional_get(
+                request,
+                lambda: list_validators(
+                    *self.list_use_case.execute_stamp(filters if filters else None)
+                ),
+                lambda: self.list_use_case.execute_serialized(
+                    filters if filters else None
+                ),
+                read_cache.list_key("manager", filters),
             )
+            return response
 
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response(
                 {"error": "Internal server error"},
@@ -131,15 +163,19 @@ class ManagerViewSet(viewsets.ViewSet):
     def retrieve(self, request, pk=None):
         """Get a specific manager"""
         try:
-            manager = self.get_use_case.execute(pk)
+            response = conditional_get(
+                request,
+                lambda: item_validators(pk, self.get_use_case.execute_stamp(pk)),
+                lambda: self._get_dict(pk),
+                read_cache.item_key("manager", pk),
+            )
 
-            if not manager:
+            if response is None:
                 return Response(
                     {"error": "Manager not found"}, status=status.HTTP_404_NOT_FOUND
                 )
 
-            output_dto = ManagerOutputDTO(manager)
-            return Response(output_dto.to_dict(), status=status.HTTP_200_OK)
+            return response
 
         except Exception as e:
             return Response(
@@ -147,6 +183,11 @@ class ManagerViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def _get_dict(self, pk):
+        """Output dictionary of a manager, or None when it does not exist"""
+        manager = self.get_use_case.execute(pk)
+        return ManagerOutputDTO(manager).to_dict() if manager else None
+
     def update(self, request, pk=None):
         """Update a manager"""
         try:
@@ -0,0 +1,23 @@
+"""
+Request metrics for ViewSet actions (see ``api.infrastructure.metrics``)
+"""
+
+import time
+
+from .. import metrics
+
+
+class MetricsMixin:
+    """Count requests and observe their latency per ViewSet action"""
+
+    def dispatch(self, request, *args, **kwargs):
+        started = time.perf_counter()
+        response = super().dispatch(request, *args, **kwargs)
+        metrics.observe_request(
+            type(self).__name__,
+            self.action_map.get(request.method.lower(), "unknown"),
+            request.method,
+            response.status_code,
+            time.perf_counter() - started,
+        )
+        return response
@@ -0,0 +1,46 @@
+"""
+Cursor pagination helpers for ViewSet list actions
+
+Clients opt in by sending ``?limit=`` and/or ``?cursor=``; the response is
+then ``{"results": [...], "next_cursor": "..."}``. Requests without either
+parameter keep receiving the plain array they always did.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+DEFAULT_SETTINGS = {
+    "DEFAULT_LIMIT": 50,
+    "MAX_LIMIT": 200,
+}
+
+
+def get_page_params(request) -> Optional[Tuple[Optional[str], int]]:
+    """
+    Read cursor and limit from the query string, clamping the limit to the
+    configured maximum. Returns None when pagination was not requested and
+    raises ValueError for a malformed limit.
+    """
+    cursor = request.query_params.get("cursor")
+    limit = request.query_params.get("limit")
+    if cursor is None and limit is None:
+        return None
+
+    config = {**DEFAULT_SETTINGS, **getattr(settings, "API_PAGINATION", {})}
+    if limit is None:
+        limit = config["DEFAULT_LIMIT"]
+    else:
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValueError("limit must be a positive integer")
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+
+    return cursor or None, min(limit, config["MAX_LIMIT"])
+
+
+def paginated_payload(items: List[Dict[str, Any]], next_cursor: Optional[str]) -> dict:
+    """Build the response body of a paginated list"""
+    return {"results": items, "next_cursor": next_cursor}
@@ -0,0 +1,27 @@
+"""
+Profiling hook for ViewSet actions
+
+``ProfilingMixin`` goes right after ``MetricsMixin`` in a ViewSet's bases
+(before ``UnitOfWorkMixin``) so the profile covers the whole action,
+including the unit of work transaction. Whether a request is profiled, and
+how, is decided by ``api.infrastructure.profiling``. The response names the
+profile file in ``X-Profile-Output``, relative to ``PROFILING["OUTPUT_DIR"]``.
+"""
+
+from .. import profiling
+
+
+class ProfilingMixin:
+    """Profile requests selected by ``settings.PROFILING``"""
+
+    def dispatch(self, request, *args, **kwargs):
+        action = self.action_map.get(request.method.lower(), "unknown")
+        endpoint = f"{type(self).__name__}.{action}"
+        mode = profiling.requested_mode(request, endpoint)
+        if mode is None:
+            return super().dispatch(request, *args, **kwargs)
+
+        with profiling.profile(endpoint, mode) as result:
+            response = super().dispatch(request, *args, **kwargs)
+        response["X-Profile-Output"] = result.name
+        return response
@@ -0,0 +1,14 @@
+"""
+Read-model selection for ViewSet list actions
+
+List use cases named in ``settings.READ_MODEL_USE_CASES`` answer from
+``values()`` rows shaped like the output DTOs, skipping the model -> entity
+-> DTO conversion. Responses are identical either way.
+"""
+
+from django.conf import settings
+
+
+def read_model_enabled(use_case_class) -> bool:
+    """Whether the given use case should serve reads from the read model"""
+    return use_case_class.__name__ in getattr(settings, "READ_MODEL_USE_CASES", ())
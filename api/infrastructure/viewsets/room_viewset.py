@@ -14,13 +14,27 @@ from ...application.use_cases.room_use_cases import (
     ListRoomsUseCase,
     GetRoomUseCase,
     CheckRoomAvailabilityUseCase,
+    GetAvailabilityGridUseCase,
+    FindFreeSlotUseCase,
 )
-from ...application.dto.room_dto import RoomInputDTO, RoomOutputDTO
-from ..repositories.django_room_repository import DjangoRoomRepository
-from ..repositories.django_location_repository import DjangoLocationRepository
+from ...application.dto.room_dto import (
+    RoomInputDTO,
+    RoomOutputDTO,
+    AvailabilityGridInputDTO,
+    AvailabilityGridOutputDTO,
+    FindFreeSlotInputDTO,
+)
+from .conditional import conditional_get, item_validators, list_validators
+from .pagination import get_page_params, paginated_payload
+from .read_model import read_model_enabled
+from .metrics import MetricsMixin
+from .profiling import ProfilingMixin
+from .unit_of_work import UnitOfWorkMixin
+from ..repositories.read_cache import read_cache
+from ..unit_of_work import DjangoUnitOfWork
 
 
-class RoomViewSet(viewsets.ViewSet):
+class RoomViewSet(MetricsMixin, ProfilingMixin, UnitOfWorkMixin, viewsets.ViewSet):
     """
     ViewSet for Room operations using Clean Architecture
 
@@ -30,8 +44,9 @@ class RoomViewSet(viewsets.ViewSet):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.room_repository = DjangoRoomRepository()
-        self.location_repository = DjangoLocationRepository()
+        self.unit_of_work = DjangoUnitOfWork()
+        self.room_repository = self.unit_of_work.rooms
+        self.location_repository = self.unit_of_work.locations
 
         # Initialize use cases
         self.create_use_case = CreateRoomUseCase(
@@ -41,9 +56,19 @@ class RoomViewSet(viewsets.ViewSet):
             self.room_repository, self.location_repository
         )
         self.delete_use_case = DeleteRoomUseCase(self.room_repository)
-        self.list_use_case = ListRoomsUseCase(self.room_repository)
+        self.list_use_case = ListRoomsUseCase(
+            self.room_repository, use_read_model=read_model_enabled(ListRoomsUseCase)
+        )
         self.get_use_case = GetRoomUseCase(self.room_repository)
-        self.availability_use_case = CheckRoomAvailabilityUseCase(self.room_repository)
+        self.availability_use_case = CheckRoomAvailabilityUseCase(
+            self.room_repository, self.unit_of_work.bookings
+        )
+        self.availability_grid_use_case = GetAvailabilityGridUseCase(
+            self.room_repository, self.unit_of_work.bookings
+        )
+        self.find_free_slot_use_case = FindFreeSlotUseCase(
+            self.room_repository, self.unit_of_work.bookings
+        )
 
     @action(detail=False, methods=["post"], url_path="get-or-create-default")
     def get_or_create_default(self, request):
@@ -156,14 +181,35 @@ class RoomViewSet(viewsets.ViewSet):
                     pass
 
             # 2. Execute use case
-            rooms = self.list_use_case.execute(filters if filters else None)
+            page_params = get_page_params(request)
+            if page_params is not None:
+                cursor, limit = page_params
+                rooms, next_cursor = self.list_use_case.execute_page(
+                    cursor, limit, filters if filters else None
+                )
+                return Response(
+                    paginated_payload(
+                        [RoomOutputDTO(room).to_dict() for room in rooms], next_cursor
+                    ),
+                    status=status.HTTP_200_OK,
+                )
 
-            # 3. Return response using DTOs
-            output_dtos = [RoomOutputDTO(room) for room in rooms]
-            return Response(
-                [dto.to_dict() for dto in output_dtos], status=status.HTTP_200_OK
+            response = conditional_get(
+                request,
+                lambda: list_validators(
+                    *self.list_use_case.execute_stamp(filters if filters else None)
+                ),
+                lambda: self.list_use_case.execute_serialized(
+                    filters if filters else None
+                ),
+                read_cache.list_key("room", filters),
             )
 
+            # 3. Return response (already shaped like RoomOutputDTO)
+            return response
+
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response(
                 {"error": "Internal server error"},
@@ -173,15 +219,19 @@ class RoomViewSet(viewsets.ViewSet):
     def retrieve(self, request, pk=None):
         """Get a specific room"""
         try:
-            room = self.get_use_case.execute(pk)
+            response = conditional_get(
+                request,
+                lambda: item_validators(pk, self.get_use_case.execute_stamp(pk)),
+                lambda: self._get_dict(pk),
+                read_cache.item_key("room", pk),
+            )
 
-            if not room:
+            if response is None:
                 return Response(
                     {"error": "Room not found"}, status=status.HTTP_404_NOT_FOUND
                 )
 
-            output_dto = RoomOutputDTO(room)
-            return Response(output_dto.to_dict(), status=status.HTTP_200_OK)
+            return response
 
         except Exception as e:
             return Response(
@@ -189,6 +239,11 @@ class RoomViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    def _get_dict(self, pk):
+        """Output dictionary of a room, or None when it does not exist"""
+        room = self.get_use_case.execute(pk)
+        return RoomOutputDTO(room).to_dict() if room else None
+
     def update(self, request, pk=None):
         """Update a room"""
         try:
@@ -266,6 +321,12 @@ class RoomViewSet(viewsets.ViewSet):
             start_date = request.query_params.get("start_date")
             end_date = request.query_params.get("end_date")
             location_id = request.query_params.get("location_id")
+            capacity_min = None
+            if request.query_params.get("capacity_min"):
+                try:
+                    capacity_min = int(request.query_params.get("capacity_min"))
+                except ValueError:
+                    pass
 
             if not start_date or not end_date:
                 return Response(
@@ -274,7 +335,7 @@ class RoomViewSet(viewsets.ViewSet):
                 )
 
             rooms = self.list_use_case.execute_available_rooms(
-                start_date, end_date, location_id
+                start_date, end_date, location_id, capacity_min
             )
 
             output_dtos = [RoomOutputDTO(room) for room in rooms]
@@ -313,6 +374,78 @@ class RoomViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(detail=False, methods=["get"], url_path="availability-grid")
+    def availability_grid(self, request):
+        """Free/busy slots of all rooms (of a location) over a time window"""
+        try:
+            input_dto = AvailabilityGridInputDTO(data=request.query_params)
+            if not input_dto.is_valid():
+                return Response(
+                    {"errors": input_dto.errors}, status=status.HTTP_400_BAD_REQUEST
+                )
+            params = input_dto.validated_data
+
+            grid = self.availability_grid_use_case.execute(
+                params["start"],
+                params["end"],
+                params["slot"],
+                location_id=params.get("location_id"),
+            )
+
+            output_dto = AvailabilityGridOutputDTO(grid, params["encoding"])
+            return Response(output_dto.to_dict(), status=status.HTTP_200_OK)
+
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=["get"], url_path="find-free-slot")
+    def find_free_slot(self, request):
+        """Earliest free periods among rooms with enough seats"""
+        try:
+            input_dto = FindFreeSlotInputDTO(data=request.query_params)
+            if not input_dto.is_valid():
+                return Response(
+                    {"errors": input_dto.errors}, status=status.HTTP_400_BAD_REQUEST
+                )
+            params = input_dto.validated_data
+
+            candidates = self.find_free_slot_use_case.execute(
+                params["start"],
+                params["end"],
+                params["duration"],
+                capacity=params.get("capacity"),
+                location_id=params.get("location_id"),
+                limit=params["limit"],
+            )
+
+            return Response(
+                {
+                    "duration_minutes": int(params["duration"].total_seconds() // 60),
+                    "candidates": [
+                        dict(
+                            candidate,
+                            start_date=candidate["start_date"].isoformat(),
+                            end_date=candidate["end_date"].isoformat(),
+                        )
+                        for candidate in candidates
+                    ],
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     @action(detail=False, methods=["post"])
     def upsert(self, request):
         """Create room or return existing one with same name and location"""
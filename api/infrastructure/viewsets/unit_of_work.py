@@ -0,0 +1,37 @@
+"""
+Transaction boundary for ViewSet write requests
+
+ViewSets using ``UnitOfWorkMixin`` create a ``DjangoUnitOfWork`` in
+``__init__`` (one per request). Unsafe requests run inside its transaction
+and are rolled back when the view answers with an error status, since the
+views report failures as responses rather than exceptions.
+
+ViewSets whose writes check for conflicts before inserting set
+``immediate_writes`` and open the transaction themselves, around the use
+case call only: ``with self.unit_of_work.atomic(immediate=True)``. The
+writes of the request still commit or roll back together, but on SQLite the
+write lock (``BEGIN IMMEDIATE``) is held for the write alone instead of the
+whole request (validation, lookups, rendering). Starting the transaction at
+dispatch would either hold the lock that long or, deferred, fail with
+"database is locked" when it writes after reading.
+"""
+
+from django.db import transaction
+from rest_framework.permissions import SAFE_METHODS
+
+
+class UnitOfWorkMixin:
+    """Run write requests inside ``self.unit_of_work.atomic()``"""
+
+    # The views open unit_of_work.atomic(immediate=True) around their writes
+    immediate_writes = False
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS or self.immediate_writes:
+            return super().dispatch(request, *args, **kwargs)
+
+        with self.unit_of_work.atomic():
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code >= 400:
+                transaction.set_rollback(True)
+        return response
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.infrastructure.profiling import MODES, enabled, sign_mode
+
+
+class Command(BaseCommand):
+    help = (
+        "Gera o valor do cabeçalho X-Profile que pede o profiling de uma "
+        "requisição (válido por PROFILING['HEADER_MAX_AGE'] segundos)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--mode",
+            choices=MODES,
+            default="sample",
+            help="sample (pilhas amostradas, formato collapsed) ou cprofile (.prof)",
+        )
+
+    def handle(self, *args, **options):
+        if not enabled():
+            raise CommandError(
+                "Profiling desligado: defina PROFILING=True e um SECRET_KEY próprio"
+            )
+        self.stdout.write(f"X-Profile: {sign_mode(options['mode'])}")
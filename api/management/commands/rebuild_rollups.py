@@ -0,0 +1,39 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.infrastructure.repositories.django_utilization_repository import (
+    DjangoUtilizationRepository,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula a tabela booking_daily_rollup (minutos reservados e cafés "
+        "por sala e hora) a partir das reservas ativas"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from",
+            dest="start_date",
+            type=date.fromisoformat,
+            help="Primeira data (AAAA-MM-DD) a recalcular; padrão: todas",
+        )
+        parser.add_argument(
+            "--to",
+            dest="end_date",
+            type=date.fromisoformat,
+            help="Última data (AAAA-MM-DD) a recalcular; padrão: todas",
+        )
+
+    def handle(self, *args, **options):
+        start_date = options["start_date"]
+        end_date = options["end_date"]
+        if start_date and end_date and start_date > end_date:
+            raise CommandError("--from deve ser anterior ou igual a --to")
+
+        written = DjangoUtilizationRepository().rebuild(start_date, end_date)
+        self.stdout.write(
+            self.style.SUCCESS(f"Rollup recalculado: {written} linhas gravadas")
+        )
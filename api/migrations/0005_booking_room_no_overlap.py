@@ -0,0 +1,129 @@
+import warnings
+
+from django.db import migrations
+
+
+CONSTRAINT_NAME = "bookings_room_no_overlap"
+
+# Active bookings of the same room overlapping each other (legacy data from
+# before this constraint); the constraint cannot be added while any exist
+OVERLAPPING_BOOKINGS = """
+    SELECT a.room_id, a.id, b.id
+    FROM bookings a
+    JOIN bookings b
+      ON b.room_id = a.room_id
+     AND a.id < b.id
+     AND a.start_date < b.end_date
+     AND b.start_date < a.end_date
+    WHERE a.deleted_at IS NULL AND b.deleted_at IS NULL
+    ORDER BY a.room_id, a.start_date
+    LIMIT 50
+"""
+
+# btree_gist is a trusted extension from PostgreSQL 13: the database owner
+# can create it; older servers need a superuser to run the statement once
+POSTGRESQL_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    f"""
+    ALTER TABLE bookings ADD CONSTRAINT {CONSTRAINT_NAME}
+    EXCLUDE USING gist (
+        room_id WITH =,
+        tstzrange(start_date, end_date) WITH &&
+    ) WHERE (deleted_at IS NULL)
+    """,
+]
+
+POSTGRESQL_BACKWARD = [
+    f"ALTER TABLE bookings DROP CONSTRAINT IF EXISTS {CONSTRAINT_NAME}",
+]
+
+# SQLite has no exclusion constraints; triggers reject the same overlaps and
+# surface them as IntegrityError carrying the constraint name.
+SQLITE_OVERLAP_CHECK = f"""
+    SELECT RAISE(ABORT, '{CONSTRAINT_NAME}')
+    WHERE EXISTS (
+        SELECT 1 FROM bookings
+        WHERE room_id = NEW.room_id
+          AND deleted_at IS NULL
+          AND start_date < NEW.end_date
+          AND end_date > NEW.start_date
+          AND id != NEW.id
+    );
+"""
+
+SQLITE_FORWARD = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {CONSTRAINT_NAME}_insert
+    BEFORE INSERT ON bookings
+    WHEN NEW.deleted_at IS NULL
+    BEGIN {SQLITE_OVERLAP_CHECK} END
+    """,
+    # Model.save() writes every column, so UPDATE OF alone fires on any
+    # edit and a name-only change to a legacy overlapping booking would be
+    # rejected. Only check updates that move the booking or bring it back.
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {CONSTRAINT_NAME}_update
+    BEFORE UPDATE OF room_id, start_date, end_date, deleted_at ON bookings
+    WHEN NEW.deleted_at IS NULL AND (
+        OLD.deleted_at IS NOT NULL
+        OR NEW.room_id IS NOT OLD.room_id
+        OR NEW.start_date IS NOT OLD.start_date
+        OR NEW.end_date IS NOT OLD.end_date
+    )
+    BEGIN {SQLITE_OVERLAP_CHECK} END
+    """,
+]
+
+SQLITE_BACKWARD = [
+    f"DROP TRIGGER IF EXISTS {CONSTRAINT_NAME}_insert",
+    f"DROP TRIGGER IF EXISTS {CONSTRAINT_NAME}_update",
+]
+
+
+def check_existing_overlaps(apps, schema_editor):
+    """
+    Refuse to add the PostgreSQL constraint over overlapping bookings,
+    listing them so they can be cancelled or moved first. SQLite triggers
+    only check later writes, so there the overlaps are just reported.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(OVERLAPPING_BOOKINGS)
+        overlaps = cursor.fetchall()
+    if not overlaps:
+        return
+
+    listing = "\n".join(
+        f"  room {room_id}: booking {first} overlaps booking {second}"
+        for room_id, first, second in overlaps
+    )
+    message = (
+        f"Found overlapping active bookings (first {len(overlaps)} pairs):\n"
+        f"{listing}\n"
+        "Cancel (soft delete) or move one booking of each pair"
+    )
+    if schema_editor.connection.vendor == "postgresql":
+        raise RuntimeError(f"{message}, then run migrate again.")
+    warnings.warn(f"{message}; until then those rows can only be edited, not moved.")
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0004_alter_booking_name"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_existing_overlaps, migrations.RunPython.noop),
+        migrations.RunPython(
+            _run({"postgresql": POSTGRESQL_FORWARD, "sqlite": SQLITE_FORWARD}),
+            _run({"postgresql": POSTGRESQL_BACKWARD, "sqlite": SQLITE_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-16 22:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_booking_room_no_overlap'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['room', 'start_date', 'end_date'], name='bookings_room_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['manager', 'start_date'], name='bookings_manager_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['start_date', 'end_date'], name='bookings_period_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-16 22:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0006_booking_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="booking",
+            name="series_id",
+            field=models.CharField(blank=True, db_index=True, max_length=36, null=True),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:03
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0007_booking_series_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BookingDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("hour", models.SmallIntegerField()),
+                ("booked_minutes", models.IntegerField(default=0)),
+                ("coffee_servings", models.IntegerField(default=0)),
+                (
+                    "room",
+                    models.ForeignKey(
+                        db_column="room_id",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_rollups",
+                        to="api.room",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "booking_daily_rollup",
+                "indexes": [
+                    models.Index(
+                        fields=["date", "hour"], name="booking_rollup_date_hour_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="bookingdailyrollup",
+            constraint=models.UniqueConstraint(
+                fields=("room", "date", "hour"), name="booking_rollup_room_date_hour"
+            ),
+        ),
+    ]
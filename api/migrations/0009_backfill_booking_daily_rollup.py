@@ -0,0 +1,68 @@
+from collections import defaultdict
+from datetime import timedelta, timezone as dt_timezone
+
+from django.db import migrations
+from django.utils import timezone
+
+
+def hourly_buckets(start_date, end_date):
+    """(date, hour, minutes) buckets of local time covered by a period"""
+    buckets = []
+    cursor = start_date
+    while cursor < end_date:
+        local = timezone.localtime(cursor)
+        hour_start = local.replace(minute=0, second=0, microsecond=0)
+        next_hour = min(
+            hour_start.astimezone(dt_timezone.utc) + timedelta(hours=1), end_date
+        )
+        minutes = round((next_hour - cursor).total_seconds() / 60)
+        if minutes:
+            buckets.append((local.date(), local.hour, minutes))
+        cursor = next_hour
+    return buckets
+
+
+def backfill_rollups(apps, schema_editor):
+    """
+    Fill booking_daily_rollup from the bookings that predate it: minutes
+    booked per (room, local date, hour), coffee servings on the first hour
+    """
+    Booking = apps.get_model("api", "Booking")
+    BookingDailyRollup = apps.get_model("api", "BookingDailyRollup")
+
+    totals = defaultdict(lambda: [0, 0])
+    rows = Booking.objects.filter(deleted_at__isnull=True).values_list(
+        "room_id", "start_date", "end_date", "coffee_option", "coffee_quantity"
+    )
+    for room_id, start, end, coffee_option, coffee_quantity in rows.iterator():
+        for index, (day, hour, minutes) in enumerate(hourly_buckets(start, end)):
+            total = totals[(room_id, day, hour)]
+            total[0] += minutes
+            if index == 0 and coffee_option and coffee_quantity:
+                total[1] += coffee_quantity
+
+    BookingDailyRollup.objects.all().delete()
+    BookingDailyRollup.objects.bulk_create(
+        [
+            BookingDailyRollup(
+                room_id=room_id,
+                date=day,
+                hour=hour,
+                booked_minutes=minutes,
+                coffee_servings=coffee_servings,
+            )
+            for (room_id, day, hour), (minutes, coffee_servings) in totals.items()
+        ],
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0008_booking_daily_rollup"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
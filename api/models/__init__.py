@@ -2,5 +2,6 @@ from .location import Location
 from .room import Room
 from .manager import Manager
 from .booking import Booking
+from .booking_daily_rollup import BookingDailyRollup
 
-__all__ = ["Location", "Room", "Manager", "Booking"]
+__all__ = ["Location", "Room", "Manager", "Booking", "BookingDailyRollup"]
@@ -32,9 +32,31 @@ class Booking(models.Model):
     coffee_option = models.BooleanField(default=False)
     coffee_quantity = models.IntegerField(null=True, blank=True)
     coffee_description = models.TextField(null=True, blank=True)
+    # Shared by every occurrence of a recurring booking
+    series_id = models.CharField(max_length=36, null=True, blank=True, db_index=True)
 
     class Meta:
         db_table = "bookings"
+        indexes = [
+            # Overlap checks: room_id = ? AND start_date < ? AND end_date > ?
+            models.Index(
+                fields=["room", "start_date", "end_date"],
+                name="bookings_room_period_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # Per-manager listings and statistics ordered by start
+            models.Index(
+                fields=["manager", "start_date"],
+                name="bookings_manager_start_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # Active / date-range queries across all rooms
+            models.Index(
+                fields=["start_date", "end_date"],
+                name="bookings_period_idx",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
 
     def __str__(self):
         if self.name:
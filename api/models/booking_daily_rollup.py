@@ -0,0 +1,37 @@
+from django.db import models
+from .room import Room
+
+
+class BookingDailyRollup(models.Model):
+    """
+    Booked minutes and coffee servings of a room per local (date, hour)
+
+    Maintained incrementally by the booking repository on create, update and
+    cancel; ``python manage.py rebuild_rollups`` recomputes it from bookings.
+    """
+
+    room = models.ForeignKey(
+        Room,
+        on_delete=models.CASCADE,
+        related_name="daily_rollups",
+        db_column="room_id",
+    )
+    date = models.DateField()
+    hour = models.SmallIntegerField()
+    booked_minutes = models.IntegerField(default=0)
+    coffee_servings = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "booking_daily_rollup"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["room", "date", "hour"], name="booking_rollup_room_date_hour"
+            ),
+        ]
+        indexes = [
+            # Fleet-wide ranges grouped by room or hour of the week
+            models.Index(fields=["date", "hour"], name="booking_rollup_date_hour_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.room_id} {self.date} {self.hour:02d}h: {self.booked_minutes} min"
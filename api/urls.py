@@ -4,6 +4,8 @@ from .infrastructure.viewsets.booking_viewset import BookingViewSet
 from .infrastructure.viewsets.location_viewset import LocationViewSet
 from .infrastructure.viewsets.room_viewset import RoomViewSet
 from .infrastructure.viewsets.manager_viewset import ManagerViewSet
+from .infrastructure.viewsets.analytics_viewset import AnalyticsViewSet
+from .infrastructure.viewsets.health_viewset import HealthViewSet
 
 # Configurar router do DRF
 router = DefaultRouter()
@@ -11,6 +13,8 @@ router.register(r"locations", LocationViewSet, basename="location")
 router.register(r"rooms", RoomViewSet, basename="room")
 router.register(r"managers", ManagerViewSet, basename="manager")
 router.register(r"bookings", BookingViewSet, basename="booking")
+router.register(r"analytics", AnalyticsViewSet, basename="analytics")
+router.register(r"health", HealthViewSet, basename="health")
 
 # URLs da API
 urlpatterns = [
@@ -27,6 +31,8 @@ urlpatterns = [
     # /bookings/{id}/ - GET (retrieve), PUT (update), PATCH (partial_update), DELETE (destroy)
     # /bookings/by_room/ - GET (custom action)
     # /bookings/by_manager/ - GET (custom action)
+    # /analytics/utilization/ - GET (custom action)
+    # /health/ - GET (database ping and connection statistics)
     path("", include(router.urls)),
 ]
 
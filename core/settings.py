@@ -12,6 +12,10 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 
+from decouple import Csv, config
+
+from .database import database_from_url
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -20,12 +24,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = "django-insecure-9cehq6u%%jyvat84gj&*h_fji=(2&j@wt()3p=e4t6yp&aq%oe"
+SECRET_KEY = config(
+    "SECRET_KEY",
+    default="django-insecure-9cehq6u%%jyvat84gj&*h_fji=(2&j@wt()3p=e4t6yp&aq%oe",
+)
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = config("DEBUG", default=True, cast=bool)
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = config("ALLOWED_HOSTS", default="", cast=Csv())
 
 
 # Application definition
@@ -43,6 +50,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "api.infrastructure.query_accounting.QueryAccountingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -60,10 +68,143 @@ CORS_ALLOW_CREDENTIALS = True
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [],
     "DEFAULT_PERMISSION_CLASSES": [],
+    # orjson-backed when installed (see api/infrastructure/renderers.py); the
+    # browsable API is only offered while developing
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",
-    ],
+        "api.infrastructure.renderers.FastJSONRenderer",
+    ]
+    + (["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
+}
+
+# Output DTOs and read models hand datetime objects to the renderer instead
+# of calling isoformat() per field (needs FastJSONRenderer, which writes them
+# in the same format)
+API_NATIVE_DATETIMES = True
+
+# In-memory interval index answering read-only availability queries; write
+# paths always check the database (see
+# api/infrastructure/repositories/booking_interval_index.py)
+BOOKING_INTERVAL_INDEX = {
+    "ENABLED": True,
+    "TTL_SECONDS": 60,
+    "LOOKBACK_HOURS": 24,
+}
+
+# Cursor pagination for list endpoints (?limit=&cursor=)
+API_PAGINATION = {
+    "DEFAULT_LIMIT": 50,
+    "MAX_LIMIT": 200,
+}
+
+# Rows fetched per database round trip by /api/bookings/export/
+BOOKING_EXPORT_CHUNK_SIZE = 2000
+
+# Maximum number of items accepted by POST /api/bookings/bulk/
+BOOKING_BULK_MAX_ITEMS = 500
+
+# Maximum slots per room in GET /api/rooms/availability-grid/
+# (one week of 5-minute slots)
+AVAILABILITY_GRID_MAX_SLOTS = 2016
+
+# List use cases that build responses from values() rows instead of
+# model -> entity -> DTO conversion (remove a name to fall back)
+READ_MODEL_USE_CASES = [
+    "ListBookingsUseCase",
+    "ListRoomsUseCase",
+    "ListManagersUseCase",
+    "ListLocationsUseCase",
+]
+
+# Cache backend for read responses; swap for a shared backend (Redis,
+# Memcached) so every worker sees the same entries and invalidations
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "labtras-default",
+    }
+}
+
+# PRAGMAs applied to every SQLite connection and BEGIN IMMEDIATE on the
+# booking write path (see api/infrastructure/sqlite_tuning.py); ignored on
+# other databases. Off by default so management commands leave the database
+# file alone; gunicorn.conf.py turns it on for the server processes
+SQLITE_TUNING = {
+    "ENABLED": config("SQLITE_TUNING", default=False, cast=bool),
+    "JOURNAL_MODE": "WAL",
+    "SYNCHRONOUS": "NORMAL",
+    "BUSY_TIMEOUT_MS": 5000,
+    "MMAP_SIZE": 256 * 1024 * 1024,
+    "CACHE_SIZE": -16384,
+    "TEMP_STORE": "MEMORY",
+    "IMMEDIATE_WRITES": True,
+}
+
+# Per-request query count / DB time headers and api.queries logs for a
+# sample of requests (see api/infrastructure/query_accounting.py)
+QUERY_ACCOUNTING = {
+    "ENABLED": config("QUERY_ACCOUNTING", default=True, cast=bool),
+    "SAMPLE_RATE": config(
+        "QUERY_ACCOUNTING_SAMPLE_RATE", default=1.0 if DEBUG else 0.1, cast=float
+    ),
+    "N_PLUS_ONE_THRESHOLD": 5,
+    "HEADERS": True,
+}
+
+# Profiles of single ViewSet actions (see api/infrastructure/profiling.py):
+# endpoints listed as "RoomViewSet.available", a sampled fraction of
+# requests, or any request carrying a signed X-Profile header
+# (manage.py profiling_token). Stays off while SECRET_KEY is a placeholder;
+# only the newest MAX_FILES profiles are kept
+PROFILING = {
+    "ENABLED": config("PROFILING", default=False, cast=bool),
+    "ENDPOINTS": config("PROFILING_ENDPOINTS", default="", cast=Csv()),
+    "SAMPLE_RATE": config("PROFILING_SAMPLE_RATE", default=0.0, cast=float),
+    "HEADER_MAX_AGE": 300,
+    "MODE": config("PROFILING_MODE", default="sample"),
+    "INTERVAL_MS": 5,
+    "OUTPUT_DIR": config("PROFILING_DIR", default=str(BASE_DIR / "profiles")),
+    "MAX_FILES": config("PROFILING_MAX_FILES", default=100, cast=int),
+    "FULL_STACKS": False,
+}
+
+# Prometheus metrics at /metrics (see api/infrastructure/metrics.py);
+# needs prometheus_client
+METRICS = {
+    "ENABLED": config("METRICS", default=True, cast=bool),
+}
+
+# One JSON object per line for the query accounting and profiling logs;
+# QUERY_LOG_LEVEL=WARNING keeps only the requests flagged for repeated
+# statements
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "json": {"()": "api.infrastructure.log_formatters.JSONLogFormatter"},
+    },
+    "handlers": {
+        "json": {"class": "logging.StreamHandler", "formatter": "json"},
+    },
+    "loggers": {
+        "api.queries": {
+            "handlers": ["json"],
+            "level": config("QUERY_LOG_LEVEL", default="INFO"),
+            "propagate": False,
+        },
+        "api.profiling": {
+            "handlers": ["json"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
+
+# Cached list/detail reads of locations, rooms and managers
+# (see api/infrastructure/repositories/read_cache.py)
+READ_CACHE = {
+    "ENABLED": True,
+    "ALIAS": "default",
+    "TIMEOUT": 300,
 }
 
 ROOT_URLCONF = "core.urls"
@@ -89,11 +230,29 @@ WSGI_APPLICATION = "core.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# DATABASE_URL selects the database (the local SQLite file when unset), see
+# core/database.py. Connections persist for DB_CONN_MAX_AGE seconds and are
+# pinged before reuse; DB_POOL_* sizes a psycopg pool where Django supports
+# one (5.1+ with psycopg 3), otherwise they are ignored.
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+    "default": database_from_url(
+        config("DATABASE_URL", default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}"),
+        conn_max_age=config("DB_CONN_MAX_AGE", default=60, cast=int),
+        conn_health_checks=config("DB_CONN_HEALTH_CHECKS", default=True, cast=bool),
+        pool=(
+            {
+                "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+                "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+                "timeout": config("DB_POOL_TIMEOUT", default=10, cast=float),
+                "max_idle": config("DB_POOL_MAX_IDLE", default=300, cast=float),
+                "max_lifetime": config(
+                    "DB_POOL_MAX_LIFETIME", default=1800, cast=float
+                ),
+            }
+            if config("DB_POOL", default=False, cast=bool)
+            else None
+        ),
+    )
 }
 
 
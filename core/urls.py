@@ -17,7 +17,10 @@ Including another URLconf
 
 from django.urls import path, include
 
+from api.infrastructure.metrics import metrics_view
+
 
 urlpatterns = [
     path("api/", include("api.urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
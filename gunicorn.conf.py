@@ -0,0 +1,97 @@
+"""
+Gunicorn configuration for production serving
+
+Loaded automatically by ``gunicorn`` from the project root (or with
+``-c gunicorn.conf.py``). Every value can be overridden through the
+``GUNICORN_*`` environment variables below.
+
+Worker models (``GUNICORN_WORKER_CLASS``):
+
+- ``gthread`` (default): a few processes with a thread pool each. Requests
+  mostly wait on the database, so threads overlap that wait cheaply.
+- ``sync``: one request per process, the classic ``2 * CPU + 1`` processes
+- ``uvicorn.workers.UvicornWorker``: serves ``core.asgi`` (needs
+  ``pip install uvicorn``). The views and ORM are synchronous, so Django runs
+  them in a thread per request; useful mainly behind ASGI-only proxies.
+
+Each worker keeps its own in-process state (booking interval index, locmem
+read cache), so fewer processes with more threads also share more of it.
+"""
+
+import glob
+import multiprocessing
+import os
+import tempfile
+
+CPU_COUNT = multiprocessing.cpu_count()
+
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+_asgi = worker_class.startswith("uvicorn")
+
+if worker_class == "sync":
+    _default_workers, _default_threads = 2 * CPU_COUNT + 1, 1
+elif _asgi:
+    _default_workers, _default_threads = CPU_COUNT, 1
+else:
+    _default_workers, _default_threads = CPU_COUNT + 1, 4
+
+wsgi_app = "core.asgi:application" if _asgi else "core.wsgi:application"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", _default_workers))
+threads = int(os.environ.get("GUNICORN_THREADS", _default_threads))
+
+# Import Django and the URLconf once in the master; workers fork with the
+# code already loaded (copy-on-write) and start serving immediately
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() == "true"
+
+# Keep client connections open between requests; must stay below the idle
+# timeout of the proxy / load balancer in front
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+
+# Recycle workers after a number of requests (spread by the jitter so they
+# do not all restart together), bounding slow memory growth
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 200))
+
+# Prometheus multiprocess mode: every worker writes its metrics to files in
+# this directory and /metrics merges them. Set before the app (and
+# prometheus_client) is loaded. Its *.db metric files are removed at each
+# start so counters of a previous run are not merged in; nothing else in
+# the directory is touched, since the operator may point it anywhere
+METRICS_DIR = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    os.path.join(tempfile.gettempdir(), "labtras-metrics"),
+)
+os.makedirs(METRICS_DIR, exist_ok=True)
+for _path in glob.glob(os.path.join(METRICS_DIR, "*.db")):
+    os.remove(_path)
+
+# Tuned SQLite profile (WAL, BEGIN IMMEDIATE on booking writes) for the
+# server only; management commands run without it. Explicitly set values win
+os.environ.setdefault("SQLITE_TUNING", "True")
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-") or None
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+
+def pre_fork(server, worker):
+    """
+    Close database connections in the master before forking: with
+    preload_app a connection opened while importing would otherwise be
+    inherited, and shared, by every worker process
+    """
+    from django.db import connections
+
+    connections.close_all()
+
+
+def child_exit(server, worker):
+    """Drop the live gauges of a worker that exited (recycled or crashed)"""
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Available rooms lookup: the former exclude(id__in=<overlapping bookings>)
+query versus the NOT EXISTS anti-join of DjangoRoomRepository.
+
+Prints both query plans and their timings for one location and for all
+rooms, over an hour in the middle of the seeded schedule in which half of
+the rooms are free.
+
+Usage: python tests/benchmarks/bench_available_rooms.py
+           [--rooms 10000] [--bookings 1000000] [--locations 50] [--repeat 5]
+"""
+
+import argparse
+from datetime import timedelta
+
+from common import best_of, seed, test_database
+from django.utils import timezone
+
+from api.infrastructure.repositories.django_room_repository import (
+    DjangoRoomRepository,
+)
+from api.models import Booking as BookingModel
+from api.models import Room as RoomModel
+
+
+def previous_queryset(start_date, end_date, location_id=None):
+    """The query get_available_rooms used to run"""
+    queryset = RoomModel.objects.select_related("location").filter(
+        deleted_at__isnull=True
+    )
+    if location_id:
+        queryset = queryset.filter(location_id=location_id)
+    conflicting_bookings = BookingModel.objects.filter(
+        start_date__lt=end_date, end_date__gt=start_date, deleted_at__isnull=True
+    ).values_list("room_id", flat=True)
+    return queryset.exclude(id__in=conflicting_bookings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rooms", type=int, default=10000)
+    parser.add_argument("--bookings", type=int, default=1000000)
+    parser.add_argument("--locations", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with test_database():
+        rows = seed(
+            bookings=args.bookings,
+            rooms=args.rooms,
+            managers=100,
+            locations=args.locations,
+        )
+        repository = DjangoRoomRepository()
+
+        # Every room has a 45-minute booking each hour; cancel the middle
+        # hour's booking of every other room so half of them are free
+        start_date = rows["bookings"][0].start_date + timedelta(
+            hours=max(1, args.bookings // args.rooms) // 2
+        )
+        end_date = start_date + timedelta(hours=1)
+        BookingModel.objects.filter(
+            start_date=start_date,
+            room_id__in=[room.id for room in rows["rooms"][::2]],
+        ).update(deleted_at=timezone.now())
+
+        scopes = [
+            ("one location", rows["locations"][0].id),
+            ("all rooms", None),
+        ]
+        for label, location_id in scopes:
+            previous = previous_queryset(start_date, end_date, location_id)
+            current = repository._available_queryset(start_date, end_date, location_id)
+            print(f"== {label}: previous query plan\n{previous.explain()}")
+            print(f"== {label}: anti-join query plan\n{current.explain()}")
+
+            old_time = best_of(lambda: list(previous.all()), args.repeat)
+            new_time = best_of(lambda: list(current.all()), args.repeat)
+            print(
+                f"{label}: {current.count()} available, "
+                f"previous {old_time * 1e3:.1f} ms, "
+                f"anti-join {new_time * 1e3:.1f} ms "
+                f"({old_time / new_time:.2f}x)\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Memory footprint of the domain entities: bytes per entity (tracemalloc)
+and peak RSS while listing a large number of bookings through the repository.
+
+Usage: python tests/benchmarks/bench_entity_memory.py [--rows 100000]
+"""
+
+import argparse
+import gc
+import resource
+import tracemalloc
+from datetime import datetime
+
+from common import seed, test_database
+
+from api.domain.entities.booking import Booking
+from api.domain.entities.location import Location
+from api.domain.entities.manager import Manager
+from api.domain.entities.room import Room
+from api.infrastructure.repositories.django_booking_repository import (
+    DjangoBookingRepository,
+)
+
+SAMPLE_FIELDS = {
+    Location: {"name": "Location", "address": "Street", "description": None},
+    Manager: {"name": "Manager", "email": "manager@example.com", "phone": None},
+    Room: {"name": "Room", "capacity": 8, "location_id": "l", "description": None},
+    Booking: {
+        "room_id": "r",
+        "manager_id": "m",
+        "name": "Booking",
+        "description": None,
+        "start_date": datetime(2030, 1, 1, 10),
+        "end_date": datetime(2030, 1, 1, 11),
+        "coffee_option": False,
+        "coffee_quantity": None,
+        "coffee_description": None,
+    },
+}
+
+
+def _bytes_per_object(factory, count: int) -> float:
+    """Average traced allocation of ``count`` objects built by ``factory``"""
+    ids = [f"{i:036d}" for i in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(object_id) for object_id in ids]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # Discount the list's own pointer array
+    return (allocated - 8 * len(objects)) / count
+
+
+def _without_slots(entity_class):
+    """Plain-class twin of an entity, storing attributes in a per-instance __dict__"""
+    return type(entity_class.__name__, (), {"__init__": entity_class.__init__})
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def entity_sizes(count: int) -> None:
+    created = datetime(2030, 1, 1)
+    print(f"{'entity':<10} {'__slots__':>12} {'__dict__':>12}")
+    for entity_class, fields in SAMPLE_FIELDS.items():
+        values = {
+            **fields,
+            "created_at": created,
+            "updated_at": created,
+            "deleted_at": None,
+        }
+        if entity_class is Booking:
+            values.update(room=None, manager=None)
+        slotted = _bytes_per_object(
+            lambda object_id: entity_class(id=object_id, **values), count
+        )
+        plain_class = _without_slots(entity_class)
+        with_dict = _bytes_per_object(
+            lambda object_id: plain_class(id=object_id, **values), count
+        )
+        print(f"{entity_class.__name__:<10} {slotted:>8.0f} B/o {with_dict:>8.0f} B/o")
+
+
+def booking_list_rss(rows: int) -> None:
+    with test_database():
+        seed(bookings=rows, rooms=max(rows // 1000, 1))
+        repository = DjangoBookingRepository()
+
+        gc.collect()
+        baseline = _peak_rss_mb()
+        bookings = repository.get_all()
+        peak = _peak_rss_mb()
+
+        print(
+            f"\nget_all() of {len(bookings)} bookings: "
+            f"peak RSS {peak:.1f} MB (+{peak - baseline:.1f} MB)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--objects", type=int, default=100000)
+    args = parser.parse_args()
+
+    entity_sizes(args.objects)
+    booking_list_rss(args.rows)
+
+
+if __name__ == "__main__":
+    main()
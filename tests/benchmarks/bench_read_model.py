@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Per-row cost of the list read paths: model -> entity -> OutputDTO.to_dict
+versus the values()-based read model of the repositories.
+
+Usage: python tests/benchmarks/bench_read_model.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+
+from common import best_of, seed, test_database
+
+from api.application.dto.booking_dto import BookingOutputDTO
+from api.application.dto.location_dto import LocationOutputDTO
+from api.application.dto.manager_dto import ManagerOutputDTO
+from api.application.dto.room_dto import RoomOutputDTO
+from api.infrastructure.repositories.django_booking_repository import (
+    DjangoBookingRepository,
+)
+from api.infrastructure.repositories.django_location_repository import (
+    DjangoLocationRepository,
+)
+from api.infrastructure.repositories.django_manager_repository import (
+    DjangoManagerRepository,
+)
+from api.infrastructure.repositories.django_room_repository import (
+    DjangoRoomRepository,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with test_database():
+        seed(
+            bookings=args.rows,
+            rooms=args.rows,
+            managers=args.rows,
+            locations=args.rows,
+        )
+
+        cases = [
+            ("bookings", DjangoBookingRepository(), BookingOutputDTO),
+            ("rooms", DjangoRoomRepository(), RoomOutputDTO),
+            ("managers", DjangoManagerRepository(), ManagerOutputDTO),
+            ("locations", DjangoLocationRepository(), LocationOutputDTO),
+        ]
+
+        print(f"{'list':<10} {'entity+DTO':>14} {'read model':>14} {'speedup':>8}")
+        for label, repository, dto_class in cases:
+            entity_path = best_of(
+                lambda: [dto_class(e).to_dict() for e in repository.get_all()],
+                args.repeat,
+            )
+            read_model = best_of(lambda: repository.get_all_rows(), args.repeat)
+            print(
+                f"{label:<10} "
+                f"{entity_path / args.rows * 1e6:>9.2f} us/row "
+                f"{read_model / args.rows * 1e6:>9.2f} us/row "
+                f"{entity_path / read_model:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Cost of building and rendering a list of bookings: DRF's JSONRenderer on
+isoformat() strings versus FastJSONRenderer on native datetimes.
+
+Usage: python tests/benchmarks/bench_renderer.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+
+from common import best_of, seed, test_database
+
+from django.test import override_settings
+from rest_framework.renderers import JSONRenderer
+
+from api.infrastructure.renderers import FastJSONRenderer, orjson
+from api.infrastructure.repositories.django_booking_repository import (
+    DjangoBookingRepository,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with test_database():
+        seed(bookings=args.rows)
+        repository = DjangoBookingRepository()
+
+        with override_settings(API_NATIVE_DATETIMES=False):
+            string_rows = repository.get_all_rows()
+            build_strings = best_of(repository.get_all_rows, args.repeat)
+        with override_settings(API_NATIVE_DATETIMES=True):
+            native_rows = repository.get_all_rows()
+            build_native = best_of(repository.get_all_rows, args.repeat)
+
+        stock, fast = JSONRenderer(), FastJSONRenderer()
+        assert stock.render(string_rows) == fast.render(native_rows)
+
+        render_stock = best_of(lambda: stock.render(string_rows), args.repeat)
+        render_fast = best_of(lambda: fast.render(native_rows), args.repeat)
+
+        print(f"{args.rows} bookings, orjson {'on' if orjson else 'off'}")
+        print(f"{'':<22} {'rows':>10} {'render':>10} {'total':>10}")
+        for label, build, render in (
+            ("JSONRenderer+strings", build_strings, render_stock),
+            ("FastJSONRenderer", build_native, render_fast),
+        ):
+            print(
+                f"{label:<22} {build * 1e3:>7.1f} ms {render * 1e3:>7.1f} ms "
+                f"{(build + render) * 1e3:>7.1f} ms"
+            )
+        print(
+            f"render speedup {render_stock / render_fast:.1f}x, "
+            f"end to end {(build_strings + render_stock) / (build_native + render_fast):.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
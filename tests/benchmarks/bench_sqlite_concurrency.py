@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Concurrent booking writes and reads on a file-backed SQLite database, with
+the stock profile (rollback journal, deferred BEGIN) versus SQLITE_TUNING
+(WAL, busy_timeout, ... and BEGIN IMMEDIATE on the booking write path).
+
+Each profile runs in its own process on a fresh database file: N threads
+go through the full API stack (APIClient), one in four requests creating a
+booking and the rest listing a room's bookings or reading one booking.
+Throughput counts successful requests only.
+
+Usage: python tests/benchmarks/bench_sqlite_concurrency.py [--threads 8]
+           [--duration 5] [--bookings 5000]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+PROJECT_DIR = BENCH_DIR.parent.parent
+
+PROFILES = {"stock": "False", "tuned": "True"}
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values) or [0.0]
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_profile(args):
+    """Child process: seed the database and drive the threads"""
+    sys.path.insert(0, str(PROJECT_DIR))
+    from common import seed  # noqa: E402  (runs django.setup())
+
+    from django.core.management import call_command
+    from django.db import connection, connections
+    from django.utils import timezone
+    from rest_framework.test import APIClient
+
+    call_command("migrate", verbosity=0)
+    data = seed(bookings=args.bookings)
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA journal_mode")
+        journal_mode = cursor.fetchone()[0]
+    connections.close_all()
+
+    rooms = [str(room.id) for room in data["rooms"]]
+    managers = [str(manager.id) for manager in data["managers"]]
+    bookings = [str(booking.id) for booking in data["bookings"]]
+    future = timezone.now().replace(minute=0, second=0, microsecond=0)
+    future += timedelta(days=3650)
+
+    lock = threading.Lock()
+    slots = iter(range(10**9))
+    results = {"write": [], "read": []}
+    errors = {"write": 0, "read": 0}
+    deadline = time.perf_counter() + args.duration
+
+    def client(worker: int):
+        api = APIClient(SERVER_NAME="localhost")
+        step = worker
+        while time.perf_counter() < deadline:
+            step += 1
+            if step % 4 == 0:
+                with lock:
+                    slot = next(slots)
+                start = future + timedelta(hours=slot // len(rooms))
+                kind, request = "write", lambda: api.post(
+                    "/api/bookings/",
+                    {
+                        "room": rooms[slot % len(rooms)],
+                        "manager": managers[slot % len(managers)],
+                        "name": f"Bench {slot}",
+                        "start_date": start.isoformat(),
+                        "end_date": (start + timedelta(minutes=45)).isoformat(),
+                    },
+                    format="json",
+                )
+            elif step % 4 == 1:
+                booking = bookings[step % len(bookings)]
+                kind, request = "read", lambda: api.get(f"/api/bookings/{booking}/")
+            else:
+                room = rooms[step % len(rooms)]
+                kind, request = "read", lambda: api.get(
+                    f"/api/bookings/?room_id={room}"
+                )
+
+            started = time.perf_counter()
+            ok = request().status_code < 400
+            latency = time.perf_counter() - started
+            with lock:
+                results[kind].append(latency)
+                if not ok:
+                    errors[kind] += 1
+        connections.close_all()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(
+        json.dumps(
+            {
+                "journal_mode": journal_mode,
+                **{
+                    kind: {
+                        "rps": (len(latencies) - errors[kind]) / args.duration,
+                        "p50": percentile(latencies, 0.50),
+                        "p99": percentile(latencies, 0.99),
+                        "errors": errors[kind],
+                    }
+                    for kind, latencies in results.items()
+                },
+            }
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--profile", choices=PROFILES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile:
+        run_profile(args)
+        return
+
+    print(f"{args.threads} threads, {args.duration:g}s per profile")
+    print(
+        f"{'profile':<8} {'journal':>8} {'writes/s':>9} {'w p99 ms':>9} "
+        f"{'w errors':>9} {'reads/s':>8} {'r p99 ms':>9} {'r errors':>9}"
+    )
+    for profile, enabled in PROFILES.items():
+        scratch = tempfile.mkdtemp(prefix="labtras-sqlite-bench-")
+        env = {
+            **os.environ,
+            "LOADTEST_DB": os.path.join(scratch, "db.sqlite3"),
+            "SQLITE_TUNING": enabled,
+            "DJANGO_SETTINGS_MODULE": "loadtest_settings",
+            "PYTHONPATH": os.pathsep.join([str(PROJECT_DIR), str(BENCH_DIR)]),
+        }
+        output = subprocess.run(
+            [sys.executable, __file__, "--profile", profile]
+            + [f"--threads={args.threads}", f"--duration={args.duration}"]
+            + [f"--bookings={args.bookings}"],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        write, read = result["write"], result["read"]
+        print(
+            f"{profile:<8} {result['journal_mode']:>8} {write['rps']:>9.1f} "
+            f"{write['p99'] * 1e3:>9.1f} {write['errors']:>9} "
+            f"{read['rps']:>8.1f} {read['p99'] * 1e3:>9.1f} {read['errors']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
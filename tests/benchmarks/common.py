@@ -0,0 +1,107 @@
+"""
+Shared helpers for the benchmark scripts in this directory
+
+Benchmarks are plain scripts (not collected by pytest). Each one runs against
+a throwaway test database created from the project migrations, so the
+development ``db.sqlite3`` is never touched.
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Callable, Dict, List
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+
+@contextmanager
+def test_database():
+    """Create a fresh test database for the duration of the block"""
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def seed(
+    bookings: int, rooms: int = 50, managers: int = 20, locations: int = 5
+) -> Dict[str, List]:
+    """
+    Insert the given number of rows with bulk_create. Bookings are spread
+    round-robin over the rooms in consecutive one-hour slots, so none of them
+    overlap.
+    """
+    location_rows = LocationModel.objects.bulk_create(
+        [
+            LocationModel(name=f"Location {i}", address=f"Street {i}")
+            for i in range(locations)
+        ]
+    )
+    room_rows = RoomModel.objects.bulk_create(
+        [
+            RoomModel(
+                name=f"Room {i}",
+                capacity=4 + i % 20,
+                location=location_rows[i % locations],
+            )
+            for i in range(rooms)
+        ]
+    )
+    manager_rows = ManagerModel.objects.bulk_create(
+        [
+            ManagerModel(name=f"Manager {i}", email=f"manager{i}@example.com")
+            for i in range(managers)
+        ]
+    )
+
+    start = timezone.now().replace(minute=0, second=0, microsecond=0)
+    booking_rows = BookingModel.objects.bulk_create(
+        [
+            BookingModel(
+                name=f"Booking {i}",
+                room=room_rows[i % rooms],
+                manager=manager_rows[i % managers],
+                start_date=start + timedelta(hours=i // rooms),
+                end_date=start + timedelta(hours=i // rooms, minutes=45),
+                coffee_option=i % 3 == 0,
+                coffee_quantity=(i % 10) + 1 if i % 3 == 0 else None,
+            )
+            for i in range(bookings)
+        ],
+        batch_size=2000,
+    )
+    return {
+        "locations": location_rows,
+        "rooms": room_rows,
+        "managers": manager_rows,
+        "bookings": booking_rows,
+    }
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Best wall-clock time of ``repeat`` calls, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
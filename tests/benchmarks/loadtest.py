@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Load test of the booking endpoints under each gunicorn worker model.
+
+Seeds a scratch SQLite database, starts gunicorn with gunicorn.conf.py once
+per worker model and drives it with keep-alive HTTP clients, reporting
+requests per second and latency percentiles per endpoint.
+
+Usage: python tests/benchmarks/loadtest.py [--models sync,gthread,uvicorn]
+           [--duration 10] [--concurrency 16] [--bookings 5000]
+"""
+
+import argparse
+import http.client
+import itertools
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+PROJECT_DIR = BENCH_DIR.parent.parent
+
+_scratch = tempfile.mkdtemp(prefix="labtras-loadtest-")
+os.environ["LOADTEST_DB"] = os.path.join(_scratch, "db.sqlite3")
+os.environ["DJANGO_SETTINGS_MODULE"] = "loadtest_settings"
+sys.path.insert(0, str(PROJECT_DIR))
+
+from common import seed  # noqa: E402  (runs django.setup())
+
+from django.core.management import call_command  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+WORKER_CLASSES = {
+    "sync": "sync",
+    "gthread": "gthread",
+    "uvicorn": "uvicorn.workers.UvicornWorker",
+}
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Scenario:
+    """One endpoint: builds requests and records latencies and failures"""
+
+    def __init__(self, name, build):
+        self.name = name
+        self.build = build
+        self.latencies = []
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool) -> None:
+        with self.lock:
+            self.latencies.append(latency)
+            if not ok:
+                self.errors += 1
+
+
+# Created bookings take consecutive slots across all runs, so a later worker
+# model never collides with the bookings created under an earlier one
+SLOTS = itertools.count()
+
+
+def build_scenarios(data):
+    rooms = [room.id for room in data["rooms"]]
+    managers = [manager.id for manager in data["managers"]]
+    bookings = [booking.id for booking in data["bookings"]]
+    picks = itertools.count()
+    # Created bookings go in one-hour slots far after the seeded ones
+    future = timezone.now().replace(minute=0, second=0, microsecond=0)
+    future += timedelta(days=3650)
+
+    def list_by_room():
+        room = rooms[next(picks) % len(rooms)]
+        return "GET", f"/api/bookings/?room_id={room}", None
+
+    def detail():
+        booking = bookings[next(picks) % len(bookings)]
+        return "GET", f"/api/bookings/{booking}/", None
+
+    def create():
+        slot = next(SLOTS)
+        start = future + timedelta(hours=slot // len(rooms))
+        body = {
+            "room": rooms[slot % len(rooms)],
+            "manager": managers[slot % len(managers)],
+            "name": f"Load {slot}",
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(minutes=45)).isoformat(),
+        }
+        return "POST", "/api/bookings/", json.dumps(body)
+
+    return [
+        Scenario("GET /api/bookings/?room_id=", list_by_room),
+        Scenario("GET /api/bookings/{id}/", detail),
+        Scenario("POST /api/bookings/", create),
+    ]
+
+
+def drive(port: int, scenario: Scenario, concurrency: int, duration: float):
+    """Run ``concurrency`` keep-alive clients against one scenario"""
+    deadline = time.perf_counter() + duration
+    headers = {"Content-Type": "application/json", "Accept": "application/json"}
+
+    def client():
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        while time.perf_counter() < deadline:
+            method, path, body = scenario.build()
+            started = time.perf_counter()
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                ok = response.status < 400
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                ok = False
+            scenario.record(time.perf_counter() - started, ok)
+        connection.close()
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def start_server(model: str, port: int):
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(PROJECT_DIR), str(BENCH_DIR)]),
+        "GUNICORN_WORKER_CLASS": WORKER_CLASSES[model],
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "GUNICORN_ACCESS_LOG": "",
+        "GUNICORN_LOG_LEVEL": "warning",
+        "QUERY_LOG_LEVEL": "WARNING",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py"],
+        cwd=PROJECT_DIR,
+        env=env,
+    )
+    for _ in range(100):
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/api/locations/")
+            connection.getresponse().read()
+            return server
+        except OSError:
+            if server.poll() is not None:
+                raise RuntimeError(
+                    f"gunicorn ({model}) exited with {server.returncode}"
+                )
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError(f"gunicorn ({model}) did not start")
+
+
+def stop_server(server) -> None:
+    server.send_signal(signal.SIGTERM)
+    try:
+        server.wait(timeout=35)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--models", default="sync,gthread,uvicorn")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    data = seed(bookings=args.bookings)
+    print(
+        f"{args.bookings} bookings, {args.concurrency} clients, {os.cpu_count()} CPUs"
+    )
+
+    for model in args.models.split(","):
+        if model == "uvicorn":
+            try:
+                import uvicorn  # noqa: F401
+            except ImportError:
+                print(f"\n[{model}] skipped: pip install uvicorn")
+                continue
+
+        server = start_server(model, args.port)
+        try:
+            print(f"\n[{model}]")
+            print(
+                f"{'endpoint':<30} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}"
+            )
+            for scenario in build_scenarios(data):
+                drive(args.port, scenario, args.concurrency, args.duration)
+                latencies = scenario.latencies or [0.0]
+                print(
+                    f"{scenario.name:<30} "
+                    f"{len(scenario.latencies) / args.duration:>8.1f} "
+                    f"{percentile(latencies, 0.50) * 1e3:>8.1f} "
+                    f"{percentile(latencies, 0.99) * 1e3:>8.1f} "
+                    f"{scenario.errors:>7}"
+                )
+        finally:
+            stop_server(server)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""
+Settings of the server started by loadtest.py (and of the processes of
+bench_sqlite_concurrency.py): the project settings on a scratch SQLite
+file, with DEBUG off as in production
+"""
+
+import os
+
+from core.settings import *  # noqa: F401,F403
+
+DEBUG = False
+ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "api.infrastructure.sqlite_backend",
+        "NAME": os.environ["LOADTEST_DB"],
+    }
+}
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for RoomDomainService.build_availability_grid, the sweep behind
+GET /api/rooms/availability-grid/.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+from api.domain.services.room_domain_service import RoomDomainService
+
+START = datetime(2030, 1, 7, 8)
+END = datetime(2030, 1, 7, 12)
+SLOT = timedelta(minutes=30)
+
+
+def at(hour: float) -> datetime:
+    return datetime(2030, 1, 7) + timedelta(hours=hour)
+
+
+def grid(booked, room_ids=("r1",)):
+    return RoomDomainService.build_availability_grid(room_ids, booked, START, END, SLOT)
+
+
+def test_partially_covered_slots_are_busy():
+    booked = {"r1": [(at(8.75), at(9.25), "b1")]}
+
+    assert grid(booked) == {"r1": [[1, 3]]}
+
+
+def test_adjacent_and_overlapping_bookings_are_merged():
+    booked = {
+        "r1": [
+            (at(8), at(9), "b1"),
+            (at(8.5), at(9.5), "b2"),
+            (at(9.5), at(10), "b3"),
+            (at(11), at(11.5), "b4"),
+        ]
+    }
+
+    assert grid(booked) == {"r1": [[0, 4], [6, 7]]}
+
+
+def test_short_booking_inside_a_long_one_does_not_shorten_the_run():
+    booked = {"r1": [(at(8), at(11), "long"), (at(9), at(9.5), "short")]}
+
+    assert grid(booked) == {"r1": [[0, 6]]}
+
+
+def test_bookings_are_clipped_to_the_window_and_free_rooms_are_listed():
+    booked = {"r1": [(at(6), at(8.5), "b1"), (at(11.5), at(14), "b2")]}
+
+    assert grid(booked, ("r1", "r2")) == {"r1": [[0, 1], [7, 8]], "r2": []}
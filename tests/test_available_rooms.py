@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for DjangoRoomRepository.get_available_rooms, the NOT EXISTS
+anti-join: overlap at the boundaries, soft-deleted bookings and rooms, and
+the location / capacity filters.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from api.infrastructure.repositories.django_room_repository import (
+    DjangoRoomRepository,
+)
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+DAY = datetime(2030, 1, 7, tzinfo=timezone.utc)
+
+
+def at(hour: float) -> datetime:
+    return DAY + timedelta(hours=hour)
+
+
+@pytest.fixture
+def rooms(db):
+    sede = LocationModel.objects.create(name="Sede")
+    filial = LocationModel.objects.create(name="Filial")
+    manager = ManagerModel.objects.create(name="Gestor", email="g@example.com")
+    rooms = {
+        "busy": RoomModel.objects.create(name="busy", capacity=10, location=sede),
+        "cancelled": RoomModel.objects.create(
+            name="cancelled", capacity=4, location=sede
+        ),
+        "free": RoomModel.objects.create(name="free", capacity=4, location=filial),
+    }
+    RoomModel.objects.create(
+        name="deleted", capacity=20, location=sede, deleted_at=at(0)
+    )
+    BookingModel.objects.create(
+        room=rooms["busy"], manager=manager, name="A", start_date=at(9), end_date=at(10)
+    )
+    BookingModel.objects.create(
+        room=rooms["cancelled"],
+        manager=manager,
+        name="B",
+        start_date=at(9),
+        end_date=at(10),
+        deleted_at=at(0),
+    )
+    return rooms
+
+
+def available(start, end, **filters):
+    return sorted(
+        room.name
+        for room in DjangoRoomRepository().get_available_rooms(start, end, **filters)
+    )
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        (at(10), at(11), ["busy", "cancelled", "free"]),  # starts at its end
+        (at(8), at(9), ["busy", "cancelled", "free"]),  # ends at its start
+        (at(9.5), at(10.5), ["cancelled", "free"]),
+        (at(8), at(11), ["cancelled", "free"]),  # contains it
+        (at(9.25), at(9.75), ["cancelled", "free"]),  # inside it
+    ],
+)
+def test_boundaries(rooms, start, end, expected):
+    assert available(start, end) == expected
+
+
+def test_location_and_capacity_filters(rooms):
+    sede = rooms["busy"].location_id
+
+    assert available(at(10), at(11), location_id=sede) == ["busy", "cancelled"]
+    assert available(at(10), at(11), capacity_min=5) == ["busy"]
+    assert available(at(9), at(10), capacity_min=5) == []
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for BookingDomainService.find_batch_conflicts, the sweep used by
+bulk booking creation to check a batch against existing bookings and itself.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+from api.domain.services.booking_domain_service import BookingDomainService
+
+DAY = datetime(2030, 1, 7)
+
+
+def at(hour: float) -> datetime:
+    return DAY + timedelta(hours=hour)
+
+
+def test_candidates_overlapping_each_other_keep_the_earliest():
+    conflicts = BookingDomainService.find_batch_conflicts(
+        [(0, "r1", at(10), at(11)), (1, "r1", at(10.5), at(12))], {}
+    )
+
+    assert conflicts == {1: ("item", 0)}
+
+
+def test_touching_periods_do_not_conflict():
+    conflicts = BookingDomainService.find_batch_conflicts(
+        [(0, "r1", at(9), at(10)), (1, "r1", at(10), at(11))],
+        {"r1": [(at(11), at(12), "b1")]},
+    )
+
+    assert conflicts == {}
+
+
+def test_existing_booking_starting_inside_a_candidate_is_detected():
+    conflicts = BookingDomainService.find_batch_conflicts(
+        [(0, "r1", at(9), at(11)), (1, "r1", at(10), at(10.5))],
+        {"r1": [(at(10.75), at(12), "b1")]},
+    )
+
+    # Item 0 loses to the booking, so it must not block item 1
+    assert conflicts == {0: ("booking", "b1")}
+
+
+def test_long_existing_booking_is_found_behind_shorter_ones():
+    conflicts = BookingDomainService.find_batch_conflicts(
+        [(0, "r1", at(13), at(14))],
+        {"r1": [(at(8), at(16), "long"), (at(9), at(10), "short")]},
+    )
+
+    assert conflicts == {0: ("booking", "long")}
+
+
+def test_rooms_are_independent():
+    conflicts = BookingDomainService.find_batch_conflicts(
+        [(0, "r1", at(10), at(11)), (1, "r2", at(10), at(11))],
+        {"r2": [(at(12), at(13), "b1")]},
+    )
+
+    assert conflicts == {}
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Checks that the hot booking queries are planned on the partial composite
+indexes added in migration 0006 (SQLite and PostgreSQL).
+"""
+
+import os
+import sys
+from datetime import timedelta
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from api.models import Booking as BookingModel
+
+pytestmark = pytest.mark.django_db
+
+
+def _plan(queryset) -> str:
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            # Tiny test tables would otherwise always be sequentially scanned
+            cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+def test_room_overlap_query_uses_room_period_index():
+    now = timezone.now()
+    queryset = BookingModel.objects.filter(
+        room_id="room-id",
+        start_date__lt=now + timedelta(hours=1),
+        end_date__gt=now,
+        deleted_at__isnull=True,
+    )
+
+    assert "bookings_room_period_idx" in _plan(queryset)
+
+
+def test_manager_listing_uses_manager_start_index():
+    queryset = BookingModel.objects.filter(
+        manager_id="manager-id", deleted_at__isnull=True
+    ).order_by("start_date")
+
+    assert "bookings_manager_start_idx" in _plan(queryset)
+
+
+def test_date_range_query_uses_period_index():
+    now = timezone.now()
+    queryset = BookingModel.objects.filter(
+        start_date__lt=now + timedelta(days=1),
+        end_date__gt=now,
+        deleted_at__isnull=True,
+    )
+
+    assert "bookings_period_idx" in _plan(queryset)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for the database overlap guard (migration 0005): overlapping
+creates and updates raise BookingConflictError and answer 400, back-to-back
+bookings are allowed and legacy overlapping rows stay editable (and are
+reported when the migration runs).
+"""
+
+import importlib
+import os
+import sys
+from types import SimpleNamespace
+from datetime import datetime, timedelta, timezone
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+
+from api.domain.exceptions import BookingConflictError
+from api.infrastructure.repositories.django_booking_repository import (
+    DjangoBookingRepository,
+)
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+DAY = datetime(2030, 1, 7, tzinfo=timezone.utc)
+OVERLAP_MIGRATION = importlib.import_module(
+    "api.migrations.0005_booking_room_no_overlap"
+)
+
+
+def at(hour: float) -> datetime:
+    return DAY + timedelta(hours=hour)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def room(db):
+    location = LocationModel.objects.create(name="Sede")
+    return RoomModel.objects.create(name="Sala", capacity=4, location=location)
+
+
+@pytest.fixture
+def manager(db):
+    return ManagerModel.objects.create(name="Gestor", email="g@example.com")
+
+
+def payload(room, manager, start, end):
+    return {
+        "room": room.id,
+        "manager": manager.id,
+        "name": "Reunião",
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+    }
+
+
+def test_overlapping_create_is_rejected(room, manager):
+    client = Client()
+
+    first = client.post(
+        "/api/bookings/", payload(room, manager, at(9), at(10)), "application/json"
+    )
+    overlapping = client.post(
+        "/api/bookings/", payload(room, manager, at(9.5), at(10.5)), "application/json"
+    )
+    back_to_back = client.post(
+        "/api/bookings/", payload(room, manager, at(10), at(11)), "application/json"
+    )
+
+    assert first.status_code == 201
+    assert overlapping.status_code == 400
+    assert "not available" in overlapping.json()["error"]
+    assert back_to_back.status_code == 201
+    with pytest.raises(BookingConflictError):
+        DjangoBookingRepository().create_if_available(
+            {
+                "room_id": room.id,
+                "manager_id": manager.id,
+                "name": "Outra",
+                "start_date": at(8.5),
+                "end_date": at(9.5),
+            }
+        )
+
+
+def test_overlapping_update_is_rejected(room, manager):
+    BookingModel.objects.create(
+        room=room, manager=manager, name="A", start_date=at(9), end_date=at(10)
+    )
+    moved = BookingModel.objects.create(
+        room=room, manager=manager, name="B", start_date=at(10), end_date=at(11)
+    )
+
+    response = Client().patch(
+        f"/api/bookings/{moved.id}/",
+        {"start_date": at(9.5).isoformat()},
+        "application/json",
+    )
+
+    assert response.status_code == 400
+    with pytest.raises(BookingConflictError):
+        DjangoBookingRepository().update(moved.id, {"start_date": at(9.5)})
+    moved.refresh_from_db()
+    assert moved.start_date == at(10)
+
+
+def test_legacy_overlapping_rows_stay_editable(room, manager):
+    BookingModel.objects.create(
+        room=room, manager=manager, name="A", start_date=at(9), end_date=at(10)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("DROP TRIGGER bookings_room_no_overlap_insert")
+        legacy = BookingModel.objects.create(
+            room=room, manager=manager, name="B", start_date=at(9.5), end_date=at(11)
+        )
+        cursor.execute(OVERLAP_MIGRATION.SQLITE_FORWARD[0])
+
+    repository = DjangoBookingRepository()
+    renamed = repository.update(legacy.id, {"name": "B renomeada"})
+
+    assert renamed.name == "B renomeada"
+    with pytest.raises(BookingConflictError):
+        repository.update(legacy.id, {"end_date": at(11.5)})
+    with pytest.warns(UserWarning, match=f"booking {legacy.id}"):
+        OVERLAP_MIGRATION.check_existing_overlaps(
+            None, SimpleNamespace(connection=connection)
+        )
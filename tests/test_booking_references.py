@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for resolving a booking's room and manager once per request: the
+input DTO exposes the entities it loaded and booking creation reuses them.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from api.application.dto.booking_dto import BookingInputDTO
+from api.infrastructure.unit_of_work import DjangoUnitOfWork
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+
+@pytest.fixture
+def payload(db):
+    location = LocationModel.objects.create(name="Sede")
+    room = RoomModel.objects.create(name="Sala", capacity=4, location=location)
+    manager = ManagerModel.objects.create(name="Gestor", email="g@example.com")
+    return {
+        "room": room.id,
+        "manager": manager.id,
+        "name": "Reunião",
+        "start_date": datetime(2030, 1, 7, 9, tzinfo=timezone.utc).isoformat(),
+        "end_date": datetime(2030, 1, 7, 10, tzinfo=timezone.utc).isoformat(),
+    }
+
+
+def test_input_dto_exposes_the_loaded_entities(payload):
+    unit_of_work = DjangoUnitOfWork()
+    dto = BookingInputDTO(
+        data=payload,
+        context={
+            "room_repository": unit_of_work.rooms,
+            "manager_repository": unit_of_work.managers,
+        },
+    )
+
+    assert dto.is_valid(), dto.errors
+    assert dto.resolved["room"].id == payload["room"]
+    assert dto.resolved["manager"].id == payload["manager"]
+
+    missing = BookingInputDTO(
+        data={**payload, "room": "missing"},
+        context={"room_repository": unit_of_work.rooms},
+    )
+    assert not missing.is_valid()
+    assert "room" in missing.errors
+
+
+def test_create_loads_room_and_manager_once(payload):
+    with CaptureQueriesContext(connection) as queries:
+        response = Client().post("/api/bookings/", payload, "application/json")
+
+    selects = [q["sql"] for q in queries if q["sql"].startswith("SELECT")]
+    assert response.status_code == 201
+    assert response.json()["room"]["id"] == payload["room"]
+    assert sum('FROM "rooms"' in sql for sql in selects) == 1
+    assert sum('FROM "managers"' in sql for sql in selects) == 1
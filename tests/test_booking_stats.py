@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the aggregated booking statistics of rooms and managers
+(api/infrastructure/repositories/booking_stats.py).
+"""
+
+import os
+import sys
+from datetime import timedelta
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api.infrastructure.repositories.django_manager_repository import (
+    DjangoManagerRepository,
+)
+from api.infrastructure.repositories.django_room_repository import (
+    DjangoRoomRepository,
+)
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def rows():
+    location = LocationModel.objects.create(name="Location")
+    rooms = [
+        RoomModel.objects.create(name=f"Room {i}", capacity=10, location=location)
+        for i in range(2)
+    ]
+    managers = [
+        ManagerModel.objects.create(name=f"Manager {i}", email=f"m{i}@example.com")
+        for i in range(2)
+    ]
+    now = timezone.now()
+
+    def book(room, manager, start, hours, deleted=False):
+        BookingModel.objects.create(
+            name="Booking",
+            room=room,
+            manager=manager,
+            start_date=start,
+            end_date=start + timedelta(hours=hours),
+            deleted_at=now if deleted else None,
+        )
+
+    book(rooms[0], managers[0], now - timedelta(minutes=30), 1)  # active
+    book(rooms[0], managers[1], now - timedelta(days=1), 2)  # completed
+    book(rooms[0], managers[1], now + timedelta(days=1), 3)  # upcoming
+    book(rooms[0], managers[0], now + timedelta(days=2), 1, deleted=True)
+    return rooms, managers
+
+
+def test_room_stats_are_aggregated_in_one_query(rows):
+    rooms, managers = rows
+
+    with CaptureQueriesContext(connection) as queries:
+        stats = DjangoRoomRepository().get_rooms_bookings_stats(
+            [room.id for room in rooms]
+        )
+
+    assert len(queries) == 1
+    assert stats[rooms[0].id] == {
+        "total": 3,
+        "active": 1,
+        "upcoming": 1,
+        "completed": 1,
+        "average_duration_hours": 2.0,
+        "most_frequent_manager_id": managers[1].id,
+    }
+    assert stats[rooms[1].id]["total"] == 0
+    assert stats[rooms[1].id]["most_frequent_manager_id"] is None
+
+
+def test_manager_counts_ignore_cancelled_bookings(rows):
+    _, managers = rows
+
+    counts = DjangoManagerRepository().get_manager_bookings_count(managers[0].id)
+
+    assert counts == {"total": 1, "active": 1, "upcoming": 0, "completed": 0}
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for POST /api/bookings/bulk/: all-or-nothing and partial batches,
+and recurring items being rejected instead of losing their occurrences.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.core.cache import cache
+from django.test import Client
+
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+DAY = datetime(2030, 1, 7, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def item(db):
+    location = LocationModel.objects.create(name="Sede")
+    room = RoomModel.objects.create(name="Sala", capacity=4, location=location)
+    manager = ManagerModel.objects.create(name="Gestor", email="g@example.com")
+
+    def item(day: int, hour: int = 9, **extra):
+        start = DAY + timedelta(days=day, hours=hour)
+        return {
+            "room": room.id,
+            "manager": manager.id,
+            "name": "Daily",
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(hours=1)).isoformat(),
+            **extra,
+        }
+
+    return item
+
+
+def bulk(items, mode="all_or_nothing"):
+    return Client().post(
+        "/api/bookings/bulk/", {"mode": mode, "items": items}, "application/json"
+    )
+
+
+def test_all_items_are_created(item):
+    response = bulk([item(0), item(1)])
+
+    assert response.status_code == 201
+    assert response.json()["created"] == 2
+    assert BookingModel.objects.count() == 2
+
+
+def test_partial_mode_reports_the_conflicting_item(item):
+    response = bulk([item(0), item(0, hour=9)], mode="partial")
+
+    body = response.json()
+    assert response.status_code == 207
+    assert [result["status"] for result in body["results"]] == ["created", "error"]
+    assert BookingModel.objects.count() == 1
+
+
+def test_recurring_items_are_rejected(item):
+    recurrence = {"frequency": "daily", "count": 3}
+
+    response = bulk([item(0), item(1, recurrence=recurrence)], mode="partial")
+
+    assert response.status_code == 400
+    assert "Recurrence" in response.json()["error"]
+    assert not BookingModel.objects.exists()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for the environment-driven database settings and the health endpoint
+"""
+
+import os
+import sys
+
+import django
+import pytest
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+from rest_framework.test import APIClient
+
+from core.database import database_from_url, pool_supported
+
+
+def test_postgres_url():
+    config = database_from_url(
+        "postgresql://labtras_user:p%40ss@db:5432/labtras_db?sslmode=require",
+        conn_max_age=60,
+        conn_health_checks=True,
+    )
+    assert config["ENGINE"] == "django.db.backends.postgresql"
+    assert (config["NAME"], config["USER"], config["PASSWORD"]) == (
+        "labtras_db",
+        "labtras_user",
+        "p@ss",
+    )
+    assert (config["HOST"], config["PORT"]) == ("db", "5432")
+    assert config["OPTIONS"] == {"sslmode": "require"}
+    assert (config["CONN_MAX_AGE"], config["CONN_HEALTH_CHECKS"]) == (60, True)
+
+
+def test_pool_only_where_supported():
+    config = database_from_url(
+        "postgres://u:p@db/labtras_db", conn_max_age=60, pool={"max_size": 4}
+    )
+    if pool_supported():
+        assert config["OPTIONS"]["pool"] == {"max_size": 4}
+        assert config["CONN_MAX_AGE"] == 0
+    else:
+        assert "pool" not in config["OPTIONS"]
+        assert config["CONN_MAX_AGE"] == 60
+
+
+def test_sqlite_urls():
+    assert database_from_url("sqlite:///db.sqlite3")["NAME"] == "db.sqlite3"
+    assert database_from_url("sqlite:////data/db.sqlite3")["NAME"] == "/data/db.sqlite3"
+    with pytest.raises(ValueError):
+        database_from_url("mysql://u:p@db/labtras_db")
+
+
+@pytest.mark.django_db
+def test_health_reports_connection_stats():
+    response = APIClient().get("/api/health/")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    database = body["database"]
+    assert database["alias"] == "default"
+    assert database["open"] >= 1
+    assert database["requests_in_flight"] >= 1
+    assert database["latency_ms"] >= 0
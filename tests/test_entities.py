@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the slotted domain entities: every constructor argument has a
+slot, instances carry no __dict__, and the domain methods and the
+repositories' model conversion still work.
+"""
+
+import inspect
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from api.domain.entities.booking import Booking
+from api.domain.entities.location import Location
+from api.domain.entities.manager import Manager
+from api.domain.entities.room import Room
+from api.infrastructure.repositories.django_booking_repository import (
+    DjangoBookingRepository,
+)
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+ENTITIES = [Booking, Location, Manager, Room]
+
+
+@pytest.mark.parametrize("entity", ENTITIES)
+def test_constructor_arguments_match_the_slots(entity):
+    parameters = list(inspect.signature(entity.__init__).parameters)[1:]
+
+    assert set(parameters) == set(entity.__slots__)
+    instance = entity()
+    assert not hasattr(instance, "__dict__")
+    for name in entity.__slots__:
+        getattr(instance, name)
+    with pytest.raises(AttributeError):
+        instance.unexpected = True
+
+
+def test_domain_methods_work_on_slotted_instances():
+    start = datetime.now() + timedelta(days=1)
+    booking = Booking(
+        room_id="r",
+        manager_id="m",
+        start_date=start,
+        end_date=start + timedelta(hours=2),
+    )
+    room = Room(name="Sala", capacity=4)
+
+    booking.update_booking(coffee_option=True, coffee_quantity=3)
+    room.update_info(capacity=10)
+    room.mark_as_deleted()
+
+    assert booking.duration_hours == 2
+    assert booking.can_be_modified() and booking.is_active
+    assert room.capacity == 10 and not room.is_active
+
+
+@pytest.mark.django_db
+def test_model_conversion_fills_every_slot():
+    location = LocationModel.objects.create(name="Sede")
+    room = RoomModel.objects.create(name="Sala", capacity=4, location=location)
+    manager = ManagerModel.objects.create(name="Gestor", email="g@example.com")
+    booking = BookingModel.objects.create(
+        room=room,
+        manager=manager,
+        name="Reunião",
+        start_date=datetime(2030, 1, 7, 9, tzinfo=timezone.utc),
+        end_date=datetime(2030, 1, 7, 10, tzinfo=timezone.utc),
+    )
+
+    entity = DjangoBookingRepository().get_by_id(booking.id)
+
+    assert (entity.id, entity.room_id, entity.name) == (booking.id, room.id, "Reunião")
+    assert isinstance(entity.room, Room) and entity.room.location_id == location.id
+    assert isinstance(entity.manager, Manager)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming booking export: NDJSON and JSON array output,
+filters, and errors raised before and during the stream.
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.core.cache import cache
+from django.test import Client, override_settings
+
+from api.infrastructure.repositories.django_booking_repository import (
+    DjangoBookingRepository,
+)
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+DAY = datetime(2030, 1, 7, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def rooms(db):
+    location = LocationModel.objects.create(name="Sede")
+    manager = ManagerModel.objects.create(name="Gestor", email="g@example.com")
+    rooms = [
+        RoomModel.objects.create(name=name, capacity=4, location=location)
+        for name in ("Sala A", "Sala B")
+    ]
+    for day in range(3):
+        for room in rooms:
+            BookingModel.objects.create(
+                room=room,
+                manager=manager,
+                name=f"{room.name} {day}",
+                start_date=DAY + timedelta(days=day, hours=9),
+                end_date=DAY + timedelta(days=day, hours=10),
+            )
+    return rooms
+
+
+def body(response) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+def test_ndjson_lines_follow_the_filters(rooms):
+    response = Client().get("/api/bookings/export/", {"room": rooms[0].id})
+
+    lines = [json.loads(line) for line in body(response).splitlines()]
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert [row["name"] for row in lines] == ["Sala A 0", "Sala A 1", "Sala A 2"]
+    assert lines[0]["room"]["id"] == rooms[0].id
+
+
+@override_settings(BOOKING_EXPORT_CHUNK_SIZE=2)
+def test_json_array_spans_chunks(rooms):
+    response = Client().get(
+        "/api/bookings/export/",
+        {"output": "json", "start_date_from": (DAY + timedelta(days=1)).isoformat()},
+    )
+
+    rows = json.loads(body(response))
+    assert response["Content-Type"] == "application/json"
+    assert len(rows) == 4
+    empty = Client().get("/api/bookings/export/", {"output": "json", "room": "x"})
+    assert json.loads(body(empty)) == []
+
+
+def test_invalid_parameters_answer_400(rooms):
+    client = Client()
+
+    assert client.get("/api/bookings/export/", {"output": "csv"}).status_code == 400
+    invalid = client.get("/api/bookings/export/", {"start_date_from": "ontem"})
+    assert invalid.status_code == 400
+    assert "ontem" in invalid.json()["error"]
+
+
+@override_settings(BOOKING_EXPORT_CHUNK_SIZE=2)
+def test_error_after_the_first_chunk_aborts_the_stream(rooms, monkeypatch):
+    original = DjangoBookingRepository._row_to_dict
+    calls = []
+
+    def failing(row):
+        calls.append(row)
+        if len(calls) > 2:
+            raise RuntimeError("connection lost")
+        return original(row)
+
+    monkeypatch.setattr(DjangoBookingRepository, "_row_to_dict", staticmethod(failing))
+    response = Client().get("/api/bookings/export/")
+
+    assert response.status_code == 200
+    with pytest.raises(RuntimeError):
+        body(response)
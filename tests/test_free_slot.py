@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for RoomDomainService.find_earliest_gap, the per-room merge behind
+GET /api/rooms/find-free-slot/.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+from api.domain.services.room_domain_service import RoomDomainService
+
+HOUR = timedelta(hours=1)
+
+
+def at(hour: float) -> datetime:
+    return datetime(2030, 1, 7) + timedelta(hours=hour)
+
+
+def earliest(booked, duration=HOUR, start=at(9), end=at(18)):
+    return RoomDomainService.find_earliest_gap(booked, start, end, duration)
+
+
+def test_free_room_starts_at_the_window_start():
+    assert earliest([]) == at(9)
+
+
+def test_gaps_shorter_than_the_duration_are_skipped():
+    booked = [(at(9), at(10), "b1"), (at(10.5), at(12), "b2")]
+
+    assert earliest(booked) == at(12)
+    assert earliest(booked, duration=timedelta(minutes=30)) == at(10)
+
+
+def test_long_booking_covers_the_gaps_between_shorter_ones():
+    booked = [(at(8), at(14), "long"), (at(10), at(11), "short")]
+
+    assert earliest(booked) == at(14)
+
+
+def test_no_gap_before_the_window_end():
+    booked = [(at(9), at(17.5), "b1")]
+
+    assert earliest(booked) is None
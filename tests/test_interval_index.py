@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-memory booking interval index: overlap at the boundaries,
+soft-deleted bookings, staleness against other writers and invalidation,
+and write-path checks going to the database instead.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from api.domain.services.room_domain_service import RoomDomainService
+from api.infrastructure.repositories.booking_interval_index import (
+    BookingIntervalIndex,
+    booking_interval_index,
+)
+from api.infrastructure.repositories.django_booking_repository import (
+    DjangoBookingRepository,
+)
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+DAY = datetime(2030, 1, 7, tzinfo=timezone.utc)
+
+
+def at(hour: float) -> datetime:
+    return DAY + timedelta(hours=hour)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    booking_interval_index.invalidate()
+    yield
+    cache.clear()
+    booking_interval_index.invalidate()
+
+
+@pytest.fixture
+def room(db):
+    location = LocationModel.objects.create(name="Sede")
+    return RoomModel.objects.create(name="Sala", capacity=4, location=location)
+
+
+@pytest.fixture
+def manager(db):
+    return ManagerModel.objects.create(name="Gestor", email="g@example.com")
+
+
+def book(room, manager, start, end, **extra):
+    return BookingModel.objects.create(
+        room=room,
+        manager=manager,
+        name="Reunião",
+        start_date=start,
+        end_date=end,
+        **extra
+    )
+
+
+def test_overlap_at_the_boundaries(room, manager):
+    booking = book(room, manager, at(9), at(10))
+    index = BookingIntervalIndex()
+
+    assert index.find_conflicts(room.id, at(10), at(11)) == []
+    assert index.find_conflicts(room.id, at(8), at(9)) == []
+    assert index.find_conflicts(room.id, at(9.5), at(10.5)) == [booking.id]
+    assert index.find_conflicts(room.id, at(8), at(12)) == [booking.id]
+    assert index.find_conflicts(room.id, at(9), at(10), booking.id) == []
+
+
+def test_soft_deleted_bookings_are_ignored(
+    room, manager, django_capture_on_commit_callbacks
+):
+    book(room, manager, at(9), at(10), deleted_at=at(0))
+    active = book(room, manager, at(11), at(12))
+    assert booking_interval_index.find_conflicts(room.id, at(8), at(13)) == [active.id]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert DjangoBookingRepository().soft_delete(active.id)
+
+    assert booking_interval_index.find_conflicts(room.id, at(8), at(13)) == []
+
+
+def test_other_writers_are_seen_after_invalidation_or_expiry(room, manager):
+    index = BookingIntervalIndex()
+    assert index.find_conflicts(room.id, at(9), at(10)) == []
+
+    # Inserted behind the index's back, as another worker process would
+    booking = book(room, manager, at(9), at(10))
+
+    assert index.find_conflicts(room.id, at(9), at(10)) == []
+    index.invalidate(room.id)
+    assert index.find_conflicts(room.id, at(9), at(10)) == [booking.id]
+
+    other = book(room, manager, at(10), at(11))
+    assert index.find_conflicts(room.id, at(10), at(11)) == []
+    with override_settings(BOOKING_INTERVAL_INDEX={"TTL_SECONDS": 0}):
+        assert index.find_conflicts(room.id, at(10), at(11)) == [other.id]
+
+
+def test_write_checks_ignore_a_stale_index(room, manager):
+    assert booking_interval_index.find_conflicts(room.id, at(9), at(10)) == []
+    booking = book(room, manager, at(9), at(10))
+    repository = DjangoBookingRepository()
+
+    assert repository.get_conflicting_bookings(room.id, at(9), at(10)) == []
+    assert [b.id for b in repository.find_conflicts(room.id, at(9), at(10))] == [
+        booking.id
+    ]
+    assert not RoomDomainService.check_room_availability(
+        room, at(9.5), at(10.5), booking_repository=repository
+    )
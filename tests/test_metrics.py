@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the Prometheus metrics: instrumented use cases and repositories,
+read cache hit/miss counters and the /metrics exposition.
+"""
+
+import os
+import sys
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.core.cache import cache
+from django.test import Client, override_settings
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+from api.application.use_cases.location_use_cases import ListLocationsUseCase
+from api.infrastructure import metrics
+from api.infrastructure.repositories.django_location_repository import (
+    DjangoLocationRepository,
+)
+from api.models import Location as LocationModel
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _sample(name, **labels):
+    return prometheus_client.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_use_cases_and_repositories_are_wrapped_once():
+    metrics.install()
+
+    execute = ListLocationsUseCase.__dict__["execute"]
+    get_by_id = DjangoLocationRepository.__dict__["get_by_id"]
+    assert execute.__wrapped_by_metrics__
+    assert get_by_id.__wrapped_by_metrics__
+    assert not hasattr(execute.__wrapped__, "__wrapped_by_metrics__")
+
+
+@pytest.mark.django_db
+def test_requests_feed_the_histograms_and_cache_counters():
+    LocationModel.objects.create(name="Sede")
+    labels = {"entity": "location", "part": "body"}
+    requests = _sample(
+        "api_requests_total",
+        viewset="LocationViewSet",
+        action="list",
+        method="GET",
+        status="200",
+    )
+    use_case = _sample(
+        "api_use_case_duration_seconds_count",
+        use_case="ListLocationsUseCase",
+        method="execute_serialized",
+    )
+    misses = _sample("api_read_cache_lookups_total", result="miss", **labels)
+    hits = _sample("api_read_cache_lookups_total", result="hit", **labels)
+
+    client = Client()
+    assert client.get("/api/locations/").status_code == 200
+    assert client.get("/api/locations/").status_code == 200
+
+    assert (
+        _sample(
+            "api_requests_total",
+            viewset="LocationViewSet",
+            action="list",
+            method="GET",
+            status="200",
+        )
+        == requests + 2
+    )
+    assert (
+        _sample(
+            "api_use_case_duration_seconds_count",
+            use_case="ListLocationsUseCase",
+            method="execute_serialized",
+        )
+        == use_case + 1
+    )
+    assert (
+        _sample("api_read_cache_lookups_total", result="miss", **labels) == misses + 1
+    )
+    assert _sample("api_read_cache_lookups_total", result="hit", **labels) == hits + 1
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint():
+    Client().get("/api/locations/")
+    response = Client().get("/metrics")
+    body = response.content.decode()
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+    assert "api_request_duration_seconds_bucket" in body
+    assert "api_repository_duration_seconds_count" in body
+    assert 'api_db_connections_open{alias="default"}' in body
+
+    with override_settings(METRICS={"ENABLED": False}):
+        assert Client().get("/metrics").status_code == 503
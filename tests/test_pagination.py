@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for cursor pagination: cursor round-trips, tampered cursors answering
+400 and the limit clamp.
+"""
+
+import base64
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.core.cache import cache
+from django.test import Client, override_settings
+
+from api.infrastructure.repositories.pagination import decode_cursor, encode_cursor
+from api.models import Location as LocationModel
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def test_cursor_round_trip():
+    moment = datetime(2030, 1, 7, 9, 30, 15, 123456, tzinfo=timezone.utc)
+
+    assert decode_cursor(encode_cursor(moment, "abc")) == (moment, "abc")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!",
+        raw_cursor({"a": 1}),
+        raw_cursor([1, "x"]),
+        raw_cursor([None, "x"]),
+        raw_cursor(["yesterday", "x"]),
+        raw_cursor(["2030-02-30T00:00:00", "x"]),
+        raw_cursor(["2030-01-07T09:00:00+00:00", 5]),
+        raw_cursor(["2030-01-07T09:00:00+00:00", "x", "y"]),
+    ],
+)
+def test_tampered_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+@pytest.mark.django_db
+def test_pages_follow_the_cursor_and_bad_cursors_answer_400():
+    for number in range(5):
+        LocationModel.objects.create(name=f"Sede {number}")
+    client = Client()
+
+    names, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/api/locations/", params).json()
+        names += [location["name"] for location in page["results"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(names) == [f"Sede {number}" for number in range(5)]
+    tampered = client.get("/api/locations/", {"cursor": raw_cursor([1, "x"])})
+    assert tampered.status_code == 400
+    assert tampered.json() == {"error": "Invalid cursor"}
+
+
+@pytest.mark.django_db
+def test_limit_is_clamped_and_validated():
+    for number in range(3):
+        LocationModel.objects.create(name=f"Sede {number}")
+    client = Client()
+
+    with override_settings(API_PAGINATION={"MAX_LIMIT": 2}):
+        page = client.get("/api/locations/", {"limit": 1000}).json()
+
+    assert len(page["results"]) == 2 and page["next_cursor"]
+    assert client.get("/api/locations/", {"limit": 0}).status_code == 400
+    assert client.get("/api/locations/", {"limit": "ten"}).status_code == 400
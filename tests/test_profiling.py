@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-demand profiling hook: request selection (endpoint list,
+signed header), refusal with a placeholder SECRET_KEY, layer labels and
+the files written and pruned per profile.
+"""
+
+import os
+import pstats
+import sys
+import threading
+import time
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.core.cache import cache
+from django.test import Client, override_settings
+
+from api.infrastructure.profiling import StackSampler, layer_of, prune, sign_mode
+from api.models import Location as LocationModel
+
+SECRET_KEY = "test-profiling-secret-key"
+
+
+def profiling(**overrides):
+    return override_settings(
+        SECRET_KEY=SECRET_KEY, PROFILING={"ENABLED": True, **overrides}
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _spin(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_layer_of_source_files():
+    assert layer_of("/app/api/infrastructure/viewsets/room_viewset.py") == "viewset"
+    assert layer_of("/app/api/application/use_cases/room_use_cases.py") == "use_case"
+    assert layer_of("/app/api/domain/services/booking_service.py") == "domain"
+    assert (
+        layer_of("/app/api/infrastructure/repositories/django_room_repository.py")
+        == "repository"
+    )
+    assert layer_of("/venv/django/db/backends/utils.py") == "sql"
+    assert layer_of("/venv/rest_framework/views.py") is None
+
+
+def test_sampler_collapses_the_target_thread_stack():
+    sampler = StackSampler(threading.get_ident(), 0.001, full=True)
+    sampler.start()
+    _spin(0.2)
+    sampler.stop()
+
+    assert sum(sampler.stacks.values()) > 0
+    assert any("_spin" in stack for stack in sampler.stacks)
+
+
+@pytest.mark.django_db
+def test_listed_endpoint_writes_collapsed_stacks(tmp_path):
+    LocationModel.objects.create(name="Sede")
+    with profiling(OUTPUT_DIR=tmp_path, ENDPOINTS=["LocationViewSet.list"]):
+        response = Client().get("/api/locations/")
+        other = Client().get("/api/rooms/")
+
+    name = response["X-Profile-Output"]
+    path = tmp_path / name
+    assert response.status_code == 200
+    assert name.endswith(".collapsed") and os.path.basename(name) == name
+    for line in open(path).read().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack and int(count) > 0
+    assert not other.has_header("X-Profile-Output")
+
+
+@pytest.mark.django_db
+def test_signed_header_selects_cprofile(tmp_path):
+    with profiling(OUTPUT_DIR=tmp_path):
+        response = Client().get("/api/locations/", HTTP_X_PROFILE=sign_mode("cprofile"))
+        forged = Client().get("/api/locations/", HTTP_X_PROFILE="cprofile:x:y")
+
+    path = tmp_path / response["X-Profile-Output"]
+    assert path.suffix == ".prof"
+    assert pstats.Stats(str(path)).total_calls > 0
+    assert forged.status_code == 200
+    assert not forged.has_header("X-Profile-Output")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "secret_key, enabled",
+    [
+        (SECRET_KEY, False),
+        ("django-insecure-abc", True),
+        ("change-me-in-production", True),
+    ],
+)
+def test_disabled_or_placeholder_key_refuses_to_profile(tmp_path, secret_key, enabled):
+    with override_settings(SECRET_KEY=secret_key):
+        header = sign_mode("cprofile")
+        with override_settings(
+            PROFILING={
+                "ENABLED": enabled,
+                "OUTPUT_DIR": tmp_path,
+                "ENDPOINTS": ["LocationViewSet.list"],
+            }
+        ):
+            response = Client().get("/api/locations/", HTTP_X_PROFILE=header)
+
+    assert response.status_code == 200
+    assert not response.has_header("X-Profile-Output")
+    assert not list(tmp_path.iterdir())
+
+
+def test_prune_keeps_the_newest_profiles(tmp_path):
+    for age, name in enumerate(["c.prof", "b.collapsed", "a.prof"]):
+        path = tmp_path / name
+        path.write_text("")
+        os.utime(path, (time.time() - age, time.time() - age))
+    (tmp_path / "notes.txt").write_text("")
+
+    prune(str(tmp_path), keep=2)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "b.collapsed",
+        "c.prof",
+        "notes.txt",
+    ]
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-request query accounting middleware: headers, sampling
+and repeated-statement (N+1) flagging.
+"""
+
+import logging
+import os
+import sys
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+
+from api.infrastructure.query_accounting import (
+    QueryAccountingMiddleware,
+    QueryRecorder,
+    fingerprint,
+    logger,
+)
+from api.models import Location as LocationModel
+from api.models import Room as RoomModel
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_fingerprint_collapses_in_lists():
+    assert fingerprint('SELECT 1 WHERE "id" IN (%s, %s, %s)') == fingerprint(
+        'SELECT 1 WHERE "id" IN (%s)'
+    )
+
+
+@pytest.mark.django_db
+def test_recorder_counts_repeated_statements():
+    recorder = QueryRecorder()
+    with connection.execute_wrapper(recorder):
+        for i in range(6):
+            LocationModel.objects.filter(name=f"Sede {i}").exists()
+        LocationModel.objects.count()
+
+    assert recorder.count == 7
+    repeated = recorder.repeated(threshold=5)
+    assert [entry["count"] for entry in repeated] == [6]
+    assert recorder.repeated(threshold=7) == []
+
+
+@pytest.mark.django_db
+@override_settings(QUERY_ACCOUNTING={"SAMPLE_RATE": 1.0})
+def test_headers_report_query_count():
+    LocationModel.objects.create(name="Sede")
+
+    response = Client().get("/api/locations/")
+
+    assert response.status_code == 200
+    assert int(response["X-DB-Queries"]) >= 1
+    assert response["Server-Timing"].startswith("db;dur=")
+    assert f'desc="{response["X-DB-Queries"]} queries"' in response["Server-Timing"]
+
+
+@pytest.mark.django_db
+@override_settings(QUERY_ACCOUNTING={"SAMPLE_RATE": 0.0})
+def test_unsampled_requests_are_not_wrapped():
+    response = Client().get("/api/locations/")
+
+    assert response.status_code == 200
+    assert not response.has_header("X-DB-Queries")
+
+
+@pytest.mark.django_db
+@override_settings(QUERY_ACCOUNTING={"SAMPLE_RATE": 1.0, "N_PLUS_ONE_THRESHOLD": 3})
+def test_repeated_statements_logged_as_warning(caplog):
+    def view(request):
+        for i in range(4):
+            LocationModel.objects.filter(name=f"Sede {i}").exists()
+        return HttpResponse("ok")
+
+    logger.addHandler(caplog.handler)
+    try:
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            QueryAccountingMiddleware(view)(RequestFactory().get("/rooms"))
+    finally:
+        logger.removeHandler(caplog.handler)
+
+    (record,) = caplog.records
+    assert record.levelno == logging.WARNING
+    assert record.fields["queries"] == 4
+    assert record.fields["repeated"][0]["count"] == 4
+
+
+@pytest.mark.django_db
+def test_delete_location_checks_rooms_without_loading_them():
+    location = LocationModel.objects.create(name="Sede")
+    empty = LocationModel.objects.create(name="Anexo")
+    RoomModel.objects.create(name="Sala", capacity=4, location=location)
+    client = Client()
+
+    assert client.delete(f"/api/locations/{location.id}/").status_code == 400
+    assert client.delete(f"/api/locations/{empty.id}/").status_code == 204
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached list/detail reads and conditional GET: invalidation by
+repository writes and weak ETags answering 304 Not Modified.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.core.cache import cache
+from django.test import Client
+
+from api.infrastructure.repositories.django_location_repository import (
+    DjangoLocationRepository,
+)
+from api.infrastructure.repositories.read_cache import read_cache
+from api.infrastructure.viewsets.conditional import item_validators, list_validators
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_weak_validators_follow_the_stamp():
+    moment = datetime(2030, 1, 7, 12, 30, tzinfo=timezone.utc)
+
+    validators = list_validators(2, moment)
+
+    assert validators.etag.startswith('W/"')
+    assert validators == list_validators(2, moment)
+    assert validators.etag != list_validators(3, moment).etag
+    assert validators.last_modified == 1894019400
+    assert item_validators("a", None) is None
+    assert item_validators("a", moment).etag != item_validators("b", moment).etag
+
+
+@pytest.mark.django_db
+def test_repository_writes_retire_cached_reads():
+    repository = DjangoLocationRepository()
+    location = repository.create({"name": "Sede", "address": None})
+    calls = []
+
+    def listing():
+        calls.append("list")
+        return repository.get_all_rows()
+
+    list_key = read_cache.list_key("location", None)
+    item_key = read_cache.item_key("location", location.id)
+    first = read_cache.fetch(list_key, "body", listing)
+    assert read_cache.fetch(read_cache.list_key("location", None), "body", listing)
+    assert calls == ["list"]
+
+    repository.update(location.id, {"address": "Rua A, 1"})
+
+    assert read_cache.list_key("location", None) != list_key
+    assert read_cache.item_key("location", location.id) != item_key
+    second = read_cache.fetch(read_cache.list_key("location", None), "body", listing)
+    assert calls == ["list", "list"]
+    assert second[0]["address"] == "Rua A, 1" != first[0]["address"]
+
+
+@pytest.mark.django_db
+def test_conditional_get_answers_not_modified():
+    DjangoLocationRepository().create({"name": "Sede", "address": None})
+    client = Client()
+
+    response = client.get("/api/locations/")
+    etag = response["ETag"]
+    assert response.status_code == 200
+    assert "no-cache" in response["Cache-Control"]
+
+    cached = client.get("/api/locations/", HTTP_IF_NONE_MATCH=etag)
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    client.post(
+        "/api/locations/",
+        {"name": "Filial", "address": "Rua B, 2"},
+        content_type="application/json",
+    )
+    changed = client.get("/api/locations/", HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert len(changed.json()) == 2
+
+
+@pytest.mark.django_db
+def test_last_modified_waits_for_its_second_to_end():
+    location = DjangoLocationRepository().create({"name": "Sede", "address": None})
+    client = Client()
+
+    # Written this second: another write may follow within it, so only the
+    # ETag validates and If-Modified-Since is ignored
+    fresh = client.get(f"/api/locations/{location.id}/")
+    assert not fresh.has_header("Last-Modified")
+    since = client.get(
+        f"/api/locations/{location.id}/",
+        HTTP_IF_MODIFIED_SINCE="Thu, 01 Jan 2099 00:00:00 GMT",
+    )
+    assert since.status_code == 200
+
+    LocationModel.objects.filter(id=location.id).update(
+        updated_at=datetime.now(timezone.utc) - timedelta(minutes=1)
+    )
+    cache.clear()
+    settled = client.get(f"/api/locations/{location.id}/")
+    last_modified = settled["Last-Modified"]
+    cached = client.get(
+        f"/api/locations/{location.id}/", HTTP_IF_MODIFIED_SINCE=last_modified
+    )
+    assert cached.status_code == 304
+
+
+@pytest.mark.django_db
+def test_booking_etag_follows_embedded_room():
+    location = DjangoLocationRepository().create({"name": "Sede", "address": None})
+    room = RoomModel.objects.create(name="Sala", capacity=4, location_id=location.id)
+    manager = ManagerModel.objects.create(name="Gestor", email="g@example.com")
+    booking = BookingModel.objects.create(
+        room=room,
+        manager=manager,
+        name="Reunião",
+        start_date=datetime(2030, 1, 7, 9, tzinfo=timezone.utc),
+        end_date=datetime(2030, 1, 7, 10, tzinfo=timezone.utc),
+    )
+    client = Client()
+    detail = client.get(f"/api/bookings/{booking.id}/")
+    listing = client.get("/api/bookings/")
+
+    RoomModel.objects.filter(id=room.id).update(
+        name="Sala Azul", updated_at=datetime(2031, 1, 1, tzinfo=timezone.utc)
+    )
+
+    changed = client.get(
+        f"/api/bookings/{booking.id}/", HTTP_IF_NONE_MATCH=detail["ETag"]
+    )
+    assert changed.status_code == 200
+    assert changed.json()["room"]["name"] == "Sala Azul"
+    assert (
+        client.get("/api/bookings/", HTTP_IF_NONE_MATCH=listing["ETag"]).status_code
+        == 200
+    )
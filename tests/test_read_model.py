@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the values()-based read model: list responses must be identical
+whether served from the read model or through entities and output DTOs.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from django.core.cache import cache
+from django.test import Client, override_settings
+
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+LISTS = ["/api/locations/", "/api/rooms/", "/api/managers/", "/api/bookings/"]
+
+
+@pytest.fixture
+def data(db):
+    location = LocationModel.objects.create(name="Sede", address="Rua A, 1")
+    LocationModel.objects.create(name="Filial")
+    room = RoomModel.objects.create(
+        name="Sala", capacity=8, location=location, description="Projetor"
+    )
+    RoomModel.objects.create(name="Cabine", location=location)
+    manager = ManagerModel.objects.create(
+        name="Gestor", email="g@example.com", phone="48 9999-0000"
+    )
+    ManagerModel.objects.create(name="Suplente", email="s@example.com")
+    BookingModel.objects.create(
+        room=room,
+        manager=manager,
+        name="Reunião",
+        description="Planejamento",
+        start_date=datetime(2030, 1, 7, 9, tzinfo=timezone.utc),
+        end_date=datetime(2030, 1, 7, 10, tzinfo=timezone.utc),
+        coffee_option=True,
+        coffee_quantity=6,
+        coffee_description="Sem açúcar",
+    )
+    BookingModel.objects.create(
+        room=room,
+        manager=manager,
+        name="Alinhamento",
+        start_date=datetime(2030, 1, 7, 10, 30, tzinfo=timezone.utc),
+        end_date=datetime(2030, 1, 7, 11, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.parametrize("path", LISTS)
+def test_read_model_matches_the_entity_path(data, path):
+    client = Client()
+
+    read_model = client.get(path)
+    cache.clear()
+    with override_settings(READ_MODEL_USE_CASES=[]):
+        entities = client.get(path)
+
+    assert read_model.status_code == entities.status_code == 200
+    assert len(read_model.json()) == 2
+    assert read_model.content == entities.content
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for RecurrenceRule, the expansion of recurring bookings into the
+periods of each occurrence, and the 400 for a rule that expands to none.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import django
+import pytest
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+from django.core.cache import cache
+from django.test import Client
+
+from api.domain.entities.recurrence import RecurrenceRule
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+MONDAY = datetime(2030, 1, 7, 9)
+HOUR = timedelta(hours=1)
+
+
+def starts(rule: RecurrenceRule, start: datetime = MONDAY):
+    return [period[0] for period in rule.occurrences(start, start + HOUR)]
+
+
+def test_daily_every_other_day_by_count():
+    rule = RecurrenceRule("daily", interval=2, count=3)
+
+    assert starts(rule) == [MONDAY + timedelta(days=days) for days in (0, 2, 4)]
+
+
+def test_weekly_on_weekdays_keeps_the_duration():
+    rule = RecurrenceRule("weekly", weekdays=[4, 0, 2], count=4)
+
+    periods = rule.occurrences(MONDAY, MONDAY + HOUR)
+
+    assert [start.strftime("%a %d") for start, _ in periods] == [
+        "Mon 07",
+        "Wed 09",
+        "Fri 11",
+        "Mon 14",
+    ]
+    assert all(end - start == HOUR for start, end in periods)
+
+
+def test_weekdays_before_the_start_are_skipped_in_the_first_week():
+    wednesday = MONDAY + timedelta(days=2)
+    rule = RecurrenceRule("weekly", weekdays=[0, 2], count=3)
+
+    assert starts(rule, wednesday) == [
+        wednesday,
+        MONDAY + timedelta(weeks=1),
+        wednesday + timedelta(weeks=1),
+    ]
+
+
+def test_biweekly_until_is_inclusive():
+    rule = RecurrenceRule("weekly", interval=2, until=MONDAY + timedelta(weeks=4))
+
+    assert starts(rule) == [MONDAY + timedelta(weeks=weeks) for weeks in (0, 2, 4)]
+
+
+def test_rule_without_occurrences_is_rejected():
+    rule = RecurrenceRule("weekly", weekdays=[4], until=MONDAY + timedelta(days=1))
+
+    with pytest.raises(ValueError, match="no occurrences"):
+        rule.occurrences(MONDAY, MONDAY + HOUR)
+
+
+def test_unbounded_until_is_rejected():
+    rule = RecurrenceRule("daily", until=MONDAY + timedelta(days=1000))
+
+    with pytest.raises(ValueError, match="cannot exceed"):
+        rule.occurrences(MONDAY, MONDAY + HOUR)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"frequency": "monthly", "count": 2},
+        {"frequency": "daily", "interval": 0, "count": 2},
+        {"frequency": "daily", "weekdays": [1], "count": 2},
+        {"frequency": "weekly", "weekdays": [7], "count": 2},
+        {"frequency": "daily"},
+        {"frequency": "daily", "count": 2, "until": MONDAY},
+    ],
+)
+def test_invalid_rules_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        RecurrenceRule(**kwargs).validate()
+
+
+@pytest.mark.django_db
+def test_series_without_occurrences_answers_400():
+    cache.clear()
+    location = LocationModel.objects.create(name="Sede")
+    room = RoomModel.objects.create(name="Sala", capacity=4, location=location)
+    manager = ManagerModel.objects.create(name="Gestor", email="g@example.com")
+    start = MONDAY.replace(tzinfo=timezone.utc)
+
+    response = Client().post(
+        "/api/bookings/",
+        {
+            "room": room.id,
+            "manager": manager.id,
+            "name": "Semanal",
+            "start_date": start.isoformat(),
+            "end_date": (start + HOUR).isoformat(),
+            "recurrence": {
+                "frequency": "weekly",
+                "weekdays": [4],
+                "until": (start + timedelta(days=1)).isoformat(),
+            },
+        },
+        "application/json",
+    )
+
+    assert response.status_code == 400
+    assert "no occurrences" in response.json()["error"]
+    assert not BookingModel.objects.exists()
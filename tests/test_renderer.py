@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for FastJSONRenderer: same JSON as DRF's JSONRenderer when the DTOs
+hand it native datetimes instead of isoformat() strings.
+"""
+
+import os
+import sys
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import django
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import pytest
+from django.test import override_settings
+from rest_framework.renderers import JSONRenderer
+
+from api.application.dto.location_dto import LocationOutputDTO
+from api.domain.entities.location import Location
+from api.infrastructure.renderers import FastJSONRenderer
+
+MOMENT = datetime(2030, 1, 7, 9, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+def _location():
+    return Location(
+        id="a",
+        name="Sede",
+        address=None,
+        description="Prédio principal",
+        created_at=MOMENT,
+        updated_at=MOMENT.replace(microsecond=0),
+    )
+
+
+def test_native_datetimes_render_like_isoformat_strings():
+    with override_settings(API_NATIVE_DATETIMES=False):
+        strings = LocationOutputDTO(_location()).to_dict()
+    with override_settings(API_NATIVE_DATETIMES=True):
+        native = LocationOutputDTO(_location()).to_dict()
+
+    assert isinstance(native["created_at"], datetime)
+    assert FastJSONRenderer().render(native) == JSONRenderer().render(strings)
+
+
+def test_other_values_fall_back_to_the_drf_encoder():
+    content = FastJSONRenderer().render(
+        {1: date(2030, 1, 7), "amount": Decimal("1.5"), "span": timedelta(hours=1)}
+    )
+
+    assert content == b'{"1":"2030-01-07","amount":1.5,"span":"3600.0"}'
+
+
+@pytest.mark.parametrize("width", [2, 4])
+def test_indent_is_honoured(width):
+    content = FastJSONRenderer().render(
+        {"a": [1]}, accepted_media_type=f"application/json; indent={width}"
+    )
+
+    pad = b" " * width
+    assert content == b"{\n" + pad + b'"a": [\n' + pad * 2 + b"1\n" + pad + b"]\n}"
+    assert FastJSONRenderer().render(None) == b""
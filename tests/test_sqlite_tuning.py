@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the tuned SQLite profile: PRAGMAs on new connections and
+BEGIN IMMEDIATE taking the write lock when the transaction starts
+"""
+
+import os
+import sqlite3
+import sys
+
+import django
+import pytest
+
+sys.path.append(".")
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+from django.db import connections
+from django.test import override_settings
+
+from api.infrastructure import sqlite_tuning
+from api.infrastructure.sqlite_backend.base import DatabaseWrapper
+
+
+@pytest.fixture(autouse=True)
+def _scratch_databases(django_db_blocker):
+    # These tests open their own SQLite files, not the test database
+    with django_db_blocker.unblock():
+        yield
+
+
+def _file_connection(tmp_path):
+    settings_dict = {
+        **connections["default"].settings_dict,
+        "NAME": str(tmp_path / "tuning.sqlite3"),
+    }
+    wrapper = DatabaseWrapper(settings_dict, alias="tuning")
+    wrapper.ensure_connection()
+    return wrapper
+
+
+def _pragma(wrapper, name):
+    with wrapper.cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+
+@override_settings(SQLITE_TUNING={"ENABLED": True})
+def test_pragmas_applied_to_new_connections(tmp_path):
+    wrapper = _file_connection(tmp_path)
+    try:
+        assert _pragma(wrapper, "journal_mode") == "wal"
+        assert _pragma(wrapper, "synchronous") == 1  # NORMAL
+        assert _pragma(wrapper, "busy_timeout") == 5000
+        assert _pragma(wrapper, "temp_store") == 2  # MEMORY
+        assert _pragma(wrapper, "cache_size") == -16384
+    finally:
+        wrapper.close()
+
+
+@override_settings(SQLITE_TUNING={"ENABLED": False})
+def test_disabled_profile_keeps_sqlite_defaults(tmp_path):
+    wrapper = _file_connection(tmp_path)
+    try:
+        assert _pragma(wrapper, "journal_mode") == "delete"
+    finally:
+        wrapper.close()
+
+
+@override_settings(SQLITE_TUNING={})
+def test_profile_is_off_unless_enabled(tmp_path):
+    assert sqlite_tuning.pragmas() == {}
+    wrapper = _file_connection(tmp_path)
+    try:
+        assert _pragma(wrapper, "journal_mode") == "delete"
+    finally:
+        wrapper.close()
+
+
+@pytest.mark.parametrize("immediate, locked", [(False, False), (True, True)])
+def test_begin_immediate_takes_the_write_lock(tmp_path, immediate, locked):
+    wrapper = _file_connection(tmp_path)
+    other = sqlite3.connect(tmp_path / "tuning.sqlite3", timeout=0)
+    try:
+        wrapper.begin_immediate = immediate
+        wrapper._start_transaction_under_autocommit()
+        if locked:
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                other.execute("BEGIN IMMEDIATE")
+        else:
+            other.execute("BEGIN IMMEDIATE")
+            other.rollback()
+        wrapper.connection.rollback()
+    finally:
+        other.close()
+        wrapper.close()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests for the request-scoped unit of work: write requests answering 4xx or
+raising are rolled back (booking writes included), the identity map hands
+out one instance per row and forgets soft-deleted entities.
+"""
+
+import pytest
+from django.db import connection
+from django.test import Client
+from rest_framework import viewsets
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from api.domain.entities.location import Location
+from api.infrastructure.repositories.django_booking_repository import (
+    DjangoBookingRepository,
+)
+from api.infrastructure.unit_of_work import DjangoUnitOfWork
+from api.infrastructure.viewsets.unit_of_work import UnitOfWorkMixin
+from api.models import Booking as BookingModel
+from api.models import Location as LocationModel
+from api.models import Manager as ManagerModel
+from api.models import Room as RoomModel
+
+
+class ProbeViewSet(UnitOfWorkMixin, viewsets.ViewSet):
+    """Writes a location through the unit of work, then answers as asked"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.unit_of_work = DjangoUnitOfWork()
+
+    def create(self, request):
+        location = self.unit_of_work.locations.create(
+            {"name": request.data["name"], "address": None}
+        )
+        self.unit_of_work.locations.get_by_id(location.id)
+        if request.data.get("fail"):
+            raise RuntimeError("boom")
+        return Response({"id": location.id}, status=int(request.data["status"]))
+
+
+class ImmediateProbeViewSet(UnitOfWorkMixin, viewsets.ViewSet):
+    """Reports whether the request runs inside a transaction"""
+
+    immediate_writes = True
+
+    def create(self, request):
+        return Response({"atomic": connection.in_atomic_block}, status=201)
+
+
+def post(data):
+    view = ProbeViewSet.as_view({"post": "create"})
+    return view(APIRequestFactory().post("/probe/", data, format="json"))
+
+
+@pytest.mark.django_db
+def test_error_responses_roll_the_request_back():
+    assert post({"name": "Criada", "status": 201}).status_code == 201
+    assert post({"name": "Recusada", "status": 400}).status_code == 400
+
+    assert list(LocationModel.objects.values_list("name", flat=True)) == ["Criada"]
+
+
+@pytest.mark.django_db
+def test_exceptions_roll_the_request_back():
+    with pytest.raises(RuntimeError):
+        post({"name": "Falhou", "status": 201, "fail": True})
+
+    assert not LocationModel.objects.exists()
+
+
+@pytest.mark.django_db
+def test_rollback_clears_the_identity_map():
+    unit_of_work = DjangoUnitOfWork()
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work.atomic():
+            unit_of_work.locations.create({"name": "Sede", "address": None})
+            assert len(unit_of_work.identity_map) == 1
+            raise RuntimeError("boom")
+
+    assert len(unit_of_work.identity_map) == 0
+    assert not LocationModel.objects.exists()
+
+
+@pytest.mark.django_db
+def test_identity_map_returns_one_instance_per_row():
+    location = LocationModel.objects.create(name="Sede")
+    room = RoomModel.objects.create(name="Sala", capacity=4, location=location)
+    unit_of_work = DjangoUnitOfWork()
+
+    first = unit_of_work.rooms.get_by_id(room.id)
+    second = unit_of_work.rooms.get_by_id(room.id)
+
+    assert first is second
+    assert unit_of_work.rooms.get_by_ids([room.id])[room.id] is first
+    assert DjangoUnitOfWork().rooms.get_by_id(room.id) is not first
+
+
+@pytest.mark.django_db
+def test_soft_deleted_entities_are_forgotten():
+    location = LocationModel.objects.create(name="Sede")
+    unit_of_work = DjangoUnitOfWork()
+    assert unit_of_work.locations.get_by_id(location.id) is not None
+
+    assert unit_of_work.locations.soft_delete(location.id)
+
+    assert unit_of_work.identity_map.get(Location, location.id) is None
+    assert unit_of_work.locations.get_by_id(location.id) is None
+
+
+@pytest.mark.django_db
+def test_booking_writes_roll_back_with_the_request(monkeypatch):
+    location = LocationModel.objects.create(name="Sede")
+    room = RoomModel.objects.create(name="Sala", capacity=4, location=location)
+    manager = ManagerModel.objects.create(name="Gestor", email="g@example.com")
+    create_if_available = DjangoBookingRepository.create_if_available
+
+    def create_then_fail(self, *args, **kwargs):
+        create_if_available(self, *args, **kwargs)
+        raise ValueError("Later step failed")
+
+    monkeypatch.setattr(
+        DjangoBookingRepository, "create_if_available", create_then_fail
+    )
+    response = Client().post(
+        "/api/bookings/",
+        {
+            "room": room.id,
+            "manager": manager.id,
+            "name": "Reunião",
+            "start_date": "2030-01-07T09:00:00Z",
+            "end_date": "2030-01-07T10:00:00Z",
+        },
+        "application/json",
+    )
+
+    assert response.status_code == 400
+    assert not BookingModel.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_immediate_writes_get_no_request_transaction():
+    view = ImmediateProbeViewSet.as_view({"post": "create"})
+    response = view(APIRequestFactory().post("/probe/", {}, format="json"))
+
+    assert response.data == {"atomic": False}